@@ -0,0 +1,151 @@
+"""Shared helpers for the pycaption benchmark scripts.
+
+Benchmarks are plain scripts, run from the repository root::
+
+    python -m benchmarks.bench_caption_model
+
+They are not collected by pytest and are not shipped with the package.
+"""
+
+import gc
+import inspect
+import os
+import time
+import tracemalloc
+import warnings
+
+from pycaption import (
+    DFXPReader,
+    MicroDVDReader,
+    SAMIReader,
+    SCCReader,
+    SRTReader,
+    WebVTTReader,
+)
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "examples")
+
+# tests.fixtures module name -> reader able to parse its samples
+FIXTURE_READERS = {
+    "dfxp": DFXPReader,
+    "microdvd": MicroDVDReader,
+    "sami": SAMIReader,
+    "scc": SCCReader,
+    "srt": SRTReader,
+    "webvtt": WebVTTReader,
+}
+
+
+def load_fixture_samples(module_name):
+    """Return {fixture_name: content} for the string fixtures of a module.
+
+    The fixtures in ``tests/fixtures`` are pytest fixtures; the undecorated
+    function is reached through ``__wrapped__``.
+
+    :param module_name: a module under ``tests.fixtures`` (e.g. "srt")
+    :rtype: dict[str, str]
+    """
+    module = __import__(f"tests.fixtures.{module_name}", fromlist=["_"])
+    samples = {}
+    for name, obj in vars(module).items():
+        func = getattr(obj, "__wrapped__", None)
+        if func is None or not name.startswith("sample_"):
+            continue
+        if inspect.signature(func).parameters:
+            continue
+        content = func()
+        if isinstance(content, str) and content:
+            samples[name] = content
+    return samples
+
+
+def read_fixture_caption_sets():
+    """Parse every readable fixture sample into a CaptionSet.
+
+    Samples that are deliberately invalid (they exist to test errors) are
+    skipped.
+
+    :rtype: list[CaptionSet]
+    """
+    caption_sets = []
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for module_name, reader_class in FIXTURE_READERS.items():
+            for content in load_fixture_samples(module_name).values():
+                try:
+                    caption_sets.append(reader_class().read(content))
+                except Exception:  # noqa: BLE001 - invalid samples are expected
+                    continue
+    return caption_sets
+
+
+def load_example(filename):
+    """Return the content of a file in the ``examples`` directory."""
+    with open(os.path.join(EXAMPLES_DIR, filename), encoding="utf-8") as f:
+        return f.read()
+
+
+def scale_scc(content, minutes):
+    """Repeat the caption lines of an SCC file until it lasts ``minutes``.
+
+    Each repetition is shifted past the end of the previous one; timecodes
+    are written as non-drop-frame (30 frames per second).
+
+    :rtype: str
+    """
+    entries = []
+    for line in content.splitlines()[1:]:
+        if line.strip():
+            timecode, words = line.split(None, 1)
+            hours, mins, secs, frames = (
+                int(x) for x in timecode.replace(";", ":").split(":")
+            )
+            entries.append((((hours * 60 + mins) * 60 + secs) * 30 + frames, words))
+
+    period = entries[-1][0] + 30
+    total = minutes * 60 * 30
+    lines = [content.splitlines()[0], ""]
+    offset = 0
+    while offset < total:
+        for frame, words in entries:
+            frame += offset
+            secs, frames = divmod(frame, 30)
+            mins, secs = divmod(secs, 60)
+            hours, mins = divmod(mins, 60)
+            lines.append(f"{hours:02d}:{mins:02d}:{secs:02d}:{frames:02d}\t{words}")
+            lines.append("")
+        offset += period
+    return "\n".join(lines)
+
+
+def measure(func, *args, repeat=5, **kwargs):
+    """Time ``func`` and trace its allocations.
+
+    :returns: (best wall-clock seconds, peak traced bytes, last result)
+    :rtype: tuple[float, int, object]
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak, result
+
+
+def format_bytes(size):
+    """Return a human readable byte count (e.g. "1.5 MiB")."""
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} GiB"
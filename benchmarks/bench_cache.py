@@ -0,0 +1,93 @@
+"""Converting the same content again, with and without a ConversionCache.
+
+Synthetic captions (see ``benchmarks.synthetic``) are written as DFXP and
+SCC, then converted to WebVTT and SRT by a CaptionConverter: without a
+cache, and with an in-memory and an on-disk cache already holding the
+outputs (``hit``). ``new format`` converts to SAMI content whose caption
+set is cached, so it is loaded from its snapshot instead of parsed::
+
+    python -m benchmarks.bench_cache --cues 1000 10000
+"""
+
+import argparse
+import tempfile
+import warnings
+
+from pycaption import (
+    CaptionConverter,
+    ConversionCache,
+    DFXPReader,
+    DirectoryCache,
+    MemoryCache,
+    SAMIWriter,
+    SCCReader,
+    SRTWriter,
+    WebVTTWriter,
+)
+from pycaption.cache import BaseCache
+
+from ._common import measure
+from .synthetic import VIDEO_SIZE, build_caption_set, render
+
+READERS = {"dfxp": DFXPReader, "scc": SCCReader}
+
+
+def _convert(content, reader_class, cache=None):
+    converter = CaptionConverter(cache=cache).read(content, reader_class())
+    return converter.write_all([WebVTTWriter(**VIDEO_SIZE), SRTWriter()])
+
+
+class _ReadOnlyCache(BaseCache):
+    """Looks values up in another backend, but stores nothing, so that the
+    SAMI output is written again on every run."""
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def get(self, key):
+        return self.backend.get(key)
+
+
+def _convert_to_new_format(content, reader_class, cache):
+    return cache.convert(content, reader_class(), SAMIWriter(**VIDEO_SIZE))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cues", type=int, nargs="+", default=[10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    warnings.simplefilter("ignore")
+    for cues in args.cues:
+        source_set = build_caption_set(cues)
+        for format_name, reader_class in READERS.items():
+            content = render(source_set, format_name)
+            print(f"{format_name}, {cues} captions")
+            best, _, _ = measure(_convert, content, reader_class, repeat=args.repeat)
+            print(f"{'no cache':>22}: {best * 1000:9.2f} ms")
+
+            with tempfile.TemporaryDirectory() as cache_dir:
+                for name, backend in (
+                    ("memory", MemoryCache()),
+                    ("directory", DirectoryCache(cache_dir)),
+                ):
+                    cache = ConversionCache(backend)
+                    _convert(content, reader_class, cache)
+                    best, _, _ = measure(
+                        _convert, content, reader_class, cache, repeat=args.repeat
+                    )
+                    print(f"{name + ' hit':>22}: {best * 1000:9.2f} ms")
+                    best, _, _ = measure(
+                        _convert_to_new_format,
+                        content,
+                        reader_class,
+                        ConversionCache(_ReadOnlyCache(backend)),
+                        repeat=args.repeat,
+                    )
+                    print(f"{name + ' new format':>22}: {best * 1000:9.2f} ms")
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Memory and construction time of the Caption/CaptionNode representation.
+
+Every caption and node found in ``tests/fixtures`` is rebuilt until the
+requested node count is reached, once with the slotted classes from
+``pycaption.base`` and once with dict-backed subclasses, which is how those
+classes were stored before they gained ``__slots__``::
+
+    python -m benchmarks.bench_caption_model --nodes 200000
+"""
+
+import argparse
+
+from pycaption.base import Caption, CaptionNode
+
+from ._common import format_bytes, measure, read_fixture_caption_sets
+
+
+class _DictCaptionNode(CaptionNode):
+    """CaptionNode with a per-instance __dict__ (no __slots__)."""
+
+
+class _DictCaption(Caption):
+    """Caption with a per-instance __dict__ (no __slots__)."""
+
+
+def _collect_templates():
+    """Return the (caption, nodes) pairs found in the fixture samples."""
+    templates = []
+    for caption_set in read_fixture_caption_sets():
+        for lang in caption_set.get_languages():
+            for caption in caption_set.get_captions(lang):
+                templates.append(caption)
+    return templates
+
+
+def _build(templates, node_count, caption_class, node_class):
+    """Rebuild the template captions until node_count nodes were created."""
+    captions = []
+    created = 0
+    while created < node_count:
+        for template in templates:
+            nodes = [
+                node_class(
+                    node.type_,
+                    layout_info=node.layout_info,
+                    content=node.content,
+                    start=node.start,
+                    position=node.position,
+                )
+                for node in template.nodes
+            ]
+            captions.append(
+                caption_class(
+                    template.start,
+                    template.end,
+                    nodes,
+                    template.style,
+                    template.layout_info,
+                )
+            )
+            created += len(nodes)
+            if created >= node_count:
+                break
+    return captions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    templates = [caption for caption in _collect_templates() if caption.nodes]
+    print(f"{len(templates)} fixture captions, building {args.nodes} nodes\n")
+
+    results = {}
+    for label, caption_class, node_class in (
+        ("dict-backed", _DictCaption, _DictCaptionNode),
+        ("slotted", Caption, CaptionNode),
+    ):
+        seconds, peak, _ = measure(
+            _build,
+            templates,
+            args.nodes,
+            caption_class,
+            node_class,
+            repeat=args.repeat,
+        )
+        results[label] = (seconds, peak)
+        print(f"{label:>12}: {seconds * 1000:8.1f} ms  peak {format_bytes(peak)}")
+
+    dict_seconds, dict_peak = results["dict-backed"]
+    slot_seconds, slot_peak = results["slotted"]
+    print(
+        f"\nslotted: {slot_peak / dict_peak:.0%} of the memory, "
+        f"{slot_seconds / dict_seconds:.0%} of the construction time"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""One CaptionSet to several formats: a write per writer vs. write_all.
+
+A caption set grown from the positioned DFXP fixture is written to DFXP
+(both serializers), SAMI, WebVTT and SRT one writer at a time, then with
+``CaptionConverter.write_all`` in sequence and in threads::
+
+    python -m benchmarks.bench_converter_fanout --captions 20000
+"""
+
+import argparse
+
+from pycaption import (
+    CaptionConverter,
+    DFXPWriter,
+    SAMIWriter,
+    SRTWriter,
+    WebVTTWriter,
+)
+
+from ._common import format_bytes, measure
+from .bench_writer_copy import _build_caption_set
+
+_VIDEO_SIZE = {"video_width": 640, "video_height": 360}
+
+
+def _writers():
+    return [
+        DFXPWriter(**_VIDEO_SIZE),
+        DFXPWriter(serializer="text", **_VIDEO_SIZE),
+        SAMIWriter(**_VIDEO_SIZE),
+        WebVTTWriter(**_VIDEO_SIZE),
+        SRTWriter(),
+    ]
+
+
+def _write_each(converter):
+    return [converter.write(writer) for writer in _writers()]
+
+
+def _write_all(converter, threads=False):
+    return converter.write_all(_writers(), threads=threads)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--captions", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    converter = CaptionConverter(_build_caption_set(args.captions))
+    print(f"{args.captions} captions\n")
+
+    expected = None
+    for label, func, kwargs in (
+        ("each writer", _write_each, {}),
+        ("write_all", _write_all, {}),
+        ("write_all threads", _write_all, {"threads": True}),
+    ):
+        seconds, peak, outputs = measure(func, converter, repeat=args.repeat, **kwargs)
+        if expected is None:
+            expected = outputs
+        assert outputs == expected, f"{label} output differs"
+        print(f"{label:>18}: {seconds * 1000:8.1f} ms {format_bytes(peak):>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""detect_format on large files: every reader's detect() vs. sniff_format.
+
+Each example file is repeated until it is about the requested size and
+detected with the previous loop over the readers' ``detect()`` methods and
+with the current bounded ``sniff_format`` one::
+
+    python -m benchmarks.bench_detect_format --megabytes 20
+"""
+
+import argparse
+
+from pycaption import SUPPORTED_READERS, detect_format
+
+from ._common import format_bytes, load_example, measure
+from .bench_dfxp_reader import _build_document
+
+
+def _legacy_detect_format(caps):
+    """detect_format as it was: each reader's detect() on the whole content."""
+    for reader in SUPPORTED_READERS:
+        if reader().detect(caps):
+            return reader
+    return None
+
+
+def _scale(content, size):
+    return content * max(1, size // len(content))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    size = args.megabytes * 1024 * 1024
+
+    samples = [
+        (filename, _scale(load_example(filename), size))
+        for filename in ("example.srt", "example.vtt", "example.sami", "example.scc")
+    ]
+    document = _build_document(1000)
+    samples.append(("dfxp", _build_document(1000 * size // len(document))))
+
+    for label, content in samples:
+        print(f"{label}: {format_bytes(len(content))}")
+        for name, func in (
+            ("legacy", _legacy_detect_format),
+            ("detect_format", detect_format),
+        ):
+            seconds, peak, reader = measure(func, content, repeat=args.repeat)
+            print(
+                f"{name:>15}: {seconds * 1000:8.2f} ms {format_bytes(peak):>12}"
+                f"  {reader.__name__ if reader else None}"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
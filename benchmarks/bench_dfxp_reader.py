@@ -0,0 +1,102 @@
+"""DFXP reading: BeautifulSoup based DFXPReader vs. StreamingDFXPReader.
+
+A synthetic TTML document with the requested number of positioned and
+styled paragraphs is read from a string by both readers, and from a file by
+the streaming one::
+
+    python -m benchmarks.bench_dfxp_reader --captions 20000
+"""
+
+import argparse
+import os
+import tempfile
+import warnings
+
+from pycaption import DFXPReader
+from pycaption.dfxp import StreamingDFXPReader
+
+from ._common import format_bytes, measure
+
+_HEAD = """<?xml version="1.0" encoding="utf-8"?>
+<tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml"
+    xmlns:tts="http://www.w3.org/ns/ttml#styling">
+ <head>
+  <styling>
+   <style xml:id="p" tts:color="#ffeedd" tts:fontFamily="Arial"
+          tts:fontSize="10pt" tts:textAlign="center"/>
+  </styling>
+  <layout>
+   <region xml:id="bottom" tts:origin="10% 80%" tts:extent="80% 10%"
+           tts:displayAlign="after" tts:textAlign="center"/>
+   <region xml:id="top" tts:origin="10% 10%" tts:extent="80% 10%"
+           tts:displayAlign="before" tts:textAlign="center"/>
+  </layout>
+ </head>
+ <body>
+  <div xml:lang="en-US">
+"""
+
+_TAIL = """  </div>
+ </body>
+</tt>
+"""
+
+
+def _timestamp(milliseconds):
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+
+
+def _build_document(caption_count):
+    paragraphs = []
+    for index in range(caption_count):
+        start = index * 2000
+        region = "top" if index % 5 == 0 else "bottom"
+        paragraphs.append(
+            f'   <p begin="{_timestamp(start)}" end="{_timestamp(start + 1800)}"'
+            f' region="{region}" style="p">\n'
+            f"    Caption number {index + 1}<br/>\n"
+            f'    <span tts:fontStyle="italic">with a second line</span>\n'
+            "   </p>\n"
+        )
+    return _HEAD + "".join(paragraphs) + _TAIL
+
+
+def _read_file(path):
+    with open(path, encoding="utf-8") as ttml_file:
+        return StreamingDFXPReader().read_stream(ttml_file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--captions", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    content = _build_document(args.captions)
+    print(f"{args.captions} captions, {format_bytes(len(content.encode()))}\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "captions.ttml")
+        with open(path, "w", encoding="utf-8") as ttml_file:
+            ttml_file.write(content)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for label, func, func_arg in (
+                ("DFXPReader", DFXPReader().read, content),
+                ("streaming", StreamingDFXPReader().read, content),
+                ("recover", StreamingDFXPReader(recover=True).read, content),
+                ("from file", _read_file, path),
+            ):
+                seconds, peak, _ = measure(func, func_arg, repeat=args.repeat)
+                print(
+                    f"{label:>10}: {seconds * 1000:8.1f} ms  "
+                    f"peak {format_bytes(peak)}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""DFXP writing: BeautifulSoup tree vs. direct text serialization.
+
+Writes a caption set grown from the positioned DFXP fixture with each
+DFXPWriter serializer::
+
+    python -m benchmarks.bench_dfxp_writer --captions 20000
+"""
+
+import argparse
+
+from pycaption import DFXPWriter
+
+from ._common import format_bytes, measure
+from .bench_writer_copy import _build_caption_set
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--captions", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    caption_set = _build_caption_set(args.captions)
+    print(f"{args.captions} captions\n")
+
+    for label, options in (
+        ("tree", {}),
+        ("text", {"serializer": "text"}),
+        ("text compact", {"serializer": "text", "pretty_print": False}),
+    ):
+        writer = DFXPWriter(video_width=640, video_height=360, **options)
+        seconds, peak, _ = measure(writer.write, caption_set, repeat=args.repeat)
+        print(f"{label:>12}: {seconds * 1000:8.1f} ms  peak {format_bytes(peak)}")
+
+
+if __name__ == "__main__":
+    main()
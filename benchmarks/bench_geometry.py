@@ -0,0 +1,94 @@
+"""Geometry objects, memory and time of reading positioned captions.
+
+Synthetic positioned captions are written as SCC and DFXP, then read
+back. For each format the script prints the read time and peak memory, the
+memory the CaptionSet keeps, and how many layouts it references against the
+number of distinct geometry objects; the DFXP and WebVTT writers, which
+group captions by layout, are timed on the result::
+
+    python -m benchmarks.bench_geometry --cues 20000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+import warnings
+
+from pycaption import DFXPReader, DFXPWriter, SCCReader, WebVTTWriter
+from pycaption.geometry import Alignment, Layout, Padding, Point, Size, Stretch
+
+from ._common import format_bytes, measure
+from .synthetic import VIDEO_SIZE, build_caption_set, render
+
+_GEOMETRY = (Alignment, Layout, Padding, Point, Size, Stretch)
+
+
+def _geometry_objects(caption_set):
+    """Return (layouts referenced, distinct geometry objects) of caption_set."""
+    layouts = [caption_set.layout_info]
+    for lang in caption_set.get_languages():
+        captions = caption_set.get_captions(lang)
+        layouts.append(captions.layout_info)
+        for caption in captions:
+            layouts.append(caption.layout_info)
+            layouts.extend(node.layout_info for node in caption.nodes)
+    layouts = [layout for layout in layouts if layout is not None]
+
+    seen = {}
+    stack = list(layouts)
+    while stack:
+        obj = stack.pop()
+        if not isinstance(obj, _GEOMETRY) or id(obj) in seen:
+            continue
+        seen[id(obj)] = obj
+        # Before geometry objects were interned, they had a __dict__
+        fields = getattr(obj, "_fields", None) or vars(obj)
+        stack.extend(getattr(obj, name) for name in fields)
+    return len(layouts), len(seen)
+
+
+def _retained(reader_class, content):
+    """Memory still allocated once the CaptionSet is read."""
+    gc.collect()
+    tracemalloc.start()
+    caption_set = reader_class().read(content)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return retained, caption_set
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cues", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    caption_set = build_caption_set(args.cues)
+    print(f"{args.cues} positioned captions\n")
+    for name, reader_class in (("scc", SCCReader), ("dfxp", DFXPReader)):
+        content = render(caption_set, name)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            seconds, peak, _ = measure(
+                lambda c: reader_class().read(c), content, repeat=args.repeat
+            )
+            retained, read_set = _retained(reader_class, content)
+        references, distinct = _geometry_objects(read_set)
+        print(
+            f"{name:>5} read: {seconds * 1000:8.1f} ms, peak {format_bytes(peak)}, "
+            f"kept {format_bytes(retained)}; "
+            f"{references} layouts, {distinct} geometry objects"
+        )
+        for writer in (DFXPWriter(**VIDEO_SIZE), WebVTTWriter(**VIDEO_SIZE)):
+            start = time.perf_counter()
+            writer.write(read_set)
+            print(
+                f"{'':>5} {type(writer).__name__}: "
+                f"{(time.perf_counter() - start) * 1000:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Time of importing pycaption, with and without the heavy format backends.
+
+Each statement is run in a new interpreter, which reports how long it
+took and which of BeautifulSoup, lxml, cssutils and NumPy it imported.
+The last statement loads every backend, as ``import pycaption`` did before
+they were imported lazily::
+
+    python -m benchmarks.bench_import --repeat 20
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ("bs4", "lxml", "cssutils", "numpy")
+
+STATEMENTS = (
+    "import pycaption",
+    "from pycaption import SRTReader",
+    "from pycaption import WebVTTWriter",
+    "from pycaption import SCCReader, detect_format",
+    "from pycaption import DFXPReader",
+    "from pycaption import SAMIWriter",
+    "import pycaption; pycaption.SUPPORTED_READERS; pycaption.CaptionTimings",
+)
+
+_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - started
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps([elapsed, heavy]))
+"""
+
+
+def time_import(statement):
+    """Run statement in a new interpreter.
+
+    :returns: its duration in seconds, and the heavy modules it imported
+    :rtype: tuple[float, list[str]]
+    """
+    script = _SCRIPT.format(statement=statement, heavy=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    ).stdout
+    elapsed, heavy = json.loads(output)
+    return elapsed, heavy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    # Compiles the bytecode, so the first run is not slower than the others
+    time_import(STATEMENTS[-1])
+    for statement in STATEMENTS:
+        runs = [time_import(statement) for _ in range(args.repeat)]
+        best = min(elapsed for elapsed, _ in runs)
+        heavy = ", ".join(runs[0][1]) or "-"
+        print(f"{best * 1000:7.1f} ms  {statement}")
+        print(f"{'':12}imports {heavy}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Time and peak memory of SAMIParser on growing documents.
+
+Synthetic two-language SAMI documents are parsed whole with ``feed`` and
+line by line with ``feed_chunk``; the time per caption should stay flat as
+the documents grow::
+
+    python -m benchmarks.bench_sami_parser --cues 1000 10000 50000
+"""
+
+import argparse
+
+from pycaption.sami.parser import SAMIParser
+
+from ._common import format_bytes, measure
+from .synthetic import build_caption_set, render
+
+
+def _feed(content):
+    return SAMIParser().feed(content)
+
+
+def _feed_lines(content):
+    parser = SAMIParser()
+    for line in content.splitlines(keepends=True):
+        parser.feed_chunk(line)
+    return parser.finish()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cues", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    # Rendering SAMI is slow, so one document is built and repeated
+    sample = render(build_caption_set(1000, languages=("en-US", "fr-FR")), "sami")
+    head, _, body = sample.partition("<body>")
+    body, _, tail = body.rpartition("</body>")
+
+    for cues in args.cues:
+        content = head + "<body>" + body * (cues // 1000 or 1) + "</body>" + tail
+        print(f"{cues} cues, {len(content)} characters")
+        expected = None
+        for label, func in (("feed", _feed), ("feed_chunk", _feed_lines)):
+            seconds, peak, result = measure(func, content, repeat=args.repeat)
+            if expected is None:
+                expected = result
+            assert result == expected, f"{label} result differs"
+            print(
+                f"{label:>12}: {seconds * 1000:8.1f} ms "
+                f"{seconds * 1e6 / cues:6.1f} us/cue {format_bytes(peak):>12}"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Time and peak memory of SAMIReader vs. the single-pass StreamingSAMIReader.
+
+A synthetic SAMI document with the requested number of captions in every
+language is read by both readers, which must return the same captions::
+
+    python -m benchmarks.bench_sami_reader --cues 10000 --languages 4
+"""
+
+import argparse
+import warnings
+
+from pycaption import SAMIReader, StreamingSAMIReader
+
+from ._common import format_bytes, measure
+from .synthetic import build_caption_set, render
+
+
+def _read(reader_class, content):
+    caption_set = reader_class().read(content)
+    return {
+        lang: [caption.get_text() for caption in caption_set.get_captions(lang)]
+        for lang in caption_set.get_languages()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cues", type=int, default=5000)
+    parser.add_argument("--languages", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    # Rendering SAMI is slow, so one document is built and repeated
+    languages = [f"l{index}" for index in range(args.languages)]
+    sample = render(build_caption_set(1000, languages=languages), "sami")
+    head, _, body = sample.partition("<body>")
+    body, _, tail = body.rpartition("</body>")
+    content = head + "<body>" + body * (args.cues // 1000 or 1) + "</body>" + tail
+    print(f"{args.cues} cues x {args.languages} languages, {len(content)} characters\n")
+
+    expected = None
+    for reader_class in (SAMIReader, StreamingSAMIReader):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            seconds, peak, result = measure(
+                _read, reader_class, content, repeat=args.repeat
+            )
+        if expected is None:
+            expected = result
+        assert result == expected, f"{reader_class.__name__} captions differ"
+        print(
+            f"{reader_class.__name__:>20}: {seconds * 1000:8.1f} ms "
+            f"{format_bytes(peak):>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Decoding SCC content live, line by line, vs. reading the whole file.
+
+Synthetic captions (see ``benchmarks.synthetic``) are written as SCC, then
+read by SCCReader and fed line by line to a LiveSCCDecoder, without and
+with a latency. The captions returned by the decoder are counted and
+dropped, as a live channel would publish them, so its peak memory should
+not grow with the number of captions::
+
+    python -m benchmarks.bench_scc_live --cues 1000 10000
+"""
+
+import argparse
+import warnings
+
+from pycaption import LiveSCCDecoder, SCCReader
+
+from ._common import format_bytes, measure
+from .synthetic import build_caption_set, render
+
+
+def _lines(content):
+    """Yield the lines of content without holding them all in memory."""
+    start = 0
+    while start < len(content):
+        end = content.find("\n", start)
+        if end == -1:
+            end = len(content)
+        yield content[start:end]
+        start = end + 1
+
+
+def _read(content):
+    return len(SCCReader().read(content).get_captions("en-US"))
+
+
+def _decode(content, latency):
+    decoder = LiveSCCDecoder(latency=latency)
+    count = 0
+    for line in _lines(content):
+        count += len(decoder.feed_line(line))
+    return count + len(decoder.close())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cues", type=int, nargs="+", default=[10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    warnings.simplefilter("ignore")
+    for cues in args.cues:
+        content = render(build_caption_set(cues), "scc")
+        print(f"scc, {cues} captions")
+        for label, func, func_args in (
+            ("SCCReader", _read, ()),
+            ("live", _decode, (None,)),
+            ("live, 4 s latency", _decode, (LiveSCCDecoder.LATENCY,)),
+        ):
+            best, peak, count = measure(func, content, *func_args, repeat=args.repeat)
+            print(
+                f"{label:>18}: {best * 1000:9.2f} ms  peak {format_bytes(peak):>10}"
+                f"  {count} captions"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""SCC reader throughput on a feature-length file.
+
+``examples/example.scc`` is repeated until it covers the requested duration,
+then tokenized with the previous per-line regex code and with the current
+tokenizer, and finally read end to end::
+
+    python -m benchmarks.bench_scc_reader --minutes 120
+"""
+
+import argparse
+import re
+
+from pycaption import SCCReader
+from pycaption.scc.reader import _LINE_RE, _tokenize_words
+
+from ._common import format_bytes, load_example, measure, scale_scc
+
+
+def _legacy_tokenize(lines):
+    """Tokenization as SCCReader._translate_line used to do it."""
+    tokens = []
+    for line in lines:
+        if line.strip() == "":
+            continue
+        r = re.compile(r"([0-9:;]*)([\s\t]*)((.)*)")
+        parts = r.findall(line.lower())
+        word_list = parts[0][2].split(" ")
+        for idx, word in enumerate(word_list):
+            word = word.strip()
+            if len(word) == 4:
+                next_idx = idx + 1
+                if next_idx < len(word_list) and word_list[next_idx].strip() == word:
+                    next_idx += 1
+                next_command = (
+                    word_list[next_idx] if next_idx < len(word_list) else None
+                )
+                tokens.append((parts[0][0], word, next_command))
+    return tokens
+
+
+def _tokenize(lines):
+    """Tokenization as SCCReader._translate_line does it now (cold cache)."""
+    _tokenize_words.cache_clear()
+    tokens = []
+    for line in lines:
+        if line.strip() == "":
+            continue
+        timecode, words = _LINE_RE.match(line.lower()).groups()
+        for word, next_command in _tokenize_words(words):
+            tokens.append((timecode, word, next_command))
+    return tokens
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    content = scale_scc(load_example("example.scc"), args.minutes)
+    lines = content.splitlines()[1:]
+    print(f"{args.minutes} minutes, {len(lines)} lines\n")
+
+    legacy_seconds, _, legacy_tokens = measure(
+        _legacy_tokenize, lines, repeat=args.repeat
+    )
+    seconds, _, tokens = measure(_tokenize, lines, repeat=args.repeat)
+    assert tokens == legacy_tokens
+    print(f"legacy tokenizer: {legacy_seconds * 1000:8.1f} ms")
+    print(f"       tokenizer: {seconds * 1000:8.1f} ms\n")
+
+    seconds, peak, _ = measure(lambda: SCCReader().read(content), repeat=args.repeat)
+    print(f"SCCReader.read:   {seconds * 1000:8.1f} ms  peak {format_bytes(peak)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""translate_scc on a long SCC file.
+
+``examples/example.scc`` is repeated until it covers the requested duration
+and translated with the previous replace-per-unique-word implementation and
+with the current single pass one::
+
+    python -m benchmarks.bench_scc_translator --minutes 120
+"""
+
+import argparse
+
+from pycaption.scc.constants import ALL_CHARACTERS, COMMAND_LABELS
+from pycaption.scc.translator import translate_scc
+
+from ._common import load_example, measure, scale_scc
+
+
+def _legacy_translate_scc(scc_content, brackets="[]"):
+    """translate_scc as it was: one str.replace over the file per word."""
+    opening_bracket, closing_bracket = brackets if brackets else ("", "")
+    for elem in set(scc_content.split()):
+        name = COMMAND_LABELS.get(elem, ALL_CHARACTERS.get(elem))
+        if not name:
+            char1 = ALL_CHARACTERS.get(elem[:2])
+            char2 = ALL_CHARACTERS.get(elem[2:])
+            if char1 is not None and char2 is not None:
+                name = f"{char1}{char2}"
+        if name:
+            scc_content = scc_content.replace(
+                elem, f"{opening_bracket}{name}{closing_bracket}"
+            )
+    return scc_content
+
+
+def _random_text_scc(minutes):
+    """An SCC file whose captions use many distinct character pairs."""
+    printable = [code for code, char in ALL_CHARACTERS.items() if len(code) == 2]
+    lines = ["Scenarist_SCC V1.0", ""]
+    for index in range(minutes * 20):
+        secs, frames = divmod(index * 90, 30)
+        mins, secs = divmod(secs, 60)
+        hours, mins = divmod(mins, 60)
+        words = " ".join(
+            printable[(index * 7 + n) % len(printable)]
+            + printable[(index * 13 + n * 3) % len(printable)]
+            for n in range(24)
+        )
+        lines.append(
+            f"{hours:02d}:{mins:02d}:{secs:02d}:{frames:02d}\t9420 9420 {words} "
+            "942f 942f"
+        )
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    for label, content in (
+        ("example.scc", scale_scc(load_example("example.scc"), args.minutes)),
+        ("varied text", _random_text_scc(args.minutes)),
+    ):
+        words = content.split()
+        print(f"{label}: {len(words)} words, {len(set(words))} distinct")
+        for name, func in (
+            ("legacy", _legacy_translate_scc),
+            ("translate_scc", translate_scc),
+        ):
+            seconds, _, _ = measure(func, content, repeat=args.repeat)
+            print(f"{name:>15}: {seconds * 1000:8.1f} ms")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Loading a caption set from its snapshot vs. parsing it or unpickling it.
+
+Synthetic captions (see ``benchmarks.synthetic``) are written as DFXP and
+SCC, then read back. The parsed caption set is then stored as a pickle
+and as a snapshot, and loaded from both. ``open 1`` opens the snapshot
+and reads a single caption::
+
+    python -m benchmarks.bench_snapshot --cues 1000 10000
+"""
+
+import argparse
+import pickle
+import warnings
+
+from pycaption import DFXPReader, SCCReader
+from pycaption.snapshot import CaptionSetSnapshot, dump_snapshot, load_snapshot
+
+from ._common import format_bytes, measure
+from .synthetic import build_caption_set, render
+
+READERS = {"dfxp": DFXPReader, "scc": SCCReader}
+
+
+def _read(reader_class, content):
+    return reader_class().read(content)
+
+
+def _get_one_caption(data):
+    with CaptionSetSnapshot(data) as snapshot:
+        lang = snapshot.get_languages()[0]
+        return snapshot.get_caption(lang, snapshot.caption_count(lang) // 2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cues", type=int, nargs="+", default=[10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    for cues in args.cues:
+        source_set = build_caption_set(cues)
+        for format_name, reader_class in READERS.items():
+            content = render(source_set, format_name)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                parsed, _, caption_set = measure(
+                    _read, reader_class, content, repeat=args.repeat
+                )
+            pickled = pickle.dumps(caption_set, pickle.HIGHEST_PROTOCOL)
+            snapshot = dump_snapshot(caption_set)
+
+            print(f"{format_name}, {cues} captions")
+            for label, size, func, data in (
+                ("parse", len(content.encode()), None, None),
+                ("pickle", len(pickled), pickle.loads, pickled),
+                ("snapshot", len(snapshot), load_snapshot, snapshot),
+                ("open 1", len(snapshot), _get_one_caption, snapshot),
+            ):
+                if func is None:
+                    best, peak = parsed, None
+                else:
+                    best, peak, _ = measure(func, data, repeat=args.repeat)
+                peak = "" if peak is None else f"peak {format_bytes(peak):>10}"
+                print(
+                    f"{label:>10}: {best * 1000:9.2f} ms"
+                    f"  {format_bytes(size):>10}  {peak}"
+                )
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Peak memory of SRT conversion: whole-file read/write vs. streaming.
+
+A synthetic SRT file with the requested number of cues is written to a
+temporary directory and converted SRT -> SRT both ways::
+
+    python -m benchmarks.bench_srt_stream --cues 200000
+"""
+
+import argparse
+import os
+import tempfile
+
+from pycaption import SRTReader, SRTWriter
+
+from ._common import format_bytes, measure
+
+
+def _write_sample(path, cue_count):
+    """Write cue_count two-line cues, one second apart, to path."""
+    with open(path, "w", encoding="utf-8") as srt_file:
+        for index in range(cue_count):
+            start = index * 1000
+            end = start + 900
+            srt_file.write(
+                f"{index + 1}\n"
+                f"{_timestamp(start)} --> {_timestamp(end)}\n"
+                f"Caption number {index + 1}\n"
+                "with a second line\n\n"
+            )
+
+
+def _timestamp(milliseconds):
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+
+
+def _convert_whole(source, target):
+    with open(source, encoding="utf-8") as src:
+        caption_set = SRTReader().read(src.read())
+    with open(target, "w", encoding="utf-8") as dst:
+        dst.write(SRTWriter().write(caption_set))
+
+
+def _convert_stream(source, target):
+    with open(source, encoding="utf-8") as src:
+        with open(target, "w", encoding="utf-8") as dst:
+            SRTWriter().write_stream(SRTReader().iter_captions(src), dst)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cues", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "in.srt")
+        _write_sample(source, args.cues)
+        print(f"{args.cues} cues, {format_bytes(os.path.getsize(source))}\n")
+
+        for label, func in (
+            ("whole file", _convert_whole),
+            ("stream", _convert_stream),
+        ):
+            target = os.path.join(tmp, f"{label}.srt")
+            seconds, peak, _ = measure(func, source, target, repeat=args.repeat)
+            print(f"{label:>10}: {seconds * 1000:8.1f} ms  peak {format_bytes(peak)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Time of bulk timing changes with CaptionTimings vs. a loop over captions.
+
+A 23.976 → 25 fps conversion with an offset (what
+``CaptionSet.adjust_caption_timing`` does) is applied to synthetic
+captions, by a loop replacing every caption with a copy at its new times
+and by CaptionTimings with and without NumPy. The full pipeline adds clipping,
+overlap clamping and frame snapping::
+
+    python -m benchmarks.bench_timing --cues 100000 1000000
+"""
+
+import argparse
+import gc
+import time
+from fractions import Fraction
+
+from pycaption import timing
+from pycaption.base import Caption, CaptionList, CaptionNode
+from pycaption.timing import CaptionTimings
+
+RATE = Fraction(24000, 25025)
+OFFSET = -2_000_000
+
+
+def _build(cues):
+    node = [CaptionNode.create_text("caption")]
+    return CaptionList(
+        [Caption(i * 3_000_000, i * 3_000_000 + 2_500_000, node) for i in range(cues)]
+    )
+
+
+def _loop(captions):
+    kept = CaptionList(layout_info=captions.layout_info)
+    rate = float(RATE)
+    for caption in captions:
+        start = round(caption.start * rate) + OFFSET
+        if start >= 0:
+            end = round(caption.end * rate) + OFFSET
+            kept.append(caption.copy(start=start, end=end))
+    captions[:] = kept
+    return captions
+
+
+def _adjust(captions, use_numpy):
+    return (
+        CaptionTimings(captions, use_numpy)
+        .skew(RATE)
+        .shift(OFFSET)
+        .remove_before(0)
+        .apply()
+    )
+
+
+def _pipeline(captions, use_numpy):
+    return (
+        CaptionTimings(captions, use_numpy)
+        .skew(RATE)
+        .shift(OFFSET)
+        .clip(start=0)
+        .clamp_overlaps()
+        .snap_to_frames(25)
+        .apply()
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cues", type=int, nargs="+", default=[100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    backends = [("array", False)]
+    if timing.numpy is not None:
+        backends.append(("numpy", True))
+
+    for cues in args.cues:
+        print(f"{cues} captions")
+        cases = [("loop", _loop, ())]
+        for name, use_numpy in backends:
+            cases.append((f"adjust {name}", _adjust, (use_numpy,)))
+        for name, use_numpy in backends:
+            cases.append((f"pipeline {name}", _pipeline, (use_numpy,)))
+        for label, func, extra in cases:
+            best = float("inf")
+            for _ in range(args.repeat):
+                # Every run changes the captions, so each one gets new ones
+                captions = _build(cues)
+                gc.collect()
+                started = time.perf_counter()
+                func(captions, *extra)
+                best = min(best, time.perf_counter() - started)
+            print(f"{label:>16}: {best * 1000:8.1f} ms")
+        print()
+
+
+if __name__ == "__main__":
+    main()
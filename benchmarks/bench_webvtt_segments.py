@@ -0,0 +1,74 @@
+"""Splitting WebVTT into HLS segments: re-splitting the written file vs.
+SegmentedWebVTTWriter.
+
+Synthetic captions (see ``benchmarks.synthetic``) are split into 6 second
+segments. ``re-split`` writes a single WebVTT file, then looks up the cues
+of every segment in it, which takes quadratic time; ``segmented`` converts
+each caption once, in a single pass::
+
+    python -m benchmarks.bench_webvtt_segments --cues 1000 10000
+"""
+
+import argparse
+import warnings
+
+from pycaption import SegmentedWebVTTWriter, WebVTTWriter
+from pycaption.webvtt.constants import microseconds
+
+from ._common import measure
+from .synthetic import VIDEO_SIZE, build_caption_set
+
+SEGMENT_DURATION = 6 * 1000000
+
+
+def _time(timestamp):
+    hours, minutes, seconds = timestamp.split(":")
+    return microseconds(hours, minutes, *seconds.split("."))
+
+
+def _resplit(caption_set):
+    content = WebVTTWriter(**VIDEO_SIZE).write(caption_set)
+    blocks = content.split("\n\n")
+    header = blocks[0] + "\n\n"
+    cues = []
+    for block in blocks[1:]:
+        start, _, end = block.split("\n", 1)[0].split()[:3]
+        cues.append((_time(start), _time(end), block))
+    duration = max(end for _, end, _ in cues)
+    segments = []
+    for start in range(0, duration, SEGMENT_DURATION):
+        end = start + SEGMENT_DURATION
+        segments.append(
+            header
+            + "\n\n".join(
+                block
+                for cue_start, cue_end, block in cues
+                if cue_start < end and cue_end > start
+            )
+        )
+    return segments
+
+
+def _segment(caption_set):
+    writer = SegmentedWebVTTWriter(**VIDEO_SIZE)
+    return [segment.content for segment in writer.write_segments(caption_set)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cues", type=int, nargs="+", default=[10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    warnings.simplefilter("ignore")
+    for cues in args.cues:
+        caption_set = build_caption_set(cues)
+        print(f"webvtt, {cues} captions")
+        for label, func in (("re-split", _resplit), ("segmented", _segment)):
+            best, _, segments = measure(func, caption_set, repeat=args.repeat)
+            print(f"{label:>10}: {best * 1000:9.2f} ms  {len(segments)} segments")
+        print()
+
+
+if __name__ == "__main__":
+    main()
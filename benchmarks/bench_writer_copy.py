@@ -0,0 +1,98 @@
+"""Cost of isolating the caller's CaptionSet before writing.
+
+Writers used to start with ``deepcopy(caption_set)``; they now work on a
+copy-on-write ``CaptionSet.copy()``, relativizing only the captions they
+write. This compares both copies and the full writers on a caption set grown
+from the positioned DFXP fixture::
+
+    python -m benchmarks.bench_writer_copy --captions 20000
+"""
+
+import argparse
+import warnings
+from copy import deepcopy
+
+from pycaption import DFXPReader, DFXPWriter, SAMIWriter, WebVTTWriter
+from pycaption.base import BaseWriter, CaptionList, CaptionSet
+
+from ._common import format_bytes, load_fixture_samples, measure
+
+
+def _build_caption_set(caption_count):
+    """Repeat the positioned DFXP fixture until caption_count captions exist."""
+    sample = load_fixture_samples("dfxp")["sample_dfxp_with_positioning"]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        template = DFXPReader().read(sample)
+    lang = template.get_languages()[0]
+    source = template.get_captions(lang)
+    span = max(caption.end for caption in source)
+
+    captions = CaptionList(layout_info=source.layout_info)
+    offset = 0
+    while len(captions) < caption_count:
+        for caption in source:
+            captions.append(
+                caption.copy(
+                    start=caption.start + offset,
+                    end=caption.end + offset,
+                    nodes=[node.copy() for node in caption.nodes],
+                )
+            )
+        offset += span
+    return CaptionSet(
+        {lang: captions[:caption_count]},
+        styles=dict(template.get_styles()),
+        layout_info=template.layout_info,
+    )
+
+
+def _deepcopy_and_relativize(writer, caption_set):
+    """The isolation step writers performed before copy-on-write."""
+    caption_set = deepcopy(caption_set)
+    for lang in caption_set.get_languages():
+        for caption in caption_set.get_captions(lang):
+            caption.layout_info = writer._relativize_and_fit_to_screen(
+                caption.layout_info
+            )
+            for node in caption.nodes:
+                node.layout_info = writer._relativize_and_fit_to_screen(
+                    node.layout_info
+                )
+    return caption_set
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--captions", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    caption_set = _build_caption_set(args.captions)
+    writer = BaseWriter(video_width=640, video_height=360)
+    print(f"{args.captions} captions\n")
+
+    for label, func, func_args in (
+        ("deepcopy", deepcopy, (caption_set,)),
+        ("copy", CaptionSet.copy, (caption_set,)),
+        ("deepcopy+rel", _deepcopy_and_relativize, (writer, caption_set)),
+        ("copy+rel", writer._relativize_captions, (caption_set,)),
+    ):
+        seconds, peak, _ = measure(func, *func_args, repeat=args.repeat)
+        print(f"{label:>14}: {seconds * 1000:8.1f} ms  peak {format_bytes(peak)}")
+
+    print()
+    for writer_class in (DFXPWriter, SAMIWriter, WebVTTWriter):
+        seconds, peak, _ = measure(
+            writer_class(video_width=640, video_height=360).write,
+            caption_set,
+            repeat=args.repeat,
+        )
+        print(
+            f"{writer_class.__name__:>14}: {seconds * 1000:8.1f} ms  "
+            f"peak {format_bytes(peak)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
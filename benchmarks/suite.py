@@ -0,0 +1,258 @@
+"""Time and memory of every reader and writer, saved as JSON.
+
+Synthetic captions (see ``benchmarks.synthetic``) are generated at each
+requested size and written in every format. The suite then measures, for
+every size:
+
+- ``detect_format`` and ``read`` of every format, including
+  ``StreamingDFXPReader`` and ``StreamingSAMIReader``;
+- ``write`` of every format, including the DFXP text serializer and the
+  transcript writer when nltk is installed;
+- ``merge_concurrent_captions`` and ``translate_scc``;
+- with ``--conversions``, every reader → writer conversion.
+
+::
+
+    python -m benchmarks.suite --cues 1000 10000 --output before.json
+    python -m benchmarks.suite --cues 1000 10000 --compare before.json
+
+``--compare`` prints the ratio of every timing to the baseline file and
+exits with status 1 if one of them is slower by more than ``--threshold``.
+"""
+
+import argparse
+import datetime
+import fnmatch
+import importlib.metadata
+import json
+import platform
+import subprocess
+import sys
+import warnings
+
+from pycaption import (
+    DFXPReader,
+    DFXPWriter,
+    MicroDVDReader,
+    SAMIReader,
+    SCCReader,
+    SRTReader,
+    StreamingDFXPReader,
+    StreamingSAMIReader,
+    TranscriptWriter,
+    WebVTTReader,
+    detect_format,
+    translate_scc,
+)
+from pycaption.base import CaptionSet, merge_concurrent_captions
+
+from ._common import format_bytes, measure
+from .synthetic import FORMATS, VIDEO_SIZE, build_caption_set, render
+
+SCHEMA_VERSION = 1
+
+READERS = {
+    "dfxp": DFXPReader,
+    "dfxp_streaming": lambda: StreamingDFXPReader(recover=True),
+    "microdvd": MicroDVDReader,
+    "sami": SAMIReader,
+    "sami_streaming": StreamingSAMIReader,
+    "scc": SCCReader,
+    "srt": SRTReader,
+    "webvtt": WebVTTReader,
+}
+
+# writer name -> (format of the source it is benchmarked with, factory)
+WRITERS = {name: (name, factory) for name, (factory, _) in FORMATS.items()}
+WRITERS["dfxp"] = ("dfxp", lambda: DFXPWriter(**VIDEO_SIZE))
+WRITERS["dfxp_text"] = ("dfxp", FORMATS["dfxp"][0])
+WRITERS["transcript"] = ("srt", TranscriptWriter)
+
+
+def _source_format(reader_name):
+    return reader_name.partition("_")[0]
+
+
+def _single_language(caption_set):
+    lang = caption_set.get_languages()[0]
+    return CaptionSet(
+        {lang: caption_set.get_captions(lang)}, styles=dict(caption_set.get_styles())
+    )
+
+
+def _convert(reader_factory, writer_factory, content):
+    return writer_factory().write(reader_factory().read(content))
+
+
+def _cases(cues, languages, conversions):
+    """Yield (name, function, args) for one size."""
+    caption_set = build_caption_set(
+        cues, languages=[f"l{index}" for index in range(languages)]
+    )
+    sources = {name: render(caption_set, name) for name in FORMATS}
+    inputs = {
+        name: caption_set if multi_language else _single_language(caption_set)
+        for name, (_, multi_language) in FORMATS.items()
+    }
+
+    for name in FORMATS:
+        yield f"detect_format.{name}", detect_format, (sources[name],)
+    for name, reader in READERS.items():
+        content = sources[_source_format(name)]
+        yield f"read.{name}", lambda c, r=reader: r().read(c), (content,)
+    for name, (source, writer) in WRITERS.items():
+        if writer is TranscriptWriter:
+            try:
+                TranscriptWriter()
+            except ModuleNotFoundError:
+                continue
+        yield f"write.{name}", lambda s, w=writer: w().write(s), (inputs[source],)
+    # The merge replaces the caption lists in place: every run gets its own
+    # copy of the shared caption set
+    yield (
+        "merge_concurrent_captions",
+        lambda s: merge_concurrent_captions(s.copy()),
+        (caption_set,),
+    )
+    yield "translate_scc", translate_scc, (sources["scc"],)
+
+    if conversions:
+        for reader_name, reader in READERS.items():
+            for writer_name, (_, writer) in WRITERS.items():
+                if writer is TranscriptWriter:
+                    continue
+                content = sources[_source_format(reader_name)]
+                yield (
+                    f"convert.{reader_name}-{writer_name}",
+                    _convert,
+                    (reader, writer, content),
+                )
+
+
+def _environment():
+    try:
+        version = importlib.metadata.version("pycaption")
+    except importlib.metadata.PackageNotFoundError:
+        version = None
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        "pycaption": version,
+        "revision": revision,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def run(cue_counts, languages=2, repeat=3, only=None, conversions=False):
+    """Run the suite and return its results as a JSON serializable dict.
+
+    :param cue_counts: the sizes to run, in captions per language
+    :param languages: number of languages of the synthetic captions
+    :param repeat: timed runs per case, the best one is kept
+    :param only: fnmatch patterns, only the matching cases are run
+    :param conversions: also run every reader -> writer conversion
+    :rtype: dict
+    """
+    results = []
+    for cues in cue_counts:
+        for name, func, args in _cases(cues, languages, conversions):
+            if only and not any(fnmatch.fnmatch(name, pattern) for pattern in only):
+                continue
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                seconds, peak, _ = measure(func, *args, repeat=repeat)
+            result = {
+                "name": name,
+                "cues": cues,
+                "seconds": seconds,
+                "peak_bytes": peak,
+            }
+            if isinstance(args[0], str):
+                result["input_chars"] = len(args[0])
+            results.append(result)
+            print(
+                f"{name:<36} {cues:>8} {seconds * 1000:10.1f} ms "
+                f"{format_bytes(peak):>12}",
+                file=sys.stderr,
+            )
+    return {
+        "schema": SCHEMA_VERSION,
+        "environment": _environment(),
+        "settings": {"languages": languages, "repeat": repeat},
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold=0.1):
+    """Print every timing of report next to the same one in baseline.
+
+    :returns: the (name, cues) of the cases slower than the baseline by
+        more than threshold (a fraction)
+    :rtype: list[tuple[str, int]]
+    """
+    previous = {(r["name"], r["cues"]): r for r in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        key = (result["name"], result["cues"])
+        if key not in previous:
+            continue
+        ratio = result["seconds"] / previous[key]["seconds"]
+        memory = result["peak_bytes"] / max(previous[key]["peak_bytes"], 1)
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(
+            f"{key[0]:<36} {key[1]:>8}  time x{ratio:5.2f}  memory x{memory:5.2f}"
+            f"{flag}"
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cues", type=int, nargs="+", default=[1000])
+    parser.add_argument("--languages", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="+", help="fnmatch patterns of case names")
+    parser.add_argument("--conversions", action="store_true")
+    parser.add_argument(
+        "--output", help="write the JSON report to this file instead of stdout"
+    )
+    parser.add_argument("--compare", help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    report = run(
+        args.cues,
+        languages=args.languages,
+        repeat=args.repeat,
+        only=args.only,
+        conversions=args.conversions,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+    elif not args.compare:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline:
+            regressions = compare(report, json.load(baseline), args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""Synthetic caption sets and files of any size for the benchmarks.
+
+``build_caption_set`` creates captions with inline styles, a few different
+positions and as many languages as requested; ``render`` writes them in
+any supported format, which gives reader benchmarks realistic input::
+
+    caption_set = build_caption_set(10000, languages=("en-US", "fr-FR"))
+    srt_content = render(caption_set, "srt")
+"""
+
+from pycaption import (
+    DFXPWriter,
+    MicroDVDWriter,
+    SAMIWriter,
+    SCCWriter,
+    SRTWriter,
+    WebVTTWriter,
+)
+from pycaption.base import BaseWriter, Caption, CaptionList, CaptionNode, CaptionSet
+from pycaption.geometry import (
+    Alignment,
+    HorizontalAlignmentEnum,
+    Layout,
+    Point,
+    Size,
+    Stretch,
+    UnitEnum,
+    VerticalAlignmentEnum,
+)
+
+VIDEO_SIZE = {"video_width": 640, "video_height": 360}
+
+
+class _RelativizingSCCWriter(SCCWriter):
+    """SCCWriter does not relativize, so pixel positions are converted first."""
+
+    def write(self, caption_set):
+        return super().write(BaseWriter(**VIDEO_SIZE)._relativize_captions(caption_set))
+
+
+# format name -> (writer factory, whether the format holds several languages)
+FORMATS = {
+    "dfxp": (lambda: DFXPWriter(serializer="text", **VIDEO_SIZE), True),
+    "microdvd": (MicroDVDWriter, False),
+    "sami": (lambda: SAMIWriter(**VIDEO_SIZE), True),
+    "scc": (_RelativizingSCCWriter, False),
+    "srt": (SRTWriter, False),
+    "webvtt": (lambda: WebVTTWriter(**VIDEO_SIZE), False),
+}
+
+_WORDS = (
+    "the quick brown fox jumps over a lazy dog while seven wizards hex big "
+    "pink jumbos near an old harbour before dawn"
+).split()
+
+_STYLES = {
+    "speaker": {"color": "yellow", "font-family": "Arial"},
+    "narrator": {"color": "white", "font-style": "italic"},
+}
+
+
+def _layout(left, top, width, height, unit, horizontal, vertical):
+    return Layout(
+        origin=Point(Size(left, unit), Size(top, unit)),
+        extent=Stretch(Size(width, unit), Size(height, unit)),
+        alignment=Alignment(horizontal, vertical),
+    )
+
+
+_LAYOUTS = (
+    None,
+    _layout(
+        10,
+        80,
+        80,
+        10,
+        UnitEnum.PERCENT,
+        HorizontalAlignmentEnum.CENTER,
+        VerticalAlignmentEnum.BOTTOM,
+    ),
+    _layout(
+        10,
+        10,
+        80,
+        10,
+        UnitEnum.PERCENT,
+        HorizontalAlignmentEnum.LEFT,
+        VerticalAlignmentEnum.TOP,
+    ),
+    _layout(
+        64,
+        200,
+        512,
+        72,
+        UnitEnum.PIXEL,
+        HorizontalAlignmentEnum.RIGHT,
+        VerticalAlignmentEnum.BOTTOM,
+    ),
+)
+
+
+def _words(index, count):
+    return " ".join(_WORDS[(index * 7 + n) % len(_WORDS)] for n in range(count))
+
+
+def _caption(index, start, end, styled, positioned):
+    layout = _LAYOUTS[index % len(_LAYOUTS)] if positioned else None
+    # Lines stay under the 32 characters SCC allows
+    nodes = [CaptionNode.create_text(_words(index, 3) + " ", layout_info=layout)]
+    if styled and index % 2:
+        style = {"italics": True}
+        nodes += [
+            CaptionNode.create_style(True, style, layout_info=layout),
+            CaptionNode.create_text(_words(index + 1, 1), layout_info=layout),
+            CaptionNode.create_style(False, style, layout_info=layout),
+        ]
+    else:
+        nodes.append(CaptionNode.create_text(_words(index + 1, 1), layout_info=layout))
+    nodes += [
+        CaptionNode.create_break(layout_info=layout),
+        CaptionNode.create_text(_words(index + 2, 4), layout_info=layout),
+    ]
+    style = {"class": ("speaker", "narrator")[index % 2]} if styled else {}
+    return Caption(start, end, nodes, style=style, layout_info=layout)
+
+
+def build_caption_set(cues, languages=("en-US",), styled=True, positioned=True):
+    """Return a CaptionSet with cues captions in every language.
+
+    Captions last 2.5 seconds with half a second between them; every other
+    one has an italic span and they cycle through positions given as
+    percentages and as pixels of a 640x360 video.
+
+    :param cues: number of captions per language
+    :param languages: language codes
+    :param styled: add class styles and inline italics
+    :param positioned: add layouts
+    :rtype: CaptionSet
+    """
+    captions = {}
+    for lang_index, lang in enumerate(languages):
+        caption_list = CaptionList()
+        for index in range(cues):
+            start = 1000000 + index * 3000000
+            caption_list.append(
+                _caption(index + lang_index, start, start + 2500000, styled, positioned)
+            )
+        captions[lang] = caption_list
+    return CaptionSet(captions, styles=dict(_STYLES) if styled else None)
+
+
+def render(caption_set, format_name):
+    """Write caption_set in the given format.
+
+    Formats that hold a single language get the first language only.
+
+    :param format_name: a key of ``FORMATS``
+    :rtype: str
+    """
+    writer_factory, multi_language = FORMATS[format_name]
+    if not multi_language:
+        lang = caption_set.get_languages()[0]
+        caption_set = CaptionSet(
+            {lang: caption_set.get_captions(lang)},
+            styles=dict(caption_set.get_styles()),
+        )
+    return writer_factory().write(caption_set)
@@ -3,10 +3,17 @@
 Reads captions from DFXP/TTML, SRT, SAMI, SCC, WebVTT, and MicroDVD into
 a common intermediate representation (CaptionSet), and writes them back
 to any supported format.
+
+The DFXP and SAMI readers and writers, which need BeautifulSoup, lxml and
+cssutils, CaptionTimings, which uses NumPy when installed, and the
+conversion cache are only imported when first used, so that ``import
+pycaption`` stays fast.
 """
 
+from importlib import import_module
+
 from .base import Caption, CaptionConverter, CaptionList, CaptionNode, CaptionSet
-from .dfxp import DFXPReader, DFXPWriter
+from .detection import LIKELY, sniff_format
 from .exceptions import (
     CaptionReadError,
     CaptionReadNoCaptions,
@@ -14,55 +21,106 @@ from .exceptions import (
     CaptionReadWarning,
 )
 from .microdvd import MicroDVDReader, MicroDVDWriter
-from .sami import SAMIReader, SAMIWriter
-from .scc import SCCReader, SCCWriter
-from .scc.translator import translate_scc
+from .scc import LiveSCCDecoder, SCCReader, SCCWriter
+from .scc.translator import iter_translate_scc, translate_scc
+from .snapshot import dump_snapshot, load_snapshot, open_snapshot
 from .srt import SRTReader, SRTWriter
+from .timebase import Timebase
 from .transcript import TranscriptWriter
-from .webvtt import WebVTTReader, WebVTTWriter
+from .webvtt import SegmentedWebVTTWriter, WebVTTReader, WebVTTWriter
 
 __all__ = [
     "CaptionConverter",
     "DFXPReader",
     "DFXPWriter",
+    "StreamingDFXPReader",
     "MicroDVDReader",
     "MicroDVDWriter",
     "SAMIReader",
     "SAMIWriter",
+    "StreamingSAMIReader",
     "SRTReader",
     "SRTWriter",
     "SCCReader",
     "SCCWriter",
+    "LiveSCCDecoder",
     "translate_scc",
+    "iter_translate_scc",
     "WebVTTReader",
     "WebVTTWriter",
+    "SegmentedWebVTTWriter",
     "CaptionReadError",
     "CaptionReadNoCaptions",
     "CaptionReadSyntaxError",
     "CaptionReadWarning",
     "detect_format",
+    "sniff_format",
     "CaptionNode",
     "Caption",
     "CaptionList",
     "CaptionSet",
+    "CaptionTimings",
+    "Timebase",
+    "snap_caption_set",
+    "dump_snapshot",
+    "load_snapshot",
+    "open_snapshot",
+    "ConversionCache",
+    "MemoryCache",
+    "DirectoryCache",
     "TranscriptWriter",
 ]
 
-SUPPORTED_READERS = (
-    DFXPReader,
-    MicroDVDReader,
-    WebVTTReader,
-    SAMIReader,
-    SRTReader,
-    SCCReader,
+# Names imported on first use, and their modules
+_LAZY_NAMES = {
+    "DFXPReader": ".dfxp",
+    "DFXPWriter": ".dfxp",
+    "StreamingDFXPReader": ".dfxp",
+    "SAMIReader": ".sami",
+    "SAMIWriter": ".sami",
+    "StreamingSAMIReader": ".sami",
+    "CaptionTimings": ".timing",
+    "snap_caption_set": ".timing",
+    "ConversionCache": ".cache",
+    "MemoryCache": ".cache",
+    "DirectoryCache": ".cache",
+}
+
+_SUPPORTED_READER_NAMES = (
+    "DFXPReader",
+    "MicroDVDReader",
+    "WebVTTReader",
+    "SAMIReader",
+    "SRTReader",
+    "SCCReader",
 )
 
 
+def __getattr__(name):
+    """Import the lazily loaded names on first use."""
+    if name == "SUPPORTED_READERS":
+        value = tuple(
+            globals()[reader] if reader in globals() else __getattr__(reader)
+            for reader in _SUPPORTED_READER_NAMES
+        )
+    elif name in _LAZY_NAMES:
+        value = getattr(import_module(_LAZY_NAMES[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_NAMES, "SUPPORTED_READERS"})
+
+
 def detect_format(caps):
     """Detect the caption format of the provided string.
 
-    Tries each reader's ``detect()`` method in order and returns the
-    first matching reader class, or None if no format matches.
+    Only the beginning of the string is inspected, see ``sniff_format``.
+    Formats that can only be partially recognized, such as a truncated
+    DFXP document, are not reported.
 
     :param caps: Raw caption file content.
     :returns: The reader class for the detected format, or None.
@@ -72,8 +130,8 @@ def detect_format(caps):
     if not len(caps):
         raise CaptionReadNoCaptions("Empty caption file")
 
-    for reader in SUPPORTED_READERS:
-        if reader().detect(caps):
-            return reader
+    reader, confidence = sniff_format(caps)
+    if confidence >= LIKELY:
+        return reader
 
     return None
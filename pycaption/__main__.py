@@ -0,0 +1,129 @@
+"""Command line interface: ``python -m pycaption``.
+
+Convert files given on the command line::
+
+    python -m pycaption -f srt -f vtt -o out/ captions/*.scc
+
+or the conversions listed in a JSON manifest (see ``load_manifest``)::
+
+    python -m pycaption --manifest conversions.json --workers 8 --timeout 60
+
+With ``--cache-dir``, files converted before, by this run or an earlier
+one, are not converted again (see ``pycaption.cache``).
+
+One line is printed per file, in the order of the inputs, and the exit
+status is 1 if any conversion failed. ``--json`` prints the same report as
+a JSON list instead.
+"""
+
+import argparse
+import json
+import sys
+
+from .batch import WRITERS, BatchConverter, ConversionJob, load_manifest
+from .cache import ConversionCache, DirectoryCache
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m pycaption", description="Convert caption files."
+    )
+    parser.add_argument("inputs", nargs="*", help="caption files to convert")
+    parser.add_argument(
+        "-f",
+        "--format",
+        dest="formats",
+        action="append",
+        choices=sorted(WRITERS),
+        help="output format, can be repeated",
+    )
+    parser.add_argument(
+        "-o", "--output-dir", help="output directory (default: next to the input)"
+    )
+    parser.add_argument(
+        "-m", "--manifest", help="JSON list of {input, formats, output_dir}"
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, help="worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=1, help="files handed to a worker at once"
+    )
+    parser.add_argument("--timeout", type=float, help="seconds allowed per file")
+    parser.add_argument(
+        "--encoding", default="utf-8-sig", help="encoding of the input files"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="directory of a cache of the conversions, reused by later runs",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=1024,
+        help="MiB the cache directory is kept under (default: 1024)",
+    )
+    parser.add_argument("--video-width", type=int)
+    parser.add_argument("--video-height", type=int)
+    parser.add_argument("--json", action="store_true", help="print a JSON report")
+    return parser
+
+
+def main(argv=None):
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load_manifest(args.manifest) if args.manifest else []
+        if args.inputs:
+            if not args.formats:
+                parser.error("the inputs need at least one --format")
+            jobs.extend(
+                ConversionJob(path, args.formats, output_dir=args.output_dir)
+                for path in args.inputs
+            )
+        if not jobs:
+            parser.error("nothing to convert: give input files or a --manifest")
+
+        cache = None
+        if args.cache_dir:
+            cache = ConversionCache(
+                DirectoryCache(args.cache_dir, max_size=args.cache_size * 1024 * 1024)
+            )
+        converter = BatchConverter(
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            timeout=args.timeout,
+            encoding=args.encoding,
+            writer_options={
+                "video_width": args.video_width,
+                "video_height": args.video_height,
+            },
+            cache=cache,
+        )
+        results = converter.iter_results(jobs)
+
+        failed = False
+        report = []
+        for result in results:
+            failed = failed or not result.ok
+            if args.json:
+                report.append(result.to_dict())
+            elif result.ok:
+                outputs = ", ".join(result.outputs.values())
+                print(f"ok     {result.input_path} -> {outputs}")
+            else:
+                print(
+                    f"error  {result.input_path}: {result.error_type}: {result.error}"
+                )
+    except (OSError, ValueError) as exc:
+        parser.exit(2, f"{parser.prog}: error: {exc}\n")
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,8 @@ CaptionConverter orchestrator and base classes for readers/writers.
 """
 
 import os
+import threading
+from bisect import bisect_left, bisect_right
 from datetime import timedelta
 from numbers import Number
 
@@ -14,6 +16,8 @@ from .exceptions import CaptionReadError, CaptionReadTimingError
 # `und` a special identifier for an undetermined language according to ISO 639-2
 DEFAULT_LANGUAGE_CODE = os.getenv("PYCAPTION_DEFAULT_LANG", "und")
 
+_PLAIN_NUMBER_TYPES = (int, float)
+
 
 class CaptionConverter:
     """High-level orchestrator: read content with a reader, write with a writer.
@@ -23,10 +27,31 @@ class CaptionConverter:
         converter = CaptionConverter()
         converter.read(srt_content, SRTReader())
         output = converter.write(WebVTTWriter())
+
+    With a ConversionCache, the outputs are looked up in the cache first,
+    and the content is only parsed if one of them is missing. Errors in
+    the content are then raised by write(), not by read().
     """
 
-    def __init__(self, captions=None):
+    def __init__(self, captions=None, cache=None):
+        """
+        :param captions: The CaptionSet to write.
+        :param cache: A ConversionCache of the CaptionSets read and of the
+            outputs written.
+        """
         self.captions = captions if captions else []
+        self.cache = cache
+
+    @property
+    def captions(self):
+        if self._source is not None:
+            return self._source.get_caption_set()
+        return self._captions
+
+    @captions.setter
+    def captions(self, captions):
+        self._captions = captions
+        self._source = None
 
     def read(self, content, caption_reader):
         """Parse caption content using the given reader.
@@ -35,6 +60,10 @@ class CaptionConverter:
         :param caption_reader: A BaseReader subclass instance.
         :returns: self (for chaining).
         """
+        if self.cache is not None:
+            self.captions = None
+            self._source = self.cache.source(content, caption_reader)
+            return self
         try:
             self.captions = caption_reader.read(content)
         except AttributeError as e:
@@ -49,14 +78,85 @@ class CaptionConverter:
         :rtype: str
         """
         try:
+            if self._source is not None:
+                return self._source.write(caption_writer)
             return caption_writer.write(self.captions)
         except AttributeError as e:
             raise Exception(e)
 
+    def write_all(self, caption_writers, threads=False):
+        """Serialize the stored CaptionSet with several writers.
+
+        Work that does not depend on the output format, like relativizing
+        the caption layouts, is done once for all the writers that share
+        the same positioning settings, instead of once per writer.
+
+        :param caption_writers: A list of BaseWriter instances, or a dict
+            mapping names to BaseWriter instances.
+        :param threads: If True, run the writers concurrently, one thread
+            per writer. Every writer must then be a distinct instance.
+        :returns: The outputs, in a list in the order of the writers, or
+            in a dict with the same keys.
+        :rtype: list[str] | dict[str, str]
+        :raises ValueError: if threads is set and a writer is repeated.
+        """
+        if isinstance(caption_writers, dict):
+            names, writers = list(caption_writers), list(caption_writers.values())
+        else:
+            names, writers = None, list(caption_writers)
+        if threads and len({id(writer) for writer in writers}) < len(writers):
+            raise ValueError("Writers must be distinct instances to run in threads")
+
+        shared = _SharedResults()
+
+        def write(writer):
+            writer._shared_results = shared
+            try:
+                return self.write(writer)
+            finally:
+                writer._shared_results = None
+
+        if threads and len(writers) > 1:
+            # Imported here, it is only needed for threads
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(len(writers)) as executor:
+                outputs = list(executor.map(write, writers))
+        else:
+            outputs = [write(writer) for writer in writers]
+
+        return outputs if names is None else dict(zip(names, outputs))
+
+
+class _SharedResults:
+    """Results computed once and reused by the writers of one write_all().
+
+    Safe to use from several threads: a result is computed by the first
+    writer that needs it while the others wait for it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._results = {}
+
+    def get(self, key, compute):
+        """Return the result stored under key, calling compute() if missing."""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._results:
+                self._results[key] = compute()
+            return self._results[key]
+
 
 class BaseReader:
     """Abstract base class for caption format readers."""
 
+    #: attributes that change what read() returns, part of the keys of a
+    #: ConversionCache
+    CACHE_OPTIONS = ()
+
     def __init__(self, *args, **kwargs):
         pass
 
@@ -80,6 +180,16 @@ class BaseReader:
 class BaseWriter:
     """Abstract base class for caption format writers."""
 
+    # Set by CaptionConverter.write_all() while this writer is in use
+    _shared_results = None
+
+    #: number of layouts a writer remembers the relativized version of
+    LAYOUT_CACHE_SIZE = 256
+
+    #: attributes that change what write() returns, part of the keys of a
+    #: ConversionCache
+    CACHE_OPTIONS = ("relativize", "video_width", "video_height", "fit_to_screen")
+
     def __init__(
         self, relativize=True, video_width=None, video_height=None, fit_to_screen=True
     ):
@@ -106,6 +216,40 @@ class BaseWriter:
         self.video_width = video_width
         self.video_height = video_height
         self.fit_to_screen = fit_to_screen
+        self._layout_cache = {}
+
+    def _cached_layout(self, kind, layout, compute):
+        """Return compute(layout), computed once per distinct layout.
+
+        Layouts are immutable, so the result only depends on the layout and
+        on the positioning settings of the writer, which are part of the
+        key. Once LAYOUT_CACHE_SIZE results are stored, the oldest one is
+        dropped.
+
+        :param kind: the name of the computation, to tell results apart
+        :type layout: Layout
+        :param compute: a function of the layout
+        """
+        # Layouts equal but for their WebVTT positioning are different keys
+        key = (
+            kind,
+            layout,
+            layout.webvtt_positioning,
+            self.relativize,
+            self.video_width,
+            self.video_height,
+            self.fit_to_screen,
+        )
+        cache = self._layout_cache
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        result = compute(layout)
+        if len(cache) >= self.LAYOUT_CACHE_SIZE:
+            cache.pop(next(iter(cache)), None)
+        cache[key] = result
+        return result
 
     def _relativize_and_fit_to_screen(self, layout_info):
         """Apply relativization and fit-to-screen adjustments to a Layout.
@@ -114,16 +258,89 @@ class BaseWriter:
         :rtype: Layout | None
         """
         if layout_info:
-            if self.relativize:
-                # Transform absolute values (e.g. px) into percentages
-                layout_info = layout_info.as_percentage_of(
-                    self.video_width, self.video_height
-                )
-            if self.fit_to_screen:
-                # Make sure origin + extent <= 100%
-                layout_info = layout_info.fit_to_screen()
+            layout_info = self._cached_layout(
+                "relativized", layout_info, self._relativize_and_fit_layout
+            )
+        return layout_info
+
+    def _relativize_and_fit_layout(self, layout_info):
+        """Uncached _relativize_and_fit_to_screen of a Layout."""
+        if self.relativize:
+            # Transform absolute values (e.g. px) into percentages
+            layout_info = layout_info.as_percentage_of(
+                self.video_width, self.video_height
+            )
+        if self.fit_to_screen:
+            # Make sure origin + extent <= 100%
+            layout_info = layout_info.fit_to_screen()
         return layout_info
 
+    def _relativize_caption(self, caption):
+        """Return a copy of caption whose own layout and node layouts are
+        relativized and fitted to screen.
+
+        Nodes whose layout is unchanged are shared with the original.
+
+        :type caption: Caption
+        :rtype: Caption
+        """
+        nodes = []
+        for node in caption.nodes:
+            layout_info = self._relativize_and_fit_to_screen(node.layout_info)
+            if layout_info is not node.layout_info:
+                node = node.copy(layout_info=layout_info)
+            nodes.append(node)
+        return caption.copy(
+            nodes=nodes,
+            layout_info=self._relativize_and_fit_to_screen(caption.layout_info),
+        )
+
+    def _relativize_captions(self, caption_set, langs=None):
+        """Return a copy of caption_set with relativized caption layouts.
+
+        The caller's CaptionSet is never modified: only the CaptionLists of
+        ``langs`` (all languages by default) are rebuilt, with every caption
+        replaced by a relativized copy.
+
+        :type caption_set: CaptionSet
+        :param langs: the languages to relativize
+        :rtype: CaptionSet
+        """
+        source, caption_set = caption_set, caption_set.copy()
+        if langs is None:
+            langs = caption_set.get_languages()
+        for lang in langs:
+            captions = source.get_captions(lang)
+            if self._shared_results is None:
+                relativized = self._relativize_caption_list(captions)
+            else:
+                # The source list is kept with its result so that its id
+                # cannot be reused while the results are alive
+                _, relativized = self._shared_results.get(
+                    (
+                        "relativized",
+                        id(captions),
+                        self.relativize,
+                        self.video_width,
+                        self.video_height,
+                        self.fit_to_screen,
+                    ),
+                    lambda: (captions, self._relativize_caption_list(captions)),
+                )
+                # Writers may change the list they get, but not the captions
+                relativized = CaptionList(
+                    relativized, layout_info=relativized.layout_info
+                )
+            caption_set.set_captions(lang, relativized)
+        return caption_set
+
+    def _relativize_caption_list(self, captions):
+        """Return a CaptionList of relativized copies of captions."""
+        return CaptionList(
+            [self._relativize_caption(caption) for caption in captions],
+            layout_info=getattr(captions, "layout_info", None),
+        )
+
     def write(self, content):
         """Serialize a CaptionSet. Subclasses override this.
 
@@ -143,8 +360,13 @@ class CaptionNode:
         The value None means specifically that no positioning information
         should be specified. Each reader is to supply its own default
         values (if necessary) when reading their respective formats.
+
+    Nodes are slotted: a feature-length file produces tens of thousands of
+    them, so they carry no per-instance ``__dict__``.
     """
 
+    __slots__ = ("type_", "content", "position", "start", "layout_info")
+
     TEXT = 1
     # When and if this is extended, it might be better to turn it into a
     # property of the node, not a type of node itself.
@@ -178,6 +400,19 @@ class CaptionNode:
         else:
             raise RuntimeError(f"Unknown node type: {t}")
 
+    def copy(self, **changes):
+        """Return a shallow copy of this node, with ``changes`` applied.
+
+        :param changes: attribute values replacing the copied ones
+        :rtype: CaptionNode
+        """
+        node = object.__new__(type(self))
+        for name in CaptionNode.__slots__:
+            setattr(node, name, changes.pop(name, getattr(self, name)))
+        if changes:
+            raise TypeError(f"Unknown CaptionNode attributes: {sorted(changes)}")
+        return node
+
     @staticmethod
     def create_text(text, layout_info=None, position=None):
         """Create a TEXT node with the given content string."""
@@ -210,8 +445,22 @@ class Caption:
     """
     A single caption, including the time and styling information
     for its display.
+
+    ``caption_mode`` and ``roll_up_rows`` carry the CEA-608 display mode
+    ("pop_on", "roll_up", "paint_on") and roll-up depth for captions read
+    from SCC; they are None for every other source.
     """
 
+    __slots__ = (
+        "start",
+        "end",
+        "nodes",
+        "style",
+        "layout_info",
+        "caption_mode",
+        "roll_up_rows",
+    )
+
     def __init__(self, start, end, nodes, style=None, layout_info=None):
         """
         Initialize the Caption object
@@ -227,11 +476,13 @@ class Caption:
             information
         :type layout_info: Layout
         """
-        if not isinstance(start, Number):
+        # Checking the concrete type first skips the (slow) ABC lookup for
+        # the int/float times every reader produces.
+        if type(start) not in _PLAIN_NUMBER_TYPES and not isinstance(start, Number):
             raise CaptionReadTimingError(
                 "Captions must be initialized with a valid start time"
             )
-        if not isinstance(end, Number):
+        if type(end) not in _PLAIN_NUMBER_TYPES and not isinstance(end, Number):
             raise CaptionReadTimingError(
                 "Captions must be initialized with a valid end time"
             )
@@ -242,6 +493,40 @@ class Caption:
         self.nodes = nodes
         self.style = style or {}
         self.layout_info = layout_info
+        self.caption_mode = None
+        self.roll_up_rows = None
+
+    def copy(self, **changes):
+        """Return a shallow copy of this caption, with ``changes`` applied.
+
+        The node list and style dictionary are shared with the original
+        unless replaced through ``changes``.
+
+        :param changes: attribute values replacing the copied ones
+        :rtype: Caption
+        """
+        caption = object.__new__(type(self))
+        for name in Caption.__slots__:
+            setattr(caption, name, changes.pop(name, getattr(self, name)))
+        if changes:
+            raise TypeError(f"Unknown Caption attributes: {sorted(changes)}")
+        return caption
+
+    def _retimed(self, start, end):
+        """Return ``copy(start=start, end=end)``, without the keyword
+        handling: CaptionTimings calls it for every caption it moves.
+
+        :rtype: Caption
+        """
+        caption = object.__new__(type(self))
+        caption.start = start
+        caption.end = end
+        caption.nodes = self.nodes
+        caption.style = self.style
+        caption.layout_info = self.layout_info
+        caption.caption_mode = self.caption_mode
+        caption.roll_up_rows = self.roll_up_rows
+        return caption
 
     def is_empty(self):
         """Return True if this caption has no nodes."""
@@ -303,7 +588,16 @@ class Caption:
 
 
 class CaptionList(list):
-    """A list of captions with a layout object attached to it"""
+    """A list of captions with a layout object attached to it
+
+    ``at``, ``between`` and ``overlapping`` find captions by time in
+    logarithmic time, through an index built by the first of them and
+    dropped whenever the list changes. Changing the times of a caption that
+    is already in the list is not detected: put the caption back in the list
+    (``captions[i] = captions[i]``) to have the index rebuilt.
+    """
+
+    _index = None
 
     def __init__(self, iterable=None, layout_info=None):
         """
@@ -338,6 +632,167 @@ class CaptionList(list):
 
     __rmul__ = __mul__
 
+    def at(self, time):
+        """Return the captions shown at time, in the order of the list.
+
+        :param time: a time in microseconds
+        :rtype: CaptionList
+        """
+        index = self._get_index()
+        return self._found(index.find(bisect_right(index.starts, time), time))
+
+    def between(self, start, end):
+        """Return the captions shown at some time in [start, end), in the
+        order of the list.
+
+        :param start: a time in microseconds
+        :param end: a time in microseconds
+        :rtype: CaptionList
+        """
+        if end <= start:
+            return self._found([])
+        index = self._get_index()
+        return self._found(index.find(bisect_left(index.starts, end), start))
+
+    def overlapping(self, caption):
+        """Return the other captions shown at the same time as caption, in
+        the order of the list.
+
+        :type caption: Caption
+        :rtype: CaptionList
+        """
+        return CaptionList(
+            [
+                other
+                for other in self.between(caption.start, caption.end)
+                if other is not caption
+            ],
+            layout_info=self.layout_info,
+        )
+
+    def _get_index(self):
+        if self._index is None:
+            self._index = _CaptionIndex(self)
+        return self._index
+
+    def _found(self, positions):
+        return CaptionList(
+            [list.__getitem__(self, position) for position in positions],
+            layout_info=self.layout_info,
+        )
+
+    def __getstate__(self):
+        # The index is rebuilt when needed
+        state = dict(self.__dict__)
+        state.pop("_index", None)
+        return state
+
+    # Every change of the list drops its index
+
+    def __setitem__(self, key, value):
+        self._index = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._index = None
+        super().__delitem__(key)
+
+    def __iadd__(self, other):
+        self._index = None
+        return super().__iadd__(other)
+
+    def __imul__(self, other):
+        self._index = None
+        return super().__imul__(other)
+
+    def append(self, caption):
+        self._index = None
+        super().append(caption)
+
+    def extend(self, captions):
+        self._index = None
+        super().extend(captions)
+
+    def insert(self, position, caption):
+        self._index = None
+        super().insert(position, caption)
+
+    def pop(self, *args):
+        self._index = None
+        return super().pop(*args)
+
+    def remove(self, caption):
+        self._index = None
+        super().remove(caption)
+
+    def clear(self):
+        self._index = None
+        super().clear()
+
+    def sort(self, *args, **kwargs):
+        self._index = None
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._index = None
+        super().reverse()
+
+
+class _CaptionIndex:
+    """The captions of a list sorted by start time, with the latest end time
+    of every range of them in a segment tree.
+
+    The captions shown at a time are then found without looking at those
+    that ended before it: a range is skipped as soon as its latest end time
+    is too early.
+    """
+
+    __slots__ = ("starts", "_positions", "_size", "_max_ends")
+
+    def __init__(self, captions):
+        positions = sorted(
+            range(len(captions)), key=lambda position: captions[position].start
+        )
+        #: start times, in increasing order
+        self.starts = [captions[position].start for position in positions]
+        self._positions = positions
+
+        size = 1
+        while size < len(positions):
+            size *= 2
+        max_ends = [float("-inf")] * (2 * size)
+        for leaf, position in enumerate(positions, size):
+            max_ends[leaf] = captions[position].end
+        for node in range(size - 1, 0, -1):
+            max_ends[node] = max(max_ends[2 * node], max_ends[2 * node + 1])
+        self._size = size
+        self._max_ends = max_ends
+
+    def find(self, count, after):
+        """Return the positions in the list, in increasing order, of the
+        captions among the first count to start that end after a time.
+
+        :type count: int
+        :param after: a time in microseconds
+        :rtype: list[int]
+        """
+        size, max_ends, positions = self._size, self._max_ends, self._positions
+        found = []
+        # (node, first and last + 1 sorted captions under it)
+        stack = [(1, 0, size)]
+        while stack:
+            node, low, high = stack.pop()
+            if low >= count or max_ends[node] <= after:
+                continue
+            if node >= size:
+                found.append(positions[low])
+                continue
+            middle = (low + high) // 2
+            stack.append((2 * node + 1, middle, high))
+            stack.append((2 * node, low, middle))
+        found.sort()
+        return found
+
 
 class CaptionSet:
     """
@@ -346,6 +801,10 @@ class CaptionSet:
 
     The .layout_info attribute, keeps information that should be inherited
     by all the children.
+
+    Writers must not modify the CaptionSet they are given. They work on a
+    ``copy()`` instead, replacing (never mutating) the captions they need to
+    change.
     """
 
     def __init__(self, captions, styles=None, layout_info=None, regions=None):
@@ -360,6 +819,34 @@ class CaptionSet:
         self._regions = regions or {}
         self.layout_info = layout_info
 
+    def copy(self):
+        """Return a copy-on-write duplicate of this CaptionSet.
+
+        The dictionaries of languages, styles and regions and every caption
+        list are new objects, so they can be changed freely on the copy. The
+        captions themselves, the style rules and the layouts are shared and
+        must be replaced rather than modified.
+
+        :rtype: CaptionSet
+        """
+        captions = {}
+        for lang, caption_list in self._captions.items():
+            if isinstance(caption_list, CaptionList):
+                captions[lang] = CaptionList(
+                    caption_list, layout_info=caption_list.layout_info
+                )
+            else:
+                captions[lang] = list(caption_list)
+        return CaptionSet(
+            captions,
+            styles=dict(self._styles),
+            layout_info=self.layout_info,
+            regions={
+                region_id: dict(settings)
+                for region_id, settings in self._regions.items()
+            },
+        )
+
     def set_captions(self, lang, captions):
         """Replace the caption list for a given language.
 
@@ -453,20 +940,24 @@ class CaptionSet:
     def adjust_caption_timing(self, offset=0, rate_skew=1.0):
         """
         Adjust the timing according to offset and rate_skew.
-        Skew is applied first, then offset.
+        Skew is applied first, then offset. The captions that then start
+        before 0 are removed, and the times are rounded to the microsecond.
+        The moved captions are replaced by copies, as they may be shared
+        with copies of this CaptionSet.
 
         e.g. if skew == 1.1, and offset is 5, a caption originally
         displayed from 10-11 seconds would instead be at 16-17.1
+
+        See ``pycaption.timing.CaptionTimings`` for other bulk changes.
         """
+        # Imported here, as it imports NumPy when installed
+        from .timing import CaptionTimings
+
         for lang in self.get_languages():
-            captions = self.get_captions(lang)
-            out_captions = CaptionList()
-            for caption in captions:
-                caption.start = caption.start * rate_skew + offset
-                caption.end = caption.end * rate_skew + offset
-                if caption.start >= 0:
-                    out_captions.append(caption)
-            self.set_captions(lang, out_captions)
+            timings = CaptionTimings(self.get_captions(lang))
+            if rate_skew != 1:
+                timings.skew(rate_skew)
+            timings.shift(offset).remove_before(0).apply()
 
 
 # Functions
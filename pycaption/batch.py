@@ -0,0 +1,343 @@
+"""Convert many caption files at once, optionally across a process pool.
+
+Usage::
+
+    jobs = [
+        ConversionJob("in/episode1.scc", ["srt", "vtt"], output_dir="out"),
+        ConversionJob("in/episode2.dfxp", ["srt"], output_dir="out"),
+    ]
+    for result in BatchConverter(workers=4, timeout=60).run(jobs):
+        print(result.input_path, result.outputs or result.error)
+
+The reader of every file is picked with ``detect_format``. Results come
+back in the order of the jobs, whatever order the workers finish in, and
+the output files are named after their input files, so running the same
+manifest twice produces the same files and the same report.
+"""
+
+import json
+import os
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+
+from . import detect_format
+from .base import CaptionConverter
+from .dfxp import DFXPWriter
+from .exceptions import ConversionTimeoutError
+from .microdvd import MicroDVDWriter
+from .sami import SAMIWriter
+from .scc import SCCWriter
+from .srt import SRTWriter
+from .transcript import TranscriptWriter
+from .webvtt import WebVTTWriter
+
+#: Target formats: name -> (writer class, output file extension)
+WRITERS = {
+    "dfxp": (DFXPWriter, ".dfxp"),
+    "microdvd": (MicroDVDWriter, ".sub"),
+    "sami": (SAMIWriter, ".sami"),
+    "scc": (SCCWriter, ".scc"),
+    "srt": (SRTWriter, ".srt"),
+    "transcript": (TranscriptWriter, ".txt"),
+    "vtt": (WebVTTWriter, ".vtt"),
+}
+
+
+class ConversionJob:
+    """One input file and the formats it should be converted to.
+
+    :param input_path: Path of the caption file to convert.
+    :param formats: Names of the target formats, keys of ``WRITERS``.
+    :param output_dir: Directory of the output files, by default the
+        directory of the input file.
+    :raises ValueError: if a format is unknown.
+    """
+
+    __slots__ = ("input_path", "formats", "output_dir")
+
+    def __init__(self, input_path, formats, output_dir=None):
+        if isinstance(formats, str):
+            formats = [formats]
+        unknown = [name for name in formats if name not in WRITERS]
+        if unknown:
+            raise ValueError(
+                f"Unknown output format(s): {', '.join(unknown)}. "
+                f"Expected one of: {', '.join(WRITERS)}"
+            )
+        if not formats:
+            raise ValueError(f"No output format for {input_path}")
+        self.input_path = input_path
+        self.formats = tuple(dict.fromkeys(formats))
+        self.output_dir = output_dir
+
+    def output_paths(self):
+        """Return {format: path} of the files this job writes.
+
+        :rtype: dict[str, str]
+        """
+        output_dir = self.output_dir
+        if output_dir is None:
+            output_dir = os.path.dirname(self.input_path)
+        stem = os.path.splitext(os.path.basename(self.input_path))[0]
+        return {
+            name: os.path.join(output_dir, stem + WRITERS[name][1])
+            for name in self.formats
+        }
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.input_path!r}, {list(self.formats)!r}, "
+            f"output_dir={self.output_dir!r})"
+        )
+
+
+class ConversionResult:
+    """What happened to one ConversionJob.
+
+    ``outputs`` maps every format to the path it was written to; it is
+    empty when the conversion failed, in which case ``error_type`` and
+    ``error`` describe the exception. Nothing is written for a job unless
+    all of its formats could be produced.
+    """
+
+    __slots__ = ("index", "input_path", "reader", "outputs", "error_type", "error")
+
+    def __init__(
+        self, index, input_path, reader=None, outputs=None, error_type=None, error=None
+    ):
+        self.index = index
+        self.input_path = input_path
+        self.reader = reader
+        self.outputs = outputs or {}
+        self.error_type = error_type
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error_type is None
+
+    def to_dict(self):
+        """Return the result as a JSON serializable dict.
+
+        :rtype: dict
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        status = "ok" if self.ok else self.error_type
+        return f"<{self.__class__.__name__} #{self.index} {self.input_path}: {status}>"
+
+
+def load_manifest(manifest):
+    """Read a list of ConversionJob from a JSON manifest.
+
+    The manifest is a list of objects with an ``input`` path, the
+    ``formats`` to produce and an optional ``output_dir``; relative paths
+    are relative to the directory of the manifest::
+
+        [{"input": "episode1.scc", "formats": ["srt", "vtt"]}]
+
+    :param manifest: Path of the manifest file.
+    :rtype: list[ConversionJob]
+    :raises ValueError: if the manifest is malformed.
+    """
+    base_dir = os.path.dirname(os.path.abspath(manifest))
+    with open(manifest, encoding="utf-8") as manifest_file:
+        entries = json.load(manifest_file)
+    if not isinstance(entries, list):
+        raise ValueError("The manifest must be a JSON list of conversions.")
+
+    jobs = []
+    for entry in entries:
+        try:
+            input_path = os.path.join(base_dir, entry["input"])
+            formats = entry["formats"]
+        except (KeyError, TypeError) as exc:
+            raise ValueError(
+                f"Manifest entries need an 'input' and 'formats': {entry!r}"
+            ) from exc
+        output_dir = entry.get("output_dir")
+        if output_dir is not None:
+            output_dir = os.path.join(base_dir, output_dir)
+        jobs.append(ConversionJob(input_path, formats, output_dir=output_dir))
+    return jobs
+
+
+@contextmanager
+def _time_limit(seconds):
+    """Raise ConversionTimeoutError in the block after the given seconds.
+
+    Relies on SIGALRM, so the limit is only enforced on POSIX systems and
+    in the main thread of a process (which is where pool workers run).
+    """
+    if (
+        not seconds
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def expire(signum, frame):
+        raise ConversionTimeoutError(f"Conversion took longer than {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _convert(index, job, timeout, encoding, writer_options, cache):
+    """Convert one job and return its ConversionResult."""
+    result = ConversionResult(index, job.input_path)
+    try:
+        with _time_limit(timeout):
+            with open(job.input_path, encoding=encoding) as input_file:
+                content = input_file.read()
+            reader = detect_format(content)
+            if reader is None:
+                raise ValueError("Unknown caption format")
+            result.reader = reader.__name__
+            converter = CaptionConverter(cache=cache).read(content, reader())
+
+            outputs = {}
+            for name, path in job.output_paths().items():
+                writer_class = WRITERS[name][0]
+                outputs[path] = converter.write(writer_class(**writer_options))
+
+        for path, output in outputs.items():
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w", encoding="utf-8", newline="") as output_file:
+                output_file.write(output)
+    except Exception as exc:
+        result.error_type = exc.__class__.__name__
+        result.error = str(exc.args[0]) if exc.args else ""
+    else:
+        result.outputs = job.output_paths()
+    return result
+
+
+def _convert_chunk(chunk, *args):
+    """Convert a list of (index, job) in a worker process."""
+    return [_convert(index, job, *args) for index, job in chunk]
+
+
+def _initialize_worker():
+    """Import the readers and writers once per worker, not once per file."""
+    import pycaption.batch  # noqa: F401
+
+
+class BatchConverter:
+    """Convert a list of ConversionJob, in parallel when workers > 1.
+
+    :param workers: Number of worker processes, by default the number of
+        CPUs. With 1, the files are converted in the calling process.
+    :param chunk_size: Number of jobs handed to a worker at once; larger
+        chunks cut the inter-process overhead of many small files.
+    :param timeout: Seconds after which the conversion of a single file is
+        abandoned and reported as a ConversionTimeoutError. Only enforced
+        on POSIX systems.
+    :param encoding: Encoding of the input files. A leading byte order
+        mark is dropped. Outputs are written as UTF-8.
+    :param writer_options: Keyword arguments for every writer, e.g.
+        ``{"video_width": 640, "video_height": 360}``.
+    :param cache: A ConversionCache, so that files converted before are
+        not converted again. With several workers, its backend should be
+        a DirectoryCache: each worker gets a copy of the cache, and a
+        MemoryCache does not outlive the chunk it was sent with.
+    """
+
+    def __init__(
+        self,
+        workers=None,
+        chunk_size=1,
+        timeout=None,
+        encoding="utf-8-sig",
+        writer_options=None,
+        cache=None,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.encoding = encoding
+        self.writer_options = writer_options or {}
+        self.cache = cache
+
+    def run(self, jobs):
+        """Convert every job and return their results in order.
+
+        :type jobs: list[ConversionJob]
+        :rtype: list[ConversionResult]
+        :raises ValueError: if two jobs, or a job and its input, share an
+            output path.
+        """
+        return list(self.iter_results(jobs))
+
+    def iter_results(self, jobs):
+        """Convert every job, yielding the results in the order of the jobs.
+
+        :type jobs: list[ConversionJob]
+        :rtype: Iterator[ConversionResult]
+        :raises ValueError: if two jobs, or a job and its input, share an
+            output path.
+        """
+        jobs = list(jobs)
+        self._check_output_paths(jobs)
+        indexed = list(enumerate(jobs))
+        args = (self.timeout, self.encoding, self.writer_options, self.cache)
+
+        if self.workers == 1 or len(jobs) <= 1:
+            for index, job in indexed:
+                yield _convert(index, job, *args)
+            return
+
+        chunks = [
+            indexed[start : start + self.chunk_size]
+            for start in range(0, len(indexed), self.chunk_size)
+        ]
+        workers = min(self.workers, len(chunks))
+        with ProcessPoolExecutor(workers, initializer=_initialize_worker) as pool:
+            futures = [pool.submit(_convert_chunk, chunk, *args) for chunk in chunks]
+            for chunk, future in zip(chunks, futures):
+                try:
+                    yield from future.result()
+                except BrokenProcessPool as exc:
+                    for index, job in chunk:
+                        yield ConversionResult(
+                            index,
+                            job.input_path,
+                            error_type=exc.__class__.__name__,
+                            error="A worker process died during the conversion",
+                        )
+
+    @staticmethod
+    def _check_output_paths(jobs):
+        seen = {}
+        for job in jobs:
+            input_path = os.path.abspath(job.input_path)
+            for path in job.output_paths().values():
+                path = os.path.abspath(path)
+                if path == input_path:
+                    raise ValueError(f"Converting {job.input_path} would overwrite it")
+                if path in seen:
+                    raise ValueError(
+                        f"{seen[path]} and {job.input_path} would both be "
+                        f"written to {path}"
+                    )
+                seen[path] = job.input_path
+
+
+def convert_files(jobs, **options):
+    """Shortcut for ``BatchConverter(**options).run(jobs)``.
+
+    :rtype: list[ConversionResult]
+    """
+    return BatchConverter(**options).run(jobs)
@@ -0,0 +1,393 @@
+"""Cache of caption conversions, keyed by the hash of their content.
+
+Converting content that was converted before, with the same reader and
+writer options, only costs a hash of the content and a lookup::
+
+    cache = ConversionCache(DirectoryCache("/var/cache/captions"))
+    output = cache.convert(content, SCCReader(), WebVTTWriter())
+
+    # Or through a CaptionConverter, which hashes the content once for all
+    # of its writers
+    converter = CaptionConverter(cache=cache).read(content, SCCReader())
+    srt, vtt = converter.write_all([SRTWriter(), WebVTTWriter()])
+
+The key of an output is a hash of the content, of the reader and writer
+classes, of the options they were created with (``CACHE_OPTIONS``, such
+as ``relativize``, ``video_width`` or ``drop_frame``) and of the options
+of ``read()``. The parsed caption sets are cached too, as snapshots (see
+``pycaption.snapshot``), so that converting known content to another
+format does not parse it again.
+
+The values are kept in a backend: a MemoryCache (the default), a
+DirectoryCache shared by every process using the same directory, or any
+BaseCache subclass. Both backends drop the least recently used values
+once they hold more than ``max_size`` bytes.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from .base import DEFAULT_LANGUAGE_CODE
+from .exceptions import CaptionReadError
+from .snapshot import dump_snapshot, load_snapshot
+
+DEFAULT_MEMORY_CACHE_SIZE = 64 * 1024 * 1024
+DEFAULT_DIRECTORY_CACHE_SIZE = 1024 * 1024 * 1024
+
+_DIGEST_SIZE = 20
+# Outputs may change from one version of pycaption to the next
+_version = None
+
+
+def _get_version():
+    global _version
+    if _version is None:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            _version = version("pycaption")
+        except PackageNotFoundError:
+            _version = ""
+    return _version
+
+
+class BaseCache:
+    """Abstract base class for the backends of a ConversionCache.
+
+    A backend maps keys (strings of hexadecimal digits) to bytes. It may
+    drop any value at any time.
+    """
+
+    def get(self, key):
+        """Return the value stored under key, or None.
+
+        :type key: str
+        :rtype: bytes | None
+        """
+        return None
+
+    def set(self, key, value):
+        """Store a value under key.
+
+        :type key: str
+        :type value: bytes
+        """
+
+    def clear(self):
+        """Remove every value."""
+
+
+class MemoryCache(BaseCache):
+    """Keeps the values in memory, in least recently used order.
+
+    Safe to use from several threads. A copy sent to another process, e.g.
+    to the workers of a BatchConverter, starts empty.
+
+    :param max_size: Number of bytes of values kept at most. Once it is
+        exceeded, the least recently used values are dropped.
+    """
+
+    def __init__(self, max_size=DEFAULT_MEMORY_CACHE_SIZE):
+        self.max_size = max_size
+        self.size = 0
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._values)
+
+    def __reduce__(self):
+        return self.__class__, (self.max_size,)
+
+    def get(self, key):
+        with self._lock:
+            value = self._values.get(key)
+            if value is not None:
+                self._values.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        if len(value) > self.max_size:
+            return
+        with self._lock:
+            previous = self._values.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._values[key] = value
+            self.size += len(value)
+            while self.size > self.max_size:
+                _, dropped = self._values.popitem(last=False)
+                self.size -= len(dropped)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self.size = 0
+
+
+class DirectoryCache(BaseCache):
+    """Keeps the values in files, one per key, under a directory.
+
+    Several processes can share the directory: values are written to a
+    temporary file first, then renamed. Reading a value marks it as
+    recently used by touching its file.
+
+    :param path: The directory, created if missing.
+    :param max_size: Number of bytes of values kept at most. Once it is
+        exceeded, the least recently used files are removed until the
+        values take 10% less, so that the directory is not listed again
+        for every value stored.
+    """
+
+    def __init__(self, path, max_size=DEFAULT_DIRECTORY_CACHE_SIZE):
+        self.path = os.fspath(path)
+        self.max_size = max_size
+        # Bytes in the directory, counted when the first value is stored
+        self._size = None
+
+    def _path(self, key):
+        return os.path.join(self.path, key[:2], key)
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as value_file:
+                value = value_file.read()
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            # Owned by another user, or on a read-only file system
+            pass
+        return value
+
+    def set(self, key, value):
+        if len(value) > self.max_size:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary_path, "wb") as value_file:
+            value_file.write(value)
+        os.replace(temporary_path, path)
+
+        if self._size is None:
+            self._size = sum(size for _, _, size in self._files())
+        else:
+            self._size += len(value)
+        if self._size > self.max_size:
+            self._evict(self.max_size - self.max_size // 10)
+
+    def clear(self):
+        for path, _, _ in self._files():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self._size = 0
+
+    def _files(self):
+        """Return (path, last use, size) of the files of every value."""
+        files = []
+        try:
+            subdirectories = list(os.scandir(self.path))
+        except FileNotFoundError:
+            return files
+        for subdirectory in subdirectories:
+            if not subdirectory.is_dir():
+                continue
+            for entry in os.scandir(subdirectory.path):
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((entry.path, stat.st_mtime, stat.st_size))
+        return files
+
+    def _evict(self, size):
+        """Remove the least recently used files until the values take at
+        most size bytes.
+
+        The files are listed again, as other processes may have added or
+        removed some.
+        """
+        files = sorted(self._files(), key=lambda file: file[1])
+        self._size = sum(file_size for _, _, file_size in files)
+        for path, _, file_size in files:
+            if self._size <= size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._size -= file_size
+
+
+class ConversionCache:
+    """Caches the CaptionSets read from content, and the outputs written
+    from them, in a backend.
+
+    :param backend: A BaseCache, a new MemoryCache by default.
+    :param snapshots: If True (the default), also cache the parsed
+        caption sets, so that content is parsed once whatever the number
+        of formats it is converted to.
+
+    ``hits`` and ``misses`` count the lookups of outputs and caption sets.
+    """
+
+    def __init__(self, backend=None, snapshots=True):
+        self.backend = MemoryCache() if backend is None else backend
+        self.snapshots = snapshots
+        self.hits = 0
+        self.misses = 0
+
+    def source(self, content, caption_reader, **read_options):
+        """Return the cached source of content, read with caption_reader.
+
+        The content is hashed once, whatever the number of outputs then
+        written from the source.
+
+        :param content: Raw caption file content.
+        :param caption_reader: A BaseReader instance.
+        :param read_options: Keyword arguments of ``caption_reader.read()``,
+            e.g. ``lang`` or ``offset`` for SCCReader.
+        :rtype: CachedSource
+        """
+        return CachedSource(self, content, caption_reader, read_options)
+
+    def read(self, content, caption_reader, **read_options):
+        """Return the CaptionSet read from content, from the cache if
+        possible.
+
+        The CaptionSet is a new one every time: changing it does not
+        change the cache.
+
+        :rtype: CaptionSet
+        """
+        return self.source(content, caption_reader, **read_options).get_caption_set()
+
+    def convert(self, content, caption_reader, caption_writer, **read_options):
+        """Return the output of caption_writer for content, from the cache
+        if possible.
+
+        :param caption_writer: A BaseWriter instance.
+        :rtype: str
+        """
+        return self.source(content, caption_reader, **read_options).write(
+            caption_writer
+        )
+
+    def _get(self, key):
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+
+class CachedSource:
+    """Content to read with a reader, whose caption set and outputs are
+    looked up in a ConversionCache before being computed.
+
+    The content is only parsed when something is not in the cache, once
+    at most. Content that is neither a str nor bytes is not cached.
+    """
+
+    def __init__(self, cache, content, caption_reader, read_options):
+        self.cache = cache
+        self.content = content
+        self.caption_reader = caption_reader
+        self.read_options = read_options
+        self._caption_set = None
+        self._lock = threading.Lock()
+
+        if isinstance(content, str):
+            content = content.encode("utf-8", "surrogatepass")
+        if isinstance(content, bytes):
+            self._digest = hashlib.blake2b(content, digest_size=_DIGEST_SIZE)
+            self._reader_key = (
+                _get_version(),
+                _class_name(caption_reader),
+                _options(caption_reader),
+                sorted(read_options.items()),
+                DEFAULT_LANGUAGE_CODE,
+            )
+        else:
+            self._digest = None
+
+    def _key(self, *parts):
+        """Return the key of the content read with the reader, and parts."""
+        digest = self._digest.copy()
+        digest.update(repr((self._reader_key, parts)).encode("utf-8", "replace"))
+        return digest.hexdigest()
+
+    def get_caption_set(self):
+        """Return the CaptionSet read from the content.
+
+        It is read once, the same CaptionSet is returned afterwards.
+
+        :rtype: CaptionSet
+        """
+        with self._lock:
+            if self._caption_set is None:
+                self._caption_set = self._load_caption_set()
+            return self._caption_set
+
+    def _load_caption_set(self):
+        if self._digest is None or not self.cache.snapshots:
+            return self._read()
+        key = self._key("caption_set")
+        snapshot = self.cache._get(key)
+        if snapshot is not None:
+            try:
+                return load_snapshot(snapshot)
+            except CaptionReadError:
+                # Written by another version of the snapshot format
+                pass
+        caption_set = self._read()
+        try:
+            snapshot = dump_snapshot(caption_set)
+        except TypeError:
+            # Holds values that snapshots do not support
+            return caption_set
+        self.cache.backend.set(key, snapshot)
+        return caption_set
+
+    def write(self, caption_writer):
+        """Return the output of caption_writer for the content.
+
+        :param caption_writer: A BaseWriter instance.
+        :rtype: str
+        """
+        if self._digest is None:
+            return caption_writer.write(self._read())
+        key = self._key("output", _class_name(caption_writer), _options(caption_writer))
+        output = self.cache._get(key)
+        if output is not None:
+            return output.decode("utf-8", "surrogatepass")
+        output = caption_writer.write(self.get_caption_set())
+        if isinstance(output, str):
+            self.cache.backend.set(key, output.encode("utf-8", "surrogatepass"))
+        return output
+
+    def _read(self):
+        return self.caption_reader.read(self.content, **self.read_options)
+
+
+def _class_name(instance):
+    cls = instance.__class__
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _options(instance):
+    """Return the options of a reader or writer that change its results."""
+    return [
+        (name, getattr(instance, name, None))
+        for name in getattr(instance, "CACHE_OPTIONS", ())
+    ]
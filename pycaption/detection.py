@@ -0,0 +1,141 @@
+"""Caption format detection that only looks at a bounded part of the content.
+
+Every reader has a ``detect()`` method, but most of them lowercase or split
+the whole content, which copies multi-megabyte files several times just to
+find out what they are. ``sniff_format`` applies the same rules to the first
+``SNIFF_SIZE`` characters of the content (plus a short tail, where a TTML
+document closes its root element) and classifies it in one pass.
+
+The DFXP and SAMI readers, which need BeautifulSoup, lxml and cssutils,
+are only imported when the content is found to be in their format.
+"""
+
+import re
+from importlib import import_module
+
+from .exceptions import InvalidInputError
+from .microdvd import MicroDVDReader
+from .scc import SCCReader
+from .scc.constants import HEADER as SCC_HEADER
+from .srt import SRTReader
+from .webvtt import WebVTTReader
+
+#: Number of characters from the start of the content that are inspected
+SNIFF_SIZE = 64 * 1024
+#: Number of characters from the end of the content searched for ``</tt>``
+TAIL_SIZE = 4 * 1024
+
+#: The content starts with the signature its format mandates
+CERTAIN = 1.0
+#: The content has the structure of a format that has no signature
+LIKELY = 0.75
+#: Only part of the expected structure was found, e.g. a truncated document
+POSSIBLE = 0.25
+
+_BOM = "\ufeff"
+# Line boundaries as recognized by str.splitlines()
+_LINE_RE = re.compile(
+    r"([^\n\r\v\f\x1c-\x1e\x85\u2028\u2029]*)"
+    r"(\r\n|[\n\r\v\f\x1c-\x1e\x85\u2028\u2029])?"
+)
+_MICRODVD_RE = re.compile(r"{\d+}{\d+}")
+_TT_OPEN_RE = re.compile(r"<tt[\s>]", re.IGNORECASE | re.ASCII)
+_TT_CLOSE_RE = re.compile(r"</tt>", re.IGNORECASE | re.ASCII)
+_SAMI_RE = re.compile(r"<sami", re.IGNORECASE | re.ASCII)
+
+# Modules of the readers imported on first use, by reader name
+_LAZY_READERS = {"DFXPReader": ".dfxp", "SAMIReader": ".sami"}
+
+
+def _first_lines(content, count, endpos, pos=0):
+    """Return up to count lines of content from pos, without line breaks.
+
+    A line that is still going on at endpos is returned as None, since its
+    actual value is unknown.
+    """
+    lines = []
+    while len(lines) < count and pos < min(endpos, len(content)):
+        match = _LINE_RE.match(content, pos, endpos)
+        if not match.group(2) and match.end() < len(content):
+            lines.append(None)
+            break
+        lines.append(match.group(1))
+        pos = match.end()
+    return lines
+
+
+def _is_webvtt_header(line):
+    return line is not None and (
+        line == "WEBVTT" or line.startswith("WEBVTT ") or line.startswith("WEBVTT\t")
+    )
+
+
+def _dfxp_confidence(content, size):
+    if not _TT_OPEN_RE.search(content, 0, size):
+        return 0.0
+    if len(content) <= size + TAIL_SIZE:
+        closed = _TT_CLOSE_RE.search(content)
+    else:
+        closed = _TT_CLOSE_RE.search(content, 0, size) or _TT_CLOSE_RE.search(
+            content, len(content) - TAIL_SIZE
+        )
+    return CERTAIN if closed else POSSIBLE
+
+
+def sniff_format(content, size=SNIFF_SIZE):
+    """Guess the caption format of content from its first characters.
+
+    The rules are those of the readers' ``detect()`` methods. When several
+    formats match, the one with the highest confidence is returned; ties go
+    to the format that ``detect_format`` used to try first.
+
+    :param content: Raw caption file content.
+    :type content: str
+    :param size: Number of leading characters to inspect.
+    :type size: int
+    :returns: The reader class of the most likely format and the confidence
+        of the guess, from 0 to 1, or ``(None, 0.0)`` if nothing matches.
+    :rtype: tuple
+    :raises InvalidInputError: if content is not a string.
+    """
+    if not isinstance(content, str):
+        raise InvalidInputError("The content is not a unicode string.")
+
+    lines = _first_lines(content, 2, size)
+    first_line = lines[0] if lines else ""
+    second_line = lines[1] if len(lines) > 1 else None
+    if content.startswith(_BOM):
+        webvtt_lines = _first_lines(content, 1, size, pos=1)
+    else:
+        webvtt_lines = lines
+
+    candidates = (
+        ("DFXPReader", _dfxp_confidence(content, size)),
+        (MicroDVDReader, LIKELY if _MICRODVD_RE.match(content, 0, size) else 0.0),
+        (
+            WebVTTReader,
+            CERTAIN if webvtt_lines and _is_webvtt_header(webvtt_lines[0]) else 0.0,
+        ),
+        ("SAMIReader", LIKELY if _SAMI_RE.search(content, 0, size) else 0.0),
+        (
+            SRTReader,
+            (
+                LIKELY
+                if first_line
+                and first_line.isdigit()
+                and second_line
+                and "-->" in second_line
+                else 0.0
+            ),
+        ),
+        (SCCReader, CERTAIN if first_line == SCC_HEADER else 0.0),
+    )
+
+    best_reader, best_confidence = None, 0.0
+    for reader, confidence in candidates:
+        if confidence > best_confidence:
+            best_reader, best_confidence = reader, confidence
+    if best_reader in _LAZY_READERS:
+        module = import_module(_LAZY_READERS[best_reader], __package__)
+        best_reader = getattr(module, best_reader)
+    return best_reader, best_confidence
@@ -1,6 +1,7 @@
 """DFXP/TTML caption format reader and writer package.
 
-Provides DFXPReader for parsing DFXP/TTML files into CaptionSet objects,
+Provides DFXPReader for parsing DFXP/TTML files into CaptionSet objects
+(and StreamingDFXPReader, its incremental lxml based counterpart),
 DFXPWriter for serializing CaptionSet objects to DFXP/TTML, and legacy/
 single-positioning writer variants.
 """
@@ -19,4 +20,5 @@ from .constants import (  # noqa: F401
 )
 from .extras import LegacyDFXPWriter, SinglePositioningDFXPWriter  # noqa: F401
 from .reader import DFXPReader  # noqa: F401
+from .streaming import StreamingDFXPReader  # noqa: F401
 from .writer import DFXPWriter  # noqa: F401
@@ -9,7 +9,7 @@ from xml.sax.saxutils import escape
 
 from bs4 import BeautifulSoup
 
-from ..base import BaseWriter, CaptionNode, merge_concurrent_captions
+from ..base import BaseWriter, CaptionList, CaptionNode, merge_concurrent_captions
 from .constants import DFXP_DEFAULT_REGION
 from .writer import DFXPWriter
 
@@ -39,6 +39,8 @@ LEGACY_DFXP_DEFAULT_REGION = {"text-align": "center", "display-align": "after"}
 class SinglePositioningDFXPWriter(DFXPWriter):
     """DFXP writer that overrides all positioning with a single Layout value."""
 
+    CACHE_OPTIONS = DFXPWriter.CACHE_OPTIONS + ("default_positioning",)
+
     def __init__(self, default_positioning=DFXP_DEFAULT_REGION, *args, **kwargs):
         """
         :param default_positioning: the Layout to apply to every element
@@ -61,30 +63,38 @@ class SinglePositioningDFXPWriter(DFXPWriter):
 
     @staticmethod
     def _create_single_positioning_caption_set(caption_set, positioning):
-        """Return a deep copy of caption_set with all positioning replaced.
+        """Return a copy of caption_set with all positioning replaced.
 
         :type caption_set: CaptionSet
         :param positioning: the Layout to assign to every element
         :rtype: CaptionSet
         """
-        caption_set = deepcopy(caption_set)
-        caption_set = merge_concurrent_captions(caption_set)
+        caption_set = merge_concurrent_captions(caption_set.copy())
         caption_set.layout_info = positioning
 
         for lang in caption_set.get_languages():
-            caption_set.set_layout_info(lang, positioning)
-
-            caption_list = caption_set.get_captions(lang)
-            for caption in caption_list:
-                caption.layout_info = positioning
-
-                for node in caption.nodes:
-                    if hasattr(node, "layout_info"):
-                        node.layout_info = positioning
-
-        for _, style in caption_set.get_styles():
-            if "text-align" in style:
-                style.pop("text-align")
+            caption_list = CaptionList(
+                [
+                    caption.copy(
+                        layout_info=positioning,
+                        nodes=[
+                            node.copy(layout_info=positioning) for node in caption.nodes
+                        ],
+                    )
+                    for caption in caption_set.get_captions(lang)
+                ],
+                layout_info=positioning,
+            )
+            caption_set.set_captions(lang, caption_list)
+
+        caption_set.set_styles(
+            {
+                style_id: {
+                    key: value for key, value in style.items() if key != "text-align"
+                }
+                for style_id, style in caption_set.get_styles()
+            }
+        )
 
         return caption_set
 
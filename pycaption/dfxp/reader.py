@@ -63,6 +63,8 @@ class DFXPReader(BaseReader):
     styles, and region-based positioning (via LayoutAwareDFXPParser).
     """
 
+    CACHE_OPTIONS = ("read_invalid_positioning",)
+
     def __init__(self, *args, **kw):
         """
         :param read_invalid_positioning: if True, read positioning attributes
@@ -129,6 +131,39 @@ class DFXPReader(BaseReader):
         )
 
         tt_attrs = dfxp_document.tt.attrs if dfxp_document.tt else {}
+        self._set_timebase(tt_attrs)
+
+        caption_dict = {}
+        style_dict = {}
+
+        default_language = tt_attrs.get(DFXP_ATTR_XML_LANG, DEFAULT_LANGUAGE_CODE)
+
+        for div in dfxp_document.find_all("div"):
+            lang = div.attrs.get(DFXP_ATTR_XML_LANG, default_language)
+            caption_dict[lang] = self._convert_div_to_caption_list(div)
+
+        for style in dfxp_document.find_all("style"):
+            id_ = style.attrs.get(DFXP_ATTR_XML_ID) or style.attrs.get("id")
+            if id_:
+                # Styles nested inside <region> tags are region-scoped and
+                # should not appear as document-level styles.
+                if "region" not in [parent_.name for parent_ in style.parents]:
+                    style_dict[id_] = self._convert_style(style)
+
+        caption_set = CaptionSet(caption_dict, styles=style_dict)
+
+        if caption_set.is_empty():
+            raise CaptionReadNoCaptions("empty caption file")
+
+        return caption_set
+
+    def _set_timebase(self, tt_attrs):
+        """Set the frame and tick rates from the attributes of the <tt> element.
+
+        :param tt_attrs: attributes of the <tt> element, with lowercased names
+        :type tt_attrs: dict
+        :raises CaptionReadSyntaxError: if a timing parameter is malformed
+        """
         framerate_str = tt_attrs.get("ttp:framerate", str(DFXP_DEFAULT_FRAMERATE))
         multiplier_str = tt_attrs.get(
             "ttp:frameratemultiplier", DFXP_DEFAULT_FRAMERATE_MULTIPLIER
@@ -168,30 +203,6 @@ class DFXPReader(BaseReader):
                 )
             self.tickrate = float(framerate_int * sub_framerate)
 
-        caption_dict = {}
-        style_dict = {}
-
-        default_language = tt_attrs.get(DFXP_ATTR_XML_LANG, DEFAULT_LANGUAGE_CODE)
-
-        for div in dfxp_document.find_all("div"):
-            lang = div.attrs.get(DFXP_ATTR_XML_LANG, default_language)
-            caption_dict[lang] = self._convert_div_to_caption_list(div)
-
-        for style in dfxp_document.find_all("style"):
-            id_ = style.attrs.get(DFXP_ATTR_XML_ID) or style.attrs.get("id")
-            if id_:
-                # Styles nested inside <region> tags are region-scoped and
-                # should not appear as document-level styles.
-                if "region" not in [parent_.name for parent_ in style.parents]:
-                    style_dict[id_] = self._convert_style(style)
-
-        caption_set = CaptionSet(caption_dict, styles=style_dict)
-
-        if caption_set.is_empty():
-            raise CaptionReadNoCaptions("empty caption file")
-
-        return caption_set
-
     def _convert_div_to_caption_list(self, div):
         """Convert a <div> element into a CaptionList for one language.
 
@@ -417,45 +428,20 @@ class DFXPReader(BaseReader):
         return attrs
 
 
-class LayoutAwareDFXPParser(BeautifulSoup):
-    """BeautifulSoup subclass that adds a layout_info attribute to every node.
+class _LayoutResolver:
+    """Resolves the region and positioning of DFXP elements.
 
-    Traverses the element tree in pre-order as dictated by the DFXP style
-    resolution spec, resolving region associations and positioning for each
-    element.
+    Shared by the DFXP parsers; the host class provides
+    ``read_invalid_positioning`` and the lookups used here and by
+    LayoutInfoScraper:
+
+    - ``get_root()``: the <tt> element;
+    - ``get_region(region_id)``: the <region> with this xml:id, or None;
+    - ``get_styling()``: the <styling> element, or None.
     """
 
     NO_POSITIONING_INFO = None
 
-    def __init__(
-        self,
-        markup="",
-        features="html.parser",
-        builder=None,
-        parse_only=None,
-        from_encoding=None,
-        read_invalid_positioning=False,
-        **kwargs,
-    ):
-        """Parse DFXP markup and attach layout_info to every element.
-
-        Uses html.parser (forgiving with malformed XML like unescaped '<')
-        rather than 'xml' (destroys entities) or 'lxml' (strict).
-        Manually replaces &apos; since html.parser only supports HTML4 entities.
-
-        :type read_invalid_positioning: bool
-        :param read_invalid_positioning: if True, also read positioning
-            attributes directly on elements (non-standard placement)
-        """
-        markup = markup.replace("&apos;", "'")
-
-        super().__init__(markup, features, builder, parse_only, from_encoding, **kwargs)
-
-        self.read_invalid_positioning = read_invalid_positioning
-
-        for div in self.find_all("div"):
-            self._pre_order_visit(div)
-
     def _pre_order_visit(self, element, inherit_from=None):
         """Attach a layout_info attribute to every element in pre-order.
 
@@ -556,7 +542,7 @@ class LayoutAwareDFXPParser(BeautifulSoup):
         region_tag = None
 
         if region_id is not None:
-            region_tag = self.find("region", {DFXP_ATTR_XML_ID: region_id})
+            region_tag = self.get_region(region_id)
 
         region_scraper = LayoutInfoScraper(self, region_tag)
 
@@ -577,6 +563,56 @@ class LayoutAwareDFXPParser(BeautifulSoup):
             return self.NO_POSITIONING_INFO
 
 
+class LayoutAwareDFXPParser(_LayoutResolver, BeautifulSoup):
+    """BeautifulSoup subclass that adds a layout_info attribute to every node.
+
+    Traverses the element tree in pre-order as dictated by the DFXP style
+    resolution spec, resolving region associations and positioning for each
+    element.
+    """
+
+    def __init__(
+        self,
+        markup="",
+        features="html.parser",
+        builder=None,
+        parse_only=None,
+        from_encoding=None,
+        read_invalid_positioning=False,
+        **kwargs,
+    ):
+        """Parse DFXP markup and attach layout_info to every element.
+
+        Uses html.parser (forgiving with malformed XML like unescaped '<')
+        rather than 'xml' (destroys entities) or 'lxml' (strict).
+        Manually replaces &apos; since html.parser only supports HTML4 entities.
+
+        :type read_invalid_positioning: bool
+        :param read_invalid_positioning: if True, also read positioning
+            attributes directly on elements (non-standard placement)
+        """
+        markup = markup.replace("&apos;", "'")
+
+        super().__init__(markup, features, builder, parse_only, from_encoding, **kwargs)
+
+        self.read_invalid_positioning = read_invalid_positioning
+
+        for div in self.find_all("div"):
+            self._pre_order_visit(div)
+
+    def get_root(self):
+        """Return the <tt> element."""
+        return self.find("tt")
+
+    def get_region(self, region_id):
+        """Return the <region> element with this xml:id, or None."""
+        return self.find("region", {DFXP_ATTR_XML_ID: region_id})
+
+    def get_styling(self):
+        """Return the <styling> element, or None."""
+        return self.findChild("styling")
+
+
 class LayoutInfoScraper:
     """Resolves positioning attributes (origin, extent, padding, alignment)
     for a DFXP element by inspecting its region, referenced styles, and
@@ -585,17 +621,17 @@ class LayoutInfoScraper:
 
     def __init__(self, document, region=None):
         """
-        :param document: the BeautifulSoup document instance, of which `region`
-            is a descendant
+        :param document: the parsed document (a _LayoutResolver, such as
+            LayoutAwareDFXPParser), of which `region` is a descendant
         :param region: the region tag
         """
         self.region = region
-        self._styling_section = document.findChild("styling")
+        self._styling_section = document.get_styling()
         if region:
             self.region_styles = self._get_style_sources(self._styling_section, region)
         else:
             self.region_styles = []
-        self.root_element = document.find("tt")
+        self.root_element = document.get_root()
 
     @classmethod
     def _get_style_sources(cls, styling_section, element):
@@ -0,0 +1,514 @@
+"""Streaming DFXP/TTML caption reader built on lxml.
+
+StreamingDFXPReader feeds the document to an incremental lxml parser and
+converts every <p> as soon as it is closed, then discards it, so only the
+head of the document and the captions themselves are kept in memory. Styles,
+regions and positioning are resolved with the same rules as DFXPReader.
+"""
+
+import re
+from html.entities import name2codepoint
+
+from bs4 import Comment, NavigableString
+from lxml import etree
+
+from ..base import DEFAULT_LANGUAGE_CODE, CaptionList, CaptionSet
+from ..exceptions import (
+    CaptionReadNoCaptions,
+    CaptionReadSyntaxError,
+    InvalidInputError,
+)
+from .constants import DFXP_ATTR_XML_ID, DFXP_ATTR_XML_LANG
+from .reader import DFXPReader, _LayoutResolver
+
+_XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+_ASCII_SPACES = " \n\t\f\r"
+_XML_ENTITIES = frozenset(("amp", "lt", "gt", "quot", "apos"))
+
+# Markup characters html.parser keeps as text but XML rejects
+_BARE_LT_RE = re.compile(r"<(?![A-Za-z_:/!?])")
+_REFERENCE_RE = re.compile(r"&(?:(#[0-9]+|#[xX][0-9a-fA-F]+|[A-Za-z][A-Za-z0-9]*);)?")
+_START_TAG_RE = re.compile(r"<([A-Za-z_][^\s/>]*)(\s[^<>]*?)?(/?)>")
+_ATTRIBUTE_RE = re.compile(r"""([^\s=/>]+)(?:\s*=\s*("[^"]*"|'[^']*'|[^\s"'>]+))?""")
+# Longest entity reference the lenient mode has to see whole
+_LOOKAHEAD = 40
+
+
+class StreamingDFXPReader(DFXPReader):
+    """Reads DFXP/TTML caption files incrementally with lxml.
+
+    Produces the same CaptionSet as DFXPReader for well-formed documents
+    whose <styling> and <layout> sections come before the <body>, as the
+    TTML specification requires, while using a fraction of its time and
+    memory on large files.
+    """
+
+    #: number of characters fed to the parser at a time
+    CHUNK_SIZE = 64 * 1024
+
+    CACHE_OPTIONS = DFXPReader.CACHE_OPTIONS + ("recover",)
+
+    def __init__(self, *args, **kw):
+        """
+        :param read_invalid_positioning: see DFXPReader
+        :param recover: if True, read malformed XML leniently: stray "<" and
+            "&" characters and HTML entities are kept as text, as DFXPReader
+            does, and lxml recovers from broken markup instead of raising
+            CaptionReadSyntaxError.
+        """
+        super().__init__(*args, **kw)
+        self.recover = kw.get("recover", False)
+
+    def read(self, content):
+        """Parse a DFXP/TTML string into a CaptionSet.
+
+        :type content: str
+        :rtype: CaptionSet
+        :raises InvalidInputError: if content is not a string
+        :raises CaptionReadSyntaxError: if content is not well-formed XML
+            and recover is False
+        :raises CaptionReadNoCaptions: if no captions are found
+        """
+        if not isinstance(content, str):
+            raise InvalidInputError("The content is not a unicode string.")
+        return self.read_stream(
+            content[i : i + self.CHUNK_SIZE]
+            for i in range(0, len(content), self.CHUNK_SIZE)
+        )
+
+    def read_stream(self, stream):
+        """Parse a DFXP/TTML document from a text stream into a CaptionSet.
+
+        The stream is read in CHUNK_SIZE pieces, so the document itself never
+        has to fit in memory::
+
+            with open("captions.ttml", encoding="utf-8") as ttml_file:
+                caption_set = StreamingDFXPReader().read_stream(ttml_file)
+
+        :param stream: a text file object, or any iterable of strings
+        :rtype: CaptionSet
+        :raises InvalidInputError: if the stream yields something else than
+            strings
+        :raises CaptionReadSyntaxError: if the document is not well-formed
+            XML and recover is False
+        :raises CaptionReadNoCaptions: if no captions are found
+        """
+        document = _StreamingDocument(self)
+        divs = []
+        for div, caption in document.parse(_iter_chunks(stream, self.CHUNK_SIZE)):
+            if caption is None:
+                divs.append(div)
+
+        # Like DFXPReader, every <div> is a caption list and a later <div>
+        # (in document order) replaces an earlier one with the same language.
+        caption_dict = {}
+        for div in sorted(divs, key=lambda div: div.index):
+            caption_dict[div.lang] = CaptionList(div.captions, div.element.layout_info)
+
+        caption_set = CaptionSet(caption_dict, styles=document.styles)
+        if caption_set.is_empty():
+            raise CaptionReadNoCaptions("empty caption file")
+        return caption_set
+
+    def iter_captions(self, stream):
+        """Yield the captions of a DFXP/TTML document as they are parsed.
+
+        Nothing is accumulated: this is the way to process documents too
+        large for a CaptionSet. Captions are yielded in document order, with
+        the language of the innermost <div> containing them.
+
+        :param stream: a text file object, or any iterable of strings
+        :rtype: Iterator[tuple[str, Caption]]
+        :raises InvalidInputError: if the stream yields something else than
+            strings
+        :raises CaptionReadSyntaxError: if the document is not well-formed
+            XML and recover is False
+        """
+        document = _StreamingDocument(self, keep_captions=False)
+        for div, caption in document.parse(_iter_chunks(stream, self.CHUNK_SIZE)):
+            if caption is not None:
+                yield div.lang, caption
+
+
+def _iter_chunks(stream, size):
+    """Iterate over the text of stream in chunks of at most size characters."""
+    read = getattr(stream, "read", None)
+    if read is None:
+        chunks = stream
+    else:
+        chunks = iter(lambda: read(size), "")
+
+    started = False
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            raise InvalidInputError("The content is not a unicode string.")
+        if not started:
+            # Like html.parser, accept whitespace before the XML declaration
+            chunk = chunk.lstrip()
+            started = bool(chunk)
+        yield chunk
+
+
+def _escape_reference(match):
+    """Keep XML references, decode HTML entities and escape anything else."""
+    reference = match.group(1)
+    if reference is None:
+        return "&amp;"
+    if reference[0] == "#" or reference in _XML_ENTITIES:
+        return match.group()
+    if reference in name2codepoint:
+        return chr(name2codepoint[reference])
+    return f"&amp;{reference};"
+
+
+def _normalize_start_tag(match):
+    """Quote attribute values and drop repeated attributes, keeping the last.
+
+    libxml2 stops decoding references for the rest of the document once it
+    has recovered from an error, so these are better fixed beforehand.
+    """
+    if match.group(2) is None:
+        return match.group()
+    attributes = {}
+    changed = False
+    for name, value in _ATTRIBUTE_RE.findall(match.group(2)):
+        if not value or value[0] not in "\"'" or name in attributes:
+            changed = True
+        if value and value[0] in "\"'":
+            value = value[1:-1]
+        attributes[name] = value.replace('"', "&quot;")
+    if not changed:
+        return match.group()
+    rebuilt = "".join(f' {name}="{value}"' for name, value in attributes.items())
+    return f"<{match.group(1)}{rebuilt}{match.group(3)}>"
+
+
+def _make_well_formed(text):
+    text = _BARE_LT_RE.sub("&lt;", text)
+    text = _REFERENCE_RE.sub(_escape_reference, text)
+    return _START_TAG_RE.sub(_normalize_start_tag, text)
+
+
+def _iter_lenient_chunks(chunks):
+    """Fix up the markup html.parser accepts but XML rejects, chunk by chunk.
+
+    The end of a chunk is held back when it could be the beginning of a tag
+    or an entity reference continued in the next chunk.
+    """
+    pending = ""
+    for chunk in chunks:
+        chunk = pending + chunk
+        cut = len(chunk)
+        tag_start = chunk.rfind("<")
+        if tag_start >= 0 and chunk.find(">", tag_start) < 0:
+            cut = tag_start
+        reference_start = chunk.rfind("&", len(chunk) - _LOOKAHEAD)
+        if reference_start >= 0 and chunk.find(";", reference_start) < 0:
+            cut = min(cut, reference_start)
+        chunk, pending = chunk[:cut], chunk[cut:]
+        yield _make_well_formed(chunk)
+    if pending:
+        yield _make_well_formed(pending)
+
+
+class _Element:
+    """The subset of the BeautifulSoup Tag interface DFXPReader relies on.
+
+    Element names are local names and attribute names keep the prefix used
+    in the document, both lowercased, as html.parser reports them.
+    """
+
+    __slots__ = ("name", "attrs", "parent", "contents", "layout_info", "regions")
+
+    def __init__(self, name, attrs, parent):
+        self.name = name
+        self.attrs = attrs
+        self.parent = parent
+        self.contents = []
+        self.layout_info = None
+        # region of every descendant element, see _get_region_from_descendants
+        self.regions = set()
+
+    def __bool__(self):
+        return True
+
+    def __getitem__(self, key):
+        return self.attrs[key]
+
+    def __str__(self):
+        attrs = "".join(f' {key}="{value}"' for key, value in self.attrs.items())
+        return f"<{self.name}{attrs}>{self.get_text()}</{self.name}>"
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    def has_attr(self, key):
+        return key in self.attrs
+
+    @property
+    def parents(self):
+        parent = self.parent
+        while parent is not None:
+            yield parent
+            parent = parent.parent
+
+    def get_text(self):
+        return "".join(
+            child.get_text() if isinstance(child, _Element) else child
+            for child in self.contents
+            if not isinstance(child, Comment)
+        )
+
+    def find_all(self, name=None, attrs=None):
+        """Return the descendant elements matching name and attrs."""
+        found = []
+        for child in self.contents:
+            if not isinstance(child, _Element):
+                continue
+            if (name is None or child.name == name) and (
+                not attrs
+                or all(child.attrs.get(key) == value for key, value in attrs.items())
+            ):
+                found.append(child)
+            found.extend(child.find_all(name, attrs))
+        return found
+
+    findAll = findChildren = find_all
+
+    def find(self, name=None, attrs=None):
+        found = self.find_all(name, attrs)
+        return found[0] if found else None
+
+    findChild = find
+
+
+class _Div:
+    """A <div> being read: its language and the captions found inside it."""
+
+    __slots__ = ("index", "lang", "element", "captions")
+
+    def __init__(self, index, lang, element):
+        self.index = index
+        self.lang = lang
+        self.element = element
+        self.captions = []
+
+
+class _StreamingDocument(_LayoutResolver):
+    """Incremental counterpart of LayoutAwareDFXPParser.
+
+    Elements outside of <p> are kept as _Element objects without their text
+    (the head and the <div> structure); every <p> is converted to a Caption
+    as soon as it ends and then dropped, both from this tree and from lxml's.
+    """
+
+    def __init__(self, reader, keep_captions=True):
+        """
+        :type reader: StreamingDFXPReader
+        :param keep_captions: if False, captions are only yielded by parse,
+            not collected in the _Div objects
+        """
+        self.reader = reader
+        self.read_invalid_positioning = reader.read_invalid_positioning
+        self.keep_captions = keep_captions
+        self.root = None
+        self.styling = None
+        self.regions = {}
+        self.styles = {}
+        self.default_language = DEFAULT_LANGUAGE_CODE
+        self._prefixes = {_XML_NAMESPACE: "xml"}
+        self._stack = []
+        self._divs = []
+        self._div_count = 0
+        self._paragraph = None
+        reader._set_timebase({})
+
+    # Lookups used by _LayoutResolver and LayoutInfoScraper
+    def get_root(self):
+        return self.root
+
+    def get_region(self, region_id):
+        return self.regions.get(region_id)
+
+    def get_styling(self):
+        return self.styling
+
+    @staticmethod
+    def _get_region_from_descendants(element):
+        if isinstance(element, NavigableString):
+            return None
+        if len(element.regions) > 1:
+            raise LookupError
+        if element.regions:
+            return next(iter(element.regions))
+        return None
+
+    def parse(self, chunks):
+        """Parse the document, yielding (div, caption) pairs.
+
+        A caption is yielded with its innermost <div> as soon as its <p>
+        ends, and every <div> is yielded with a None caption when it ends.
+
+        :param chunks: iterable of strings
+        :rtype: Iterator[tuple[_Div, Caption | None]]
+        :raises CaptionReadSyntaxError: if the XML is malformed
+        """
+        recover = self.reader.recover
+        if recover:
+            chunks = _iter_lenient_chunks(chunks)
+        parser = etree.XMLPullParser(events=("start", "end"), recover=recover)
+        try:
+            for chunk in chunks:
+                parser.feed(chunk)
+                yield from self._handle_events(parser.read_events())
+            parser.close()
+        except etree.XMLSyntaxError as err:
+            raise CaptionReadSyntaxError(err)
+        yield from self._handle_events(parser.read_events())
+
+    def _handle_events(self, events):
+        for event, node in events:
+            if self._paragraph is not None:
+                # The content of a <p> is converted all at once, on its end
+                if node is self._paragraph and event == "end":
+                    yield from self._end_paragraph(node)
+                continue
+
+            if event == "end":
+                yield from self._end_element(node)
+            elif _local_name(node.tag) == "p":
+                self._paragraph = node
+            else:
+                self._start_element(node)
+
+    def _start_element(self, node):
+        parent = self._stack[-1] if self._stack else None
+        element = _Element(_local_name(node.tag), self._attributes(node), parent)
+        self._stack.append(element)
+
+        if element.name == "tt" and self.root is None:
+            self.root = element
+            self.reader._set_timebase(element.attrs)
+            self.default_language = element.get(
+                DFXP_ATTR_XML_LANG, DEFAULT_LANGUAGE_CODE
+            )
+        elif element.name == "div":
+            lang = element.get(DFXP_ATTR_XML_LANG, self.default_language)
+            self._divs.append(_Div(self._div_count, lang, element))
+            self._div_count += 1
+
+    def _end_element(self, node):
+        element = self._stack.pop()
+        if element.parent is not None:
+            element.parent.contents.append(element)
+            _add_descendant_regions(element.parent, element)
+
+        if element.name == "styling":
+            if self.styling is None:
+                self.styling = element
+        elif element.name == "region":
+            region_id = element.get(DFXP_ATTR_XML_ID)
+            if region_id is not None:
+                self.regions.setdefault(region_id, element)
+        elif element.name == "style":
+            self._add_style(element)
+        elif element.name == "div":
+            element.layout_info = self._extract_positioning_information(
+                self._determine_region_id(element), element
+            )
+            yield self._divs.pop(), None
+
+        _release(node)
+
+    def _end_paragraph(self, node):
+        self._paragraph = None
+        parent = self._stack[-1] if self._stack else None
+        p_tag = self._convert_node(node, parent)
+        _release(node)
+        if parent is not None:
+            _add_descendant_regions(parent, p_tag)
+        for style in p_tag.find_all("style"):
+            self._add_style(style)
+
+        # Like DFXPReader, paragraphs outside of a <div> are ignored
+        if not self._divs or not p_tag.get_text().strip():
+            return
+        self._pre_order_visit(p_tag)
+        caption = self.reader._convert_p_tag_to_caption(p_tag)
+        if caption is None:
+            return
+        if self.keep_captions:
+            for div in self._divs:
+                div.captions.append(caption)
+        yield self._divs[-1], caption
+
+    def _add_style(self, style):
+        id_ = style.get(DFXP_ATTR_XML_ID) or style.get("id")
+        # Styles nested inside <region> tags are region-scoped
+        if id_ and all(parent.name != "region" for parent in style.parents):
+            self.styles[id_] = self.reader._convert_style(style)
+
+    def _convert_node(self, node, parent):
+        """Convert an lxml element and its content to _Element objects."""
+        element = _Element(_local_name(node.tag), self._attributes(node), parent)
+        contents = element.contents
+        if node.text:
+            contents.append(_string(node.text, element))
+        for child in node:
+            if isinstance(child.tag, str):
+                child_element = self._convert_node(child, element)
+                contents.append(child_element)
+                _add_descendant_regions(element, child_element)
+            elif child.tag is etree.Comment:
+                contents.append(_string(child.text or "", element, Comment))
+            if child.tail:
+                contents.append(_string(child.tail, element))
+        return element
+
+    def _attributes(self, node):
+        """Return the attributes of node named as html.parser names them."""
+        attrs = {}
+        for key, value in node.items():
+            if key[0] == "{":
+                namespace, _, key = key[1:].partition("}")
+                prefix = self._prefixes.get(namespace)
+                if prefix is None:
+                    prefix = self._prefixes[namespace] = next(
+                        (
+                            prefix
+                            for prefix, uri in node.nsmap.items()
+                            if uri == namespace and prefix
+                        ),
+                        "",
+                    )
+                if prefix:
+                    key = f"{prefix}:{key}"
+            attrs[key.lower()] = value
+        return attrs
+
+
+def _local_name(tag):
+    return tag.rpartition("}")[2].lower()
+
+
+def _string(text, parent, string_class=NavigableString):
+    # BeautifulSoup collapses whitespace-only strings, DFXPReader relies on it
+    if not text.strip(_ASCII_SPACES):
+        text = "\n" if "\n" in text else " "
+    string = string_class(text)
+    string.parent = parent
+    return string
+
+
+def _add_descendant_regions(element, child):
+    element.regions.update(child.regions)
+    element.regions.add(child.get("region"))
+
+
+def _release(node):
+    """Free an lxml element and its preceding siblings once they are read."""
+    node.clear()
+    parent = node.getparent()
+    if parent is not None:
+        while node.getprevious() is not None:
+            del parent[0]
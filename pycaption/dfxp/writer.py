@@ -4,8 +4,7 @@ Serializes pycaption CaptionSet objects into DFXP/TTML XML documents,
 including style elements, region-based positioning, and writing direction.
 """
 
-from copy import deepcopy
-from xml.sax.saxutils import escape
+from xml.sax.saxutils import escape, quoteattr
 
 from bs4 import BeautifulSoup
 
@@ -28,6 +27,16 @@ _WRITING_DIRECTION_TO_DFXP = {
     WritingDirectionEnum.VERTICAL_LR: "tblr",
 }
 
+# Namespace declarations of the <tt> element, as in DFXP_BASE_MARKUP
+_TT_NAMESPACES = {
+    "xmlns": "http://www.w3.org/ns/ttml",
+    "xmlns:tts": "http://www.w3.org/ns/ttml#styling",
+}
+
+_XML_DECLARATION = '<?xml version="1.0" encoding="utf-8"?>\n'
+
+_SERIALIZERS = ("tree", "text")
+
 
 class DFXPWriter(BaseWriter):
     """Converts a CaptionSet to DFXP/TTML format.
@@ -37,13 +46,31 @@ class DFXPWriter(BaseWriter):
     and region-based positioning.
     """
 
+    CACHE_OPTIONS = BaseWriter.CACHE_OPTIONS + (
+        "write_inline_positioning",
+        "serializer",
+        "pretty_print",
+    )
+
     def __init__(self, *args, **kwargs):
         """
         :param write_inline_positioning: if True, positioning attributes are
             written directly on <p> and <span> elements in addition to the
             region reference.
+        :param serializer: "tree" (the default) builds the document with
+            BeautifulSoup, "text" writes the markup directly, which is much
+            faster on long files and produces equivalent XML.
+        :param pretty_print: with the "text" serializer, if False the
+            document is written without indentation.
         """
         self.write_inline_positioning = kwargs.pop("write_inline_positioning", False)
+        self.serializer = kwargs.pop("serializer", "tree")
+        if self.serializer not in _SERIALIZERS:
+            raise ValueError(
+                f"Unknown DFXP serializer {self.serializer!r}, "
+                f"expected one of {_SERIALIZERS}"
+            )
+        self.pretty_print = kwargs.pop("pretty_print", True)
         self._span_stack = []
         self.region_creator = None
         super().__init__(*args, **kwargs)
@@ -56,6 +83,9 @@ class DFXPWriter(BaseWriter):
             this language
         :rtype: str
         """
+        if self.serializer == "text":
+            return self._write_text(caption_set, force)
+
         dfxp = BeautifulSoup(DFXP_BASE_MARKUP, "lxml-xml")
 
         langs = caption_set.get_languages()
@@ -65,8 +95,7 @@ class DFXPWriter(BaseWriter):
         else:
             dfxp.find("tt")[DFXP_ATTR_XML_LANG] = DFXP_DEFAULT_LANGUAGE_CODE
 
-        caption_set = deepcopy(caption_set)
-        self._relativize_layouts(caption_set, langs)
+        caption_set = self._relativize_captions(caption_set, langs)
         self._write_styles(caption_set, dfxp)
 
         self.region_creator = RegionCreator(dfxp, caption_set)
@@ -81,37 +110,92 @@ class DFXPWriter(BaseWriter):
         self.region_creator.cleanup_regions()
         return dfxp.prettify(formatter=None)
 
-    def _relativize_layouts(self, caption_set, langs):
-        """Relativize and fit-to-screen all layout_info on captions and nodes.
+    def _write_text(self, caption_set, force):
+        """Serialize a CaptionSet into DFXP/TTML markup without a document tree.
+
+        Writes the same elements and attributes as the tree serializer, from
+        the same helpers.
 
         :type caption_set: CaptionSet
-        :param langs: languages to process
-        :type langs: list[str]
+        :type force: str
+        :rtype: str
         """
+        langs = caption_set.get_languages()
+        if force in langs:
+            langs = [force]
+            tt_attrs = {DFXP_ATTR_XML_LANG: force}
+        else:
+            tt_attrs = {DFXP_ATTR_XML_LANG: DFXP_DEFAULT_LANGUAGE_CODE}
+        tt_attrs.update(_TT_NAMESPACES)
+
+        caption_set = self._relativize_captions(caption_set, langs)
+
+        styles = _DeclaredStyles()
+        style_elements = []
+        for style_id, style in self._iter_styles(caption_set):
+            attributes = _recreate_style(style, styles)
+            if attributes:
+                styles.add(style_id)
+                attributes[DFXP_ATTR_XML_ID] = style_id
+                style_elements.append(("style", attributes, None))
+
+        self.region_creator = RegionCreator(None, caption_set)
+        self.region_creator.create_document_regions()
+
+        # Elements are (name, attributes, content) tuples, content being a
+        # list of elements, the inline markup of a <p>, or None when empty
+        divs = []
         for lang in langs:
+            div_attrs = {DFXP_ATTR_XML_LANG: lang}
+            div_attrs.update(self._get_positioning_attributes(lang, caption_set))
+            paragraphs = []
             for caption in caption_set.get_captions(lang):
-                caption.layout_info = self._relativize_and_fit_to_screen(
-                    caption.layout_info
+                caption_style = caption.style or {"class": DFXP_DEFAULT_STYLE_ID}
+                text = self._recreate_text(caption, styles, caption_set, lang)
+                p_attrs = self._get_p_attributes(caption, caption_style, styles)
+                p_attrs.update(
+                    self._get_positioning_attributes(lang, caption_set, caption)
                 )
-                for node in caption.nodes:
-                    node.layout_info = self._relativize_and_fit_to_screen(
-                        node.layout_info
-                    )
+                paragraphs.append(("p", p_attrs, text))
+            divs.append(("div", div_attrs, paragraphs))
+
+        region_elements = [
+            ("region", {DFXP_ATTR_XML_ID: region_id, **attributes}, None)
+            for region_id, attributes in self.region_creator.get_assigned_regions()
+        ]
+        head = [("styling", {}, style_elements), ("layout", {}, region_elements)]
+        tt = ("tt", tt_attrs, [("head", {}, head), ("body", {}, divs)])
+
+        output = [_XML_DECLARATION]
+        _serialize_element(tt, output, 0 if self.pretty_print else None)
+        if not self.pretty_print:
+            output.append("\n")
+        return "".join(output)
 
-    def _write_styles(self, caption_set, dfxp):
-        """Write <style> elements into the <styling> section of the DFXP document.
+    @staticmethod
+    def _iter_styles(caption_set):
+        """Yield the (style_id, style) pairs to write in the <styling> section.
 
         Skips pseudo-element styles (those starting with '::').  If the
-        caption_set has no styles at all, a default style is created.
+        caption_set has no styles at all, the default style is yielded.
 
         :type caption_set: CaptionSet
-        :type dfxp: BeautifulSoup
+        :rtype: Iterator[tuple[str, dict]]
         """
         for style_id, style in caption_set.get_styles():
             if style != {} and not style_id.startswith("::"):
-                self._recreate_styling_tag(style_id, style, dfxp)
+                yield style_id, style
         if not caption_set.get_styles():
-            self._recreate_styling_tag(DFXP_DEFAULT_STYLE_ID, DFXP_DEFAULT_STYLE, dfxp)
+            yield DFXP_DEFAULT_STYLE_ID, DFXP_DEFAULT_STYLE
+
+    def _write_styles(self, caption_set, dfxp):
+        """Write <style> elements into the <styling> section of the DFXP document.
+
+        :type caption_set: CaptionSet
+        :type dfxp: BeautifulSoup
+        """
+        for style_id, style in self._iter_styles(caption_set):
+            self._recreate_styling_tag(style_id, style, dfxp)
 
     def _build_div(self, lang, caption_set, dfxp):
         """Build a <div> element containing all <p> tags for a given language.
@@ -144,14 +228,31 @@ class DFXPWriter(BaseWriter):
         :type caption: Caption | None
         :type caption_node: CaptionNode | None
         """
+        tag.attrs.update(
+            self._get_positioning_attributes(lang, caption_set, caption, caption_node)
+        )
+
+    def _get_positioning_attributes(
+        self, lang, caption_set=None, caption=None, caption_node=None
+    ):
+        """Return the 'region' attribute, and optionally inline positioning.
+
+        :type lang: str
+        :type caption_set: CaptionSet | None
+        :type caption: Caption | None
+        :type caption_node: CaptionNode | None
+        :rtype: dict
+        """
         assigned_id, attribs = self.region_creator.get_positioning_info(
             lang, caption_set, caption, caption_node
         )
 
+        attributes = {}
         if assigned_id:
-            tag["region"] = assigned_id
+            attributes["region"] = assigned_id
             if self.write_inline_positioning:
-                tag.attrs.update(attribs)
+                attributes.update(attribs)
+        return attributes
 
     @staticmethod
     def _recreate_styling_tag(style, content, dfxp):
@@ -186,17 +287,29 @@ class DFXPWriter(BaseWriter):
         :type lang: str | None
         :rtype: bs4.element.Tag
         """
-        start = caption.format_start()
-        end = caption.format_end()
-        p = dfxp.new_tag("p", begin=start, end=end)
+        p = dfxp.new_tag("p")
         p.string = self._recreate_text(caption, dfxp, caption_set, lang)
+        p.attrs.update(self._get_p_attributes(caption, caption_style, dfxp))
+
+        return p
+
+    @staticmethod
+    def _get_p_attributes(caption, caption_style, dfxp):
+        """Return the timing and style attributes of a caption's <p> element.
+
+        :type caption: Caption
+        :type caption_style: dict
+        :param dfxp: the document, used to verify that referenced styles exist
+        :rtype: dict
+        """
+        attributes = {"begin": caption.format_start(), "end": caption.format_end()}
 
         if dfxp.find("style", {DFXP_ATTR_XML_ID: "p"}):
-            p["style"] = "p"
+            attributes["style"] = "p"
 
-        p.attrs.update(_recreate_style(caption_style, dfxp))
+        attributes.update(_recreate_style(caption_style, dfxp))
 
-        return p
+        return attributes
 
     def _recreate_text(self, caption, dfxp, caption_set=None, lang=None):
         """Serialize all nodes of a caption into DFXP inline markup.
@@ -276,7 +389,9 @@ class RegionCreator:
 
     def __init__(self, dfxp, caption_set):
         """
-        :type dfxp: BeautifulSoup
+        :param dfxp: the document to add the <region> tags to, or None when
+            the document is not built as a tree (see get_assigned_regions)
+        :type dfxp: BeautifulSoup | None
         :type caption_set: CaptionSet
         """
         self._dfxp = dfxp
@@ -320,13 +435,14 @@ class RegionCreator:
         extent, padding, alignment, or writing_direction).
 
         :param unique_layouts: iterable of geometry.Layout instances
-        :type dfxp: BeautifulSoup
+        :param dfxp: the document, or None to only assign region IDs
+        :type dfxp: BeautifulSoup | None
         :param id_factory: callable that returns a unique region ID string
         :return: mapping from Layout to the xml:id of its created region
         :rtype: dict
         """
         region_map = {}
-        layout_section = dfxp.find("layout")
+        layout_section = dfxp.find("layout") if dfxp is not None else None
 
         for region_spec in unique_layouts:
             if (
@@ -336,11 +452,13 @@ class RegionCreator:
                 or region_spec.alignment
                 or region_spec.writing_direction
             ):
-                new_region = dfxp.new_tag("region")
                 new_id = id_factory()
-                new_region[DFXP_ATTR_XML_ID] = new_id
-
                 region_map[region_spec] = new_id
+                if dfxp is None:
+                    continue
+
+                new_region = dfxp.new_tag("region")
+                new_region[DFXP_ATTR_XML_ID] = new_id
                 region_attribs = _convert_layout_to_attributes(region_spec)
                 new_region.attrs.update(region_attribs)
 
@@ -411,8 +529,28 @@ class RegionCreator:
 
         return region_id, positioning_attributes
 
+    def get_assigned_regions(self):
+        """Return the regions assigned to an element so far, in document order.
+
+        The default region comes first, as in create_document_regions.
+
+        :return: (region_id, attributes) pairs
+        :rtype: list[tuple[str, dict]]
+        """
+        regions = sorted(
+            self._region_map.items(),
+            key=lambda item: item[1] != DFXP_DEFAULT_REGION_ID,
+        )
+        return [
+            (region_id, _convert_layout_to_attributes(layout))
+            for layout, region_id in regions
+            if region_id in self._assigned_region_ids
+        ]
+
     def cleanup_regions(self):
         """Remove <region> tags that were never assigned to any element."""
+        if self._dfxp is None:
+            return
         layout_tag = self._dfxp.find("layout")
         if not layout_tag:
             return
@@ -422,6 +560,61 @@ class RegionCreator:
                 region.extract()
 
 
+class _DeclaredStyles:
+    """The ids of the <style> elements written by the text serializer.
+
+    Stands in for the BeautifulSoup document in the style lookups made by
+    _recreate_style and DFXPWriter._get_p_attributes.
+    """
+
+    def __init__(self):
+        self._ids = set()
+
+    def add(self, style_id):
+        self._ids.add(style_id)
+
+    def find(self, name, attrs):
+        return name == "style" and attrs[DFXP_ATTR_XML_ID] in self._ids
+
+
+def _serialize_element(element, output, depth):
+    """Append the markup of a (name, attributes, content) element to output.
+
+    Attributes are sorted, as BeautifulSoup writes them. With a depth, the
+    element is indented like BeautifulSoup's prettify() does; with None, it
+    is written without whitespace.
+
+    :type element: tuple[str, dict, list | str | None]
+    :type output: list[str]
+    :type depth: int | None
+    """
+    name, attributes, content = element
+    tag = name + "".join(
+        f" {key}={quoteattr(value)}" for key, value in sorted(attributes.items())
+    )
+    if depth is None:
+        indent = newline = ""
+        child_depth = None
+    else:
+        indent = " " * depth
+        newline = "\n"
+        child_depth = depth + 1
+
+    if content is None or (not content and isinstance(content, list)):
+        output.append(f"{indent}<{tag}/>{newline}")
+        return
+
+    output.append(f"{indent}<{tag}>{newline}")
+    if isinstance(content, str):
+        text = content.strip()
+        if text:
+            output.append(f"{indent} {text}{newline}" if newline else text)
+    else:
+        for child in content:
+            _serialize_element(child, output, child_depth)
+    output.append(f"{indent}</{name}>{newline}")
+
+
 def _recreate_style(content, dfxp):
     """Convert an internal style dict to DFXP/TTS style attributes.
 
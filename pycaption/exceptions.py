@@ -37,6 +37,10 @@ class CaptionLineLengthError(CaptionReadError):
     """
 
 
+class ConversionTimeoutError(Exception):
+    """Error raised when converting a file takes longer than allowed."""
+
+
 class CaptionReadWarning(UserWarning):
     """Warning emitted when caption content is parseable but may cause
     rendering issues (e.g. cue positioned partially off-screen)."""
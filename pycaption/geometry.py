@@ -6,12 +6,27 @@ CONVENTIONS:
   called. If the values of an object need to be recalculated, the method
   responsible for the recalculation should return a new object with the
   necessary modifications.
+* The objects are immutable and interned: creating an object equal to one
+  that is still referenced returns that object. Identical layouts share a
+  single instance, and usually compare by identity.
 """
+
 import re
 from enum import Enum
+from weakref import KeyedRef
 
 from .exceptions import CaptionReadSyntaxError, RelativizationError
 
+# Weak references to the living geometry objects, keyed by their class and
+# values
+_INTERNED = {}
+
+
+def _forget(ref):
+    """Called when an interned object is collected."""
+    if _INTERNED.get(ref.key) is ref:
+        del _INTERNED[ref.key]
+
 
 class UnitEnum(Enum):
     """Enumeration-like object, specifying the units of measure for length
@@ -62,26 +77,84 @@ class WritingDirectionEnum(Enum):
     VERTICAL_LR = "lr"
 
 
-class Alignment:
+class _Interned:
+    """Base class of the immutable, interned geometry objects.
+
+    Subclasses list their attributes in ``_fields``, in the order of the
+    constructor arguments, and create their instances with ``_intern``.
+    The hash covers ``_compared_fields``, the attributes compared by
+    ``__eq__``, which are all of ``_fields`` unless set.
+    """
+
+    __slots__ = ("_hash", "__weakref__")
+    _fields = ()
+    _compared_fields = None
+
+    @classmethod
+    def _intern(cls, *values):
+        """Return the instance of cls with the given field values.
+
+        Two threads may both create an instance; the objects are equal all
+        the same, only not identical.
+        """
+        key = (cls, *values)
+        ref = _INTERNED.get(key)
+        instance = ref() if ref is not None else None
+        if instance is None:
+            instance = object.__new__(cls)
+            for name, value in zip(cls._fields, values):
+                object.__setattr__(instance, name, value)
+            object.__setattr__(instance, "_hash", instance._compute_hash())
+            _INTERNED[key] = KeyedRef(instance, _forget, key)
+        return instance
+
+    def _compute_hash(self):
+        fields = self._compared_fields or self._fields
+        return hash((type(self), *(getattr(self, name) for name in fields)))
+
+    def __hash__(self):
+        return self._hash
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            f"{type(self).__name__} objects are immutable, create a new one"
+        )
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} objects are immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, name) for name in self._fields)
+
+
+class Alignment(_Interned):
     """Represents horizontal and vertical text alignment within a region."""
 
-    def __init__(self, horizontal, vertical):
+    __slots__ = ("horizontal", "vertical")
+    _fields = __slots__
+
+    def __new__(cls, horizontal, vertical):
         """
         :type horizontal: HorizontalAlignmentEnum
         :param horizontal: HorizontalAlignmentEnum member
         :type vertical: VerticalAlignmentEnum
         :param vertical: VerticalAlignmentEnum member
         """
-        self.horizontal = horizontal
-        self.vertical = vertical
+        return cls._intern(horizontal, vertical)
 
-    def __hash__(self):
-        return hash(hash(self.horizontal) * 83 + hash(self.vertical) * 89 + 97)
+    __hash__ = _Interned.__hash__
 
     def __eq__(self, other):
-        return (
+        return self is other or (
             other
-            and type(self) == type(other)
+            and type(self) is type(other)
+            and self._hash == other._hash
             and self.horizontal == other.horizontal
             and self.vertical == other.vertical
         )
@@ -128,12 +201,12 @@ class Alignment:
         return cls(horizontal_obj, vertical_obj)
 
 
-class TwoDimensionalObject:
+class TwoDimensionalObject(_Interned):
     """Adds a couple useful methods to its subclasses, nothing fancy."""
 
+    __slots__ = ()
+
     @classmethod
-    # TODO - highly cachable. Should use WeakValueDictionary here to return
-    # flyweights, not new objects.
     def from_xml_attribute(cls, attribute):
         """Instantiate the class from a value of the type "4px" or "5%"
         or any number concatenated with a measuring unit (member of UnitEnum)
@@ -153,7 +226,10 @@ class Stretch(TwoDimensionalObject):
     text can be displayed)
     """
 
-    def __init__(self, horizontal, vertical):
+    __slots__ = ("horizontal", "vertical")
+    _fields = __slots__
+
+    def __new__(cls, horizontal, vertical):
         """Use the .from_xxx methods. They know what's best for you.
 
         :type horizontal: Size
@@ -164,8 +240,7 @@ class Stretch(TwoDimensionalObject):
                 raise ValueError(
                     "Stretch must be initialized with two valid " "Size objects."
                 )
-        self.horizontal = horizontal
-        self.vertical = vertical
+        return cls._intern(horizontal, vertical)
 
     def is_measured_in(self, measure_unit):
         """Whether the stretch is only measured in the provided units
@@ -188,15 +263,15 @@ class Stretch(TwoDimensionalObject):
         )
 
     def __eq__(self, other):
-        return (
+        return self is other or (
             other
-            and type(self) == type(other)
+            and type(self) is type(other)
+            and self._hash == other._hash
             and self.horizontal == other.horizontal
             and self.vertical == other.vertical
         )
 
-    def __hash__(self):
-        return hash(hash(self.horizontal) * 59 + hash(self.vertical) * 61 + 67)
+    __hash__ = _Interned.__hash__
 
     def __bool__(self):
         return True if self.horizontal or self.vertical else False
@@ -233,7 +308,10 @@ class Stretch(TwoDimensionalObject):
 class Point(TwoDimensionalObject):
     """Represent a point in 2d space."""
 
-    def __init__(self, x, y):
+    __slots__ = ("x", "y")
+    _fields = __slots__
+
+    def __new__(cls, x, y):
         """
         :type x: Size
         :type y: Size
@@ -243,8 +321,7 @@ class Point(TwoDimensionalObject):
                 raise ValueError(
                     "Point must be initialized with two valid " "Size objects."
                 )
-        self.x = x
-        self.y = y
+        return cls._intern(x, y)
 
     def __sub__(self, other):
         """Returns an Stretch object, if the other point's units are compatible"""
@@ -306,15 +383,15 @@ class Point(TwoDimensionalObject):
         )
 
     def __eq__(self, other):
-        return (
+        return self is other or (
             other
-            and type(self) == type(other)
+            and type(self) is type(other)
+            and self._hash == other._hash
             and self.x == other.x
             and self.y == other.y
         )
 
-    def __hash__(self):
-        return hash(hash(self.x) * 51 + hash(self.y) * 53 + 57)
+    __hash__ = _Interned.__hash__
 
     def __bool__(self):
         return True if self.x or self.y else False
@@ -324,13 +401,16 @@ class Point(TwoDimensionalObject):
         return f"{self.x.to_xml_attribute()} {self.y.to_xml_attribute()}"
 
 
-class Size:
+class Size(_Interned):
     """Ties together a number with a unit, to represent a size.
 
-    Use as value objects! (don't change after creation)
+    Use as value objects! (they can't be changed after creation)
     """
 
-    def __init__(self, value, unit):
+    __slots__ = ("value", "unit")
+    _fields = __slots__
+
+    def __new__(cls, value, unit):
         """
         :param value: A number (float or int will do)
         :param unit: A UnitEnum member
@@ -340,8 +420,7 @@ class Size:
         if not isinstance(unit, UnitEnum):
             raise ValueError("Size must be initialized with a valid unit.")
 
-        self.value = float(value)
-        self.unit = unit
+        return cls._intern(float(value), unit)
 
     def __sub__(self, other):
         if self.unit == other.unit:
@@ -426,8 +505,6 @@ class Size:
         return Size(value, unit)
 
     @classmethod
-    # TODO - this also looks highly cachable. Should use a WeakValueDict here
-    # to return flyweights
     def from_string(cls, string):
         """Given a string of the form "46px" or "5%" etc., returns the proper
         size object
@@ -475,21 +552,22 @@ class Size:
         return self.value, self.unit
 
     def __eq__(self, other):
-        return (
+        return self is other or (
             other
-            and type(self) == type(other)
+            and type(self) is type(other)
+            and self._hash == other._hash
             and self.value == other.value
             and self.unit == other.unit
         )
 
-    def __hash__(self):
-        return hash(hash(self.value) * 41 + hash(self.unit) * 43 + 47)
+    __hash__ = _Interned.__hash__
 
     def __bool__(self):
-        return self.unit in UnitEnum and self.value is not None
+        # The value and unit are validated on creation
+        return True
 
 
-class Padding:
+class Padding(_Interned):
     """Represents padding information. Consists of 4 Size objects, representing
     padding from (in this order): before (up), after (down), start (left) and
     end (right).
@@ -498,24 +576,23 @@ class Padding:
     None. If this is not true Writers may fail for they rely on this assumption.
     """
 
-    def __init__(self, before=None, after=None, start=None, end=None):
+    __slots__ = ("before", "after", "start", "end")  # top, bottom, left, right
+    _fields = __slots__
+
+    def __new__(cls, before=None, after=None, start=None, end=None):
         """
         :type before: Size
         :type after: Size
         :type start: Size
         :type end: Size
         """
-        self.before = before  # top
-        self.after = after  # bottom
-        self.start = start  # left
-        self.end = end  # right
-
-        for attr in ["before", "after", "start", "end"]:
-            # Ensure that a Padding object always explicitly defines all
-            # four possible paddings
-            if not isinstance(getattr(self, attr), Size):
-                # Sets default padding (0%)
-                setattr(self, attr, Size(0, UnitEnum.PERCENT))
+        # Ensure that a Padding object always explicitly defines all
+        # four possible paddings, the default being 0%
+        paddings = [
+            padding if isinstance(padding, Size) else Size(0, UnitEnum.PERCENT)
+            for padding in (before, after, start, end)
+        ]
+        return cls._intern(*paddings)
 
     @classmethod
     def from_xml_attribute(cls, attribute):
@@ -570,23 +647,17 @@ class Padding:
         )
 
     def __eq__(self, other):
-        return (
+        return self is other or (
             other
-            and type(self) == type(other)
+            and type(self) is type(other)
+            and self._hash == other._hash
             and self.before == other.before
             and self.after == other.after
             and self.start == other.start
             and self.end == other.end
         )
 
-    def __hash__(self):
-        return hash(
-            hash(self.before) * 19
-            + hash(self.after) * 23
-            + hash(self.start) * 29
-            + hash(self.end) * 31
-            + 37
-        )
+    __hash__ = _Interned.__hash__
 
     def to_xml_attribute(
         self, attribute_order=("before", "end", "after", "start"), **kwargs
@@ -641,7 +712,7 @@ class Padding:
         return is_relative
 
 
-class Layout:
+class Layout(_Interned):
     """Should encapsulate all the information needed to determine (as correctly
     as possible) the layout (positioning) of elements on the screen.
 
@@ -649,8 +720,27 @@ class Layout:
      specific for each caption type.
     """
 
-    def __init__(
-        self,
+    __slots__ = (
+        "origin",
+        "extent",
+        "padding",
+        "alignment",
+        "webvtt_positioning",
+        "writing_direction",
+    )
+    _fields = __slots__
+    # The WebVTT settings are kept for WebVTT output, but don't make a
+    # different layout
+    _compared_fields = (
+        "origin",
+        "extent",
+        "padding",
+        "alignment",
+        "writing_direction",
+    )
+
+    def __new__(
+        cls,
         origin=None,
         extent=None,
         padding=None,
@@ -687,24 +777,16 @@ class Layout:
             used if not specified by the positioning arguments,
         """
 
-        self.origin = origin
-        self.extent = extent
-        self.padding = padding
-        self.alignment = alignment
-        self.webvtt_positioning = webvtt_positioning
-        self.writing_direction = writing_direction
-
         if inherit_from:
-            for attr_name in [
-                "origin",
-                "extent",
-                "padding",
-                "alignment",
-                "writing_direction",
-            ]:
-                attr = getattr(self, attr_name)
-                if not attr:
-                    setattr(self, attr_name, getattr(inherit_from, attr_name))
+            origin = origin or inherit_from.origin
+            extent = extent or inherit_from.extent
+            padding = padding or inherit_from.padding
+            alignment = alignment or inherit_from.alignment
+            writing_direction = writing_direction or inherit_from.writing_direction
+
+        return cls._intern(
+            origin, extent, padding, alignment, webvtt_positioning, writing_direction
+        )
 
     def __bool__(self):
         return any(
@@ -735,8 +817,9 @@ class Layout:
         )
 
     def __eq__(self, other):
-        return (
-            type(self) == type(other)
+        return self is other or (
+            type(self) is type(other)
+            and self._hash == other._hash
             and self.origin == other.origin
             and self.extent == other.extent
             and self.padding == other.padding
@@ -747,15 +830,7 @@ class Layout:
     def __ne__(self, other):
         return not self == other
 
-    def __hash__(self):
-        return hash(
-            hash(self.origin) * 7
-            + hash(self.extent) * 11
-            + hash(self.padding) * 13
-            + hash(self.alignment) * 5
-            + hash(self.writing_direction) * 19
-            + 17
-        )
+    __hash__ = _Interned.__hash__
 
     def is_relative(self):
         """
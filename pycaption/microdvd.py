@@ -2,10 +2,11 @@
 
 MicroDVD uses frame-based timing: {start_frame}{end_frame}text|text.
 A special line {0}{0}fps_value sets the framerate (default 25 fps).
+Frames and times are converted with a Timebase, so decimal NTSC rates
+such as 23.976 stand for their exact fractions (24000/1001).
 """
 
 import re
-from copy import deepcopy
 
 from .base import (
     DEFAULT_LANGUAGE_CODE,
@@ -22,6 +23,7 @@ from .exceptions import (
     CaptionReadTimingError,
     InvalidInputError,
 )
+from .timebase import FPS_25, Timebase
 
 
 class MicroDVDReader(BaseReader):
@@ -43,7 +45,7 @@ class MicroDVDReader(BaseReader):
 
         lines = content.splitlines()
         captions = CaptionList()
-        fps = 25.0
+        timebase = FPS_25
         for line in lines:
             if not line:
                 continue
@@ -56,13 +58,13 @@ class MicroDVDReader(BaseReader):
 
             if start == "0" and end == "0":
                 try:
-                    fps = float(txt)
+                    timebase = Timebase(txt)
                     continue
                 except ValueError:
                     raise CaptionReadTimingError("FPS information is not provided")
 
-            caption_start = self._framestomicro(int(start), fps)
-            caption_end = self._framestomicro(int(end), fps)
+            caption_start = self._framestomicro(int(start), timebase)
+            caption_end = self._framestomicro(int(end), timebase)
             nodes = []
 
             for line in txt.split("|"):
@@ -86,9 +88,9 @@ class MicroDVDReader(BaseReader):
 
         return caption_set
 
-    def _framestomicro(self, framenum, fps=25.0):
+    def _framestomicro(self, framenum, timebase=FPS_25):
         """Convert a frame number to microseconds."""
-        return int(framenum / fps * (10**6))
+        return timebase.microseconds_at(framenum)
 
 
 class MicroDVDWriter(BaseWriter):
@@ -100,8 +102,6 @@ class MicroDVDWriter(BaseWriter):
         :type caption_set: CaptionSet
         :rtype: str
         """
-        caption_set = deepcopy(caption_set)
-
         captions = []
 
         for lang in caption_set.get_languages():
@@ -109,9 +109,9 @@ class MicroDVDWriter(BaseWriter):
 
         return "".join(captions)
 
-    def _microtoframes(self, micro, fps=25.0):
+    def _microtoframes(self, micro, timebase=FPS_25):
         """Convert microseconds to a frame number."""
-        return int(micro * fps / (10**6))
+        return timebase.frame_at(micro)
 
     def _recreate_lang(self, captions):
         """Serialize one language's captions to MicroDVD text."""
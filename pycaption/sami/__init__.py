@@ -1,9 +1,11 @@
 """SAMI caption format reader and writer package.
 
-Provides SAMIReader for parsing SAMI files into CaptionSet objects and
-SAMIWriter for serializing CaptionSet objects back to SAMI markup.
+Provides SAMIReader for parsing SAMI files into CaptionSet objects (and
+StreamingSAMIReader, its single-pass counterpart) and SAMIWriter for
+serializing CaptionSet objects back to SAMI markup.
 """
 
 from .constants import SAMI_BASE_MARKUP  # noqa: F401
 from .reader import SAMIReader  # noqa: F401
+from .streaming import StreamingSAMIReader  # noqa: F401
 from .writer import SAMIWriter  # noqa: F401
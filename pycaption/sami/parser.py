@@ -4,6 +4,7 @@ Normalizes raw SAMI HTML into well-formed XML, extracts CSS stylesheets,
 and discovers caption languages in a single parsing pass.
 """
 
+import re
 from collections import deque
 from html.entities import name2codepoint
 from html.parser import HTMLParser
@@ -14,7 +15,22 @@ from cssutils import css as cssutils_css
 from cssutils import parseString
 
 from ..base import DEFAULT_LANGUAGE_CODE
-from ..exceptions import CaptionReadSyntaxError
+from ..exceptions import CaptionReadSyntaxError, InvalidInputError
+
+_NO_CC = "no closed captioning available"
+# Markers that make the whole file invalid, searched for case-insensitively
+_REJECTED_MARKERS = ("<html", _NO_CC)
+_HEAD_END_RE = re.compile("</head>", re.IGNORECASE)
+# Common SAMI authoring errors, fixed before parsing
+_FIXES = (("<i/>", "<i>"), (";>", ">"))
+# Ends of a chunk that may be the start of a fix spanning into the next one
+_FIX_PREFIXES = tuple(
+    sorted(
+        {bad[:size] for bad, _ in _FIXES for size in range(1, len(bad))},
+        key=len,
+        reverse=True,
+    )
+)
 
 
 class SAMIParser(HTMLParser):
@@ -23,11 +39,29 @@ class SAMIParser(HTMLParser):
     Extracts CSS stylesheet rules and discovers caption languages during
     a single pass.  The result is a tuple of (normalized_xml, styles, langs)
     consumed by SAMIReader.
+
+    ``feed`` parses a whole document. A document can also be given in
+    chunks, for instance the lines of a file, with ``feed_chunk`` followed
+    by ``finish``::
+
+        parser = SAMIParser()
+        for chunk in sami_file:
+            parser.feed_chunk(chunk)
+        sami, styles, langs = parser.finish()
+
+    Only the ``<head>`` is held in memory until it is complete, because the
+    stylesheet decides the language of the captions.
     """
 
     def __init__(self, *args, **kw):
         HTMLParser.__init__(self, *args, **kw)
-        self.sami = ""
+        self._output = []
+        self._head_chunks = []
+        self._head_size = 0
+        # The end of the head read so far, where </head> may begin
+        self._head_tail = ""
+        self._marker_tail = ""
+        self._fix_pending = ""
         self.styles = {}
         self.queue = deque()
         self.langs = set()
@@ -50,16 +84,13 @@ class SAMIParser(HTMLParser):
             self.langs.add(lang)
 
         if tag == "br":
-            self.sami += "<br/>"
+            self._write_empty(tag)
         else:
             # Close any already-open instance of this tag (LIFO) before re-opening
             while tag in self.queue:
-                closer = self.queue.pop()
-                self.sami += f"</{closer}>"
+                self._write_end(self.queue.pop())
             self.queue.append(tag)
-            for attr, value in attrs:
-                tag += f' {attr.lower()}="{value}"'
-            self.sami += f"<{tag}>"
+            self._write_start(tag, attrs)
 
     def handle_endtag(self, tag):
         """Close tags in LIFO order; handle SAMI's malformed sync/p nesting."""
@@ -71,28 +102,27 @@ class SAMIParser(HTMLParser):
             return
 
         while tag in self.queue:
-            closing_tag = self.queue.pop()
-            self.sami += f"</{closing_tag}>"
+            self._write_end(self.queue.pop())
 
     def handle_entityref(self, name):
         """Convert named HTML entities to characters; preserve &gt; and &lt;."""
         if name in ["gt", "lt"]:
-            self.sami += f"&{name};"
+            self._write_text(f"&{name};")
         else:
             try:
-                self.sami += chr(self.name2codepoint[name])
+                self._write_text(chr(self.name2codepoint[name]))
             except (KeyError, ValueError):
-                self.sami += f"&{name}"
+                self._write_text(f"&{name}")
 
         self.last_element = ""
 
     def handle_charref(self, name):
         """Convert numeric character references (&#NNN; or &#xHHH;) to characters."""
-        self.sami += chr(int(name[1:], 16) if name[0] == "x" else int(name))
+        self._write_text(chr(int(name[1:], 16) if name[0] == "x" else int(name)))
 
     def handle_data(self, data):
         """Append raw text content to the output."""
-        self.sami += data
+        self._write_text(data)
         self.last_element = ""
 
     def feed(self, data):
@@ -103,31 +133,107 @@ class SAMIParser(HTMLParser):
         :rtype: tuple[str, dict, set]
         :raises CaptionReadSyntaxError: if the file is HTML or has no captions
         """
-        no_cc = "no closed captioning available"
+        self.feed_chunk(data)
+        return self.finish()
+
+    def feed_chunk(self, chunk):
+        """Parse the next chunk of a SAMI document.
+
+        :param chunk: Raw SAMI unicode string, of any length
+        :raises CaptionReadSyntaxError: if the file is HTML or has no captions
+        :raises InvalidInputError: if chunk is not a string
+        """
+        if not isinstance(chunk, str):
+            raise InvalidInputError("The content is not a unicode string.")
+        self._reject_markers(chunk)
+
+        if self._head_chunks is None:
+            self._parse(chunk)
+            return
+
+        # The stylesheet must be known before the first <p> is parsed. Only
+        # the new chunk is searched, with the tail of the previous ones.
+        window = self._head_tail + chunk
+        match = _HEAD_END_RE.search(window)
+        offset = self._head_size - len(self._head_tail)
+        self._head_chunks.append(chunk)
+        self._head_size += len(chunk)
+        if match:
+            self._end_head("".join(self._head_chunks), offset + match.start())
+        else:
+            self._head_tail = window[-(len("</head>") - 1) :]
+
+    def finish(self):
+        """Parse what is left of the document and return the parsing result.
+
+        :returns: (normalized_xml, styles_dict, languages_set)
+        :rtype: tuple[str, dict, set]
+        """
+        if self._head_chunks is not None:
+            # Without </head>, the whole document is searched for styles
+            head = "".join(self._head_chunks)
+            self._end_head(head, len(head) - 1)
+        HTMLParser.feed(self, self._fix_pending)
+        self._fix_pending = ""
 
-        if "<html" in data.lower():
+        # Close any tags left open at end of document
+        while self.queue:
+            self._write_end(self.queue.pop())
+
+        return "".join(self._output), self.styles, self.langs
+
+    def _write_start(self, tag, attrs):
+        """Write an opening tag to the normalized document."""
+        for attr, value in attrs:
+            tag += f' {attr.lower()}="{value}"'
+        self._output.append(f"<{tag}>")
+
+    def _write_end(self, tag):
+        """Write a closing tag to the normalized document."""
+        self._output.append(f"</{tag}>")
+
+    def _write_empty(self, tag):
+        """Write an empty element, such as <br/>, to the normalized document."""
+        self._output.append(f"<{tag}/>")
+
+    def _write_text(self, text):
+        """Write text, which may hold entity references, to the document."""
+        self._output.append(text)
+
+    def _reject_markers(self, chunk):
+        """Raise if the markers of non-SAMI content appear in the document."""
+        text = self._marker_tail + chunk.lower()
+        if "<html" in text:
             raise CaptionReadSyntaxError("SAMI File seems to be an HTML file.")
-        elif no_cc in data.lower():
-            raise CaptionReadSyntaxError(f'SAMI File contains "{no_cc}"')
+        elif _NO_CC in text:
+            raise CaptionReadSyntaxError(f'SAMI File contains "{_NO_CC}"')
+        self._marker_tail = text[-(len(_NO_CC) - 1) :]
 
-        index = data.lower().find("</head>")
+    def _end_head(self, data, index):
+        """Read the stylesheet from data[:index], then parse data."""
         style = BeautifulSoup(data[:index], "lxml").find("style")
         if style and style.contents:
             self.styles = self._css_parse(" ".join(style.contents))
         else:
             self.styles = {}
+        self._head_chunks = None
+        self._parse(data)
 
-        # Fix common SAMI authoring errors
-        data = data.replace("<i/>", "<i>")
-        data = data.replace(";>", ">")
-        HTMLParser.feed(self, data)
-
-        # Close any tags left open at end of document
-        while self.queue:
-            closing_tag = self.queue.pop()
-            self.sami += f"</{closing_tag}>"
+    def _parse(self, data):
+        """Fix common authoring errors in data and feed it to the HTML parser.
 
-        return self.sami, self.styles, self.langs
+        The end of data is held back while it could be the beginning of an
+        error that continues in the next chunk.
+        """
+        data = self._fix_pending + data
+        held = next((len(p) for p in _FIX_PREFIXES if data.endswith(p)), 0)
+        if held:
+            data, self._fix_pending = data[:-held], data[-held:]
+        else:
+            self._fix_pending = ""
+        for bad, good in _FIXES:
+            data = data.replace(bad, good)
+        HTMLParser.feed(self, data)
 
     @staticmethod
     def _css_parse(css):
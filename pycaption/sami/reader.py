@@ -52,19 +52,32 @@ class SAMIReader(BaseReader):
 
         caption_dict = {}
         for language in doc_langs:
-            lang_layout = None
-            for target, styling in list(doc_styles.items()):
-                if target not in ["p", "sync", "span"]:
-                    if styling.get("lang", None) == language:
-                        lang_layout = self._build_layout(
-                            doc_styles.get(target, {}), inherit_from=global_layout
-                        )
-                        break
-            lang_layout = lang_layout or global_layout
+            lang_layout = self._build_lang_layout(language, doc_styles, global_layout)
             lang_captions = self._translate_lang(language, sami_soup, lang_layout)
 
             caption_dict[language] = lang_captions
 
+        return self._build_caption_set(caption_dict, doc_styles, global_layout)
+
+    def _build_lang_layout(self, language, doc_styles, global_layout):
+        """Build the layout of a language from the first class declaring it.
+
+        :rtype: Layout
+        """
+        for target, styling in list(doc_styles.items()):
+            if target not in ["p", "sync", "span"]:
+                if styling.get("lang", None) == language:
+                    return self._build_layout(
+                        doc_styles.get(target, {}), inherit_from=global_layout
+                    )
+        return global_layout
+
+    def _build_caption_set(self, caption_dict, doc_styles, global_layout):
+        """Assemble the CaptionSet of a document from its caption lists.
+
+        :rtype: CaptionSet
+        :raises CaptionReadNoCaptions: if no captions are found
+        """
         caption_set = CaptionSet(caption_dict, layout_info=global_layout)
 
         for style in list(doc_styles.items()):
@@ -126,15 +139,25 @@ class SAMIReader(BaseReader):
     def _translate_lang(self, language, sami_soup, parent_layout):
         """Convert all <p> tags for a language into a CaptionList.
 
+        :rtype: CaptionList
+        """
+        return self._translate_paragraphs(
+            sami_soup.select(f"p[lang|={language}]"), parent_layout
+        )
+
+    def _translate_paragraphs(self, paragraphs, parent_layout):
+        """Convert the <p> tags of a language, in document order, into a CaptionList.
+
         Sets end times by using the next caption's start time.  The last
         caption gets an arbitrary 4-second duration if no end is available.
 
+        :param paragraphs: <p> elements, whose parent holds the start time
         :rtype: CaptionList
         """
         captions = CaptionList(layout_info=parent_layout)
         milliseconds = 0
 
-        for p in sami_soup.select(f"p[lang|={language}]"):
+        for p in paragraphs:
             start_str = p.parent.get("start")
             if not start_str:
                 raise CaptionReadTimingError(
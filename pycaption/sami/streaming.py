@@ -0,0 +1,231 @@
+"""Single-pass SAMI caption reader.
+
+SAMIReader normalizes the document with SAMIParser, parses the result again
+with BeautifulSoup and then searches it once per language. StreamingSAMIReader
+builds the <p> elements directly from the events of SAMIParser instead, so
+the document is parsed once, can be read from a stream, and every language
+is taken from the same list of paragraphs.
+"""
+
+from html import unescape
+
+from bs4 import NavigableString
+
+from ..exceptions import InvalidInputError
+from .parser import SAMIParser
+from .reader import SAMIReader
+
+# Elements lxml never gives content to
+_VOID_ELEMENTS = frozenset(
+    (
+        "area",
+        "base",
+        "basefont",
+        "br",
+        "col",
+        "embed",
+        "frame",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    )
+)
+_ASCII_SPACES = " \n\t\f"
+
+
+class StreamingSAMIReader(SAMIReader):
+    """Reads SAMI caption files into a CaptionSet in a single parsing pass.
+
+    Produces the same CaptionSet as SAMIReader for documents whose
+    paragraphs contain text and inline markup only: block elements such as
+    <table> or <hr> inside a <p> are kept in the caption instead of ending
+    it.
+    """
+
+    #: number of characters fed to the parser at a time
+    CHUNK_SIZE = 64 * 1024
+
+    def read(self, content):
+        """Parse a SAMI string into a CaptionSet.
+
+        :type content: str
+        :rtype: CaptionSet
+        :raises InvalidInputError: if content is not a string
+        :raises CaptionReadNoCaptions: if no captions are found
+        """
+        if not isinstance(content, str):
+            raise InvalidInputError("The content is not a unicode string.")
+        return self.read_stream(
+            content[i : i + self.CHUNK_SIZE]
+            for i in range(0, len(content), self.CHUNK_SIZE)
+        )
+
+    def read_stream(self, stream):
+        """Parse a SAMI document from a text stream into a CaptionSet.
+
+        ::
+
+            with open("captions.smi", encoding="utf-8") as sami_file:
+                caption_set = StreamingSAMIReader().read_stream(sami_file)
+
+        :param stream: a text file object, or any iterable of strings
+        :rtype: CaptionSet
+        :raises InvalidInputError: if the stream yields something else than
+            strings
+        :raises CaptionReadNoCaptions: if no captions are found
+        """
+        read = getattr(stream, "read", None)
+        if read is not None:
+            stream = iter(lambda: read(self.CHUNK_SIZE), "")
+
+        builder = _ParagraphBuilder()
+        for chunk in stream:
+            builder.feed_chunk(chunk)
+        # The builder writes no normalized document
+        _, doc_styles, doc_langs = builder.finish()
+
+        global_layout = self._build_layout(doc_styles.get("p", {}))
+
+        caption_dict = {}
+        for language, paragraphs in _group_by_language(
+            builder.paragraphs, doc_langs
+        ).items():
+            lang_layout = self._build_lang_layout(language, doc_styles, global_layout)
+            caption_dict[language] = self._translate_paragraphs(paragraphs, lang_layout)
+
+        return self._build_caption_set(caption_dict, doc_styles, global_layout)
+
+
+def _group_by_language(paragraphs, languages):
+    """Sort paragraphs by language, like a ``p[lang|=language]`` selector.
+
+    Languages are in the order of their first paragraph; those without
+    any get an empty list.
+
+    :rtype: dict[str, list[_Element]]
+    """
+    matches = {}
+    groups = {}
+    for p in paragraphs:
+        lang = p.attrs["lang"]
+        if lang not in matches:
+            matches[lang] = sorted(
+                language
+                for language in languages
+                if lang == language or lang.startswith(f"{language}-")
+            )
+        for language in matches[lang]:
+            groups.setdefault(language, []).append(p)
+    for language in sorted(languages):
+        groups.setdefault(language, [])
+    return groups
+
+
+class _Element:
+    """The part of a BeautifulSoup Tag that SAMIReader uses."""
+
+    __slots__ = ("name", "attrs", "contents", "parent")
+
+    def __init__(self, name, attrs, parent=None):
+        self.name = name
+        self.attrs = attrs
+        self.contents = []
+        self.parent = parent
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    def get_text(self):
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, NavigableString):
+                parts.append(node)
+            else:
+                stack.extend(reversed(node.contents))
+        return "".join(parts)
+
+    def __str__(self):
+        attrs = "".join(
+            f' {name}="{" ".join(value) if name == "class" else value}"'
+            for name, value in self.attrs.items()
+        )
+        return f"<{self.name}{attrs}>"
+
+
+class _ParagraphBuilder(SAMIParser):
+    """SAMIParser collecting <p> elements instead of a normalized document.
+
+    The elements hold what BeautifulSoup would find by parsing the
+    normalized document with lxml: text is decoded and its line breaks and
+    whitespace are normalized, the first of repeated attributes is kept and
+    void elements are empty. Nothing outside the paragraphs is kept.
+    """
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self.paragraphs = []
+        self._stack = []
+        self._paragraph = None
+        self._text = []
+
+    def _write_start(self, tag, attrs):
+        self._end_text()
+        parent = self._stack[-1] if self._stack else None
+        element = _Element(tag, self._build_attrs(attrs), parent)
+        if tag == "p":
+            self._paragraph = element
+            self.paragraphs.append(element)
+        elif self._paragraph is not None:
+            parent.contents.append(element)
+        if tag not in _VOID_ELEMENTS:
+            self._stack.append(element)
+
+    def _write_end(self, tag):
+        if tag in _VOID_ELEMENTS:
+            return
+        self._end_text()
+        if self._stack.pop() is self._paragraph:
+            self._paragraph = None
+
+    def _write_empty(self, tag):
+        self._write_start(tag, [])
+
+    def _write_text(self, text):
+        if self._paragraph is not None:
+            self._text.append(text)
+
+    def _end_text(self):
+        """Add the text written since the last tag to the open element."""
+        if not self._text:
+            return
+        text = "".join(self._text)
+        self._text = []
+        if not text:
+            return
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        if "&" in text:
+            text = unescape(text)
+        if not text.strip(_ASCII_SPACES):
+            text = "\n" if "\n" in text else " "
+        self._stack[-1].contents.append(NavigableString(text))
+
+    @staticmethod
+    def _build_attrs(attrs):
+        built = {}
+        for name, value in attrs:
+            name = name.lower()
+            if name in built:
+                continue
+            value = f"{value}"
+            if "&" in value:
+                value = unescape(value)
+            built[name] = value.split() if name == "class" else value
+        return built
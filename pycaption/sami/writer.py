@@ -4,7 +4,7 @@ Serializes pycaption CaptionSet objects into SAMI markup with CSS
 stylesheets, sync-based timing, and multi-language support.
 """
 
-from copy import deepcopy
+from bisect import bisect_left
 from xml.sax.saxutils import escape
 
 from bs4 import BeautifulSoup
@@ -35,11 +35,15 @@ class SAMIWriter(BaseWriter):
         super().__init__(*args, **kwargs)
         self._span_stack = []
         self.last_time = None
+        self._sync_times = []
+        self._syncs = []
 
     def write(self, caption_set):
         """Serialize a CaptionSet into a SAMI document string."""
-        caption_set = deepcopy(caption_set)
+        caption_set = self._relativize_captions(caption_set)
         sami = BeautifulSoup(SAMI_BASE_MARKUP, "lxml-xml")
+        self._sync_times = []
+        self._syncs = []
 
         caption_set.layout_info = self._relativize_and_fit_to_screen(
             caption_set.layout_info
@@ -58,13 +62,6 @@ class SAMIWriter(BaseWriter):
             )
 
             for caption in caption_set.get_captions(lang):
-                caption.layout_info = self._relativize_and_fit_to_screen(
-                    caption.layout_info
-                )
-                for node in caption.nodes:
-                    node.layout_info = self._relativize_and_fit_to_screen(
-                        node.layout_info
-                    )
                 sami = self._recreate_p_tag(caption, sami, lang, primary, caption_set)
 
         stylesheet = self._recreate_stylesheet(caption_set)
@@ -113,6 +110,9 @@ class SAMIWriter(BaseWriter):
         if lang == primary:
             sync = sami.new_tag("sync", start=time)
             sami.body.append(sync)
+            self._index_sync(sync, time)
+        elif self._sync_times is not None:
+            sync = self._find_indexed_sync(sami, time)
         else:
             sync = sami.find("sync", start=time)
             if sync is None:
@@ -120,6 +120,41 @@ class SAMIWriter(BaseWriter):
 
         return sami, sync
 
+    def _index_sync(self, sync, time):
+        """Add a <sync> tag appended to the document to the sync index.
+
+        The index (the sync times in increasing order, and their tags) only
+        works while the document is in chronological order; it is dropped
+        as soon as a sync is earlier than the one before it.
+        """
+        if self._sync_times is None:
+            return
+        if self._sync_times and time < self._sync_times[-1]:
+            self._sync_times = self._syncs = None
+            return
+        self._sync_times.append(time)
+        self._syncs.append(sync)
+
+    def _find_indexed_sync(self, sami, time):
+        """Find the <sync> tag at time with the sync index, or insert a new
+        one in chronological order, like _find_closest_sync.
+        """
+        times, syncs = self._sync_times, self._syncs
+        position = bisect_left(times, time)
+        if position < len(times) and times[position] == time:
+            return syncs[position]
+
+        sync = sami.new_tag("sync", start=time)
+        if not syncs:
+            return sync
+        if position:
+            syncs[position - 1].insert_after(sync)
+        else:
+            syncs[0].insert_before(sync)
+        times.insert(position, time)
+        syncs.insert(position, sync)
+        return sync
+
     @staticmethod
     def _find_closest_sync(sami, time):
         """Insert a new <sync> tag in chronological order among existing syncs."""
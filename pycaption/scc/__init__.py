@@ -1,6 +1,8 @@
-"""SCC (Scenarist Closed Captions) reader and writer for CEA-608 caption data."""
+"""SCC (Scenarist Closed Captions) reader, writer and live decoder for CEA-608
+caption data."""
 
+from .live import LiveSCCDecoder
 from .reader import SCCReader
 from .writer import SCC_TOKENS_PER_CAPTION_MAX, SCCWriter
 
-__all__ = ["SCCReader", "SCCWriter", "SCC_TOKENS_PER_CAPTION_MAX"]
+__all__ = ["SCCReader", "SCCWriter", "SCC_TOKENS_PER_CAPTION_MAX", "LiveSCCDecoder"]
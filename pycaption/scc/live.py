@@ -0,0 +1,225 @@
+"""Decoding of live CEA-608 captions, as their code words arrive.
+
+SCCReader needs a whole SCC file, and only returns its captions at the
+end. LiveSCCDecoder is fed the code words of a channel as they arrive,
+with their timecode, and returns the captions as soon as they are
+complete::
+
+    decoder = LiveSCCDecoder(lang="en-US")
+    for timecode, words in channel:  # e.g. "01:02:03;04", "9420 9420 94ae"
+        for caption in decoder.feed(timecode, words):
+            publish(caption)
+    for caption in decoder.close():
+        publish(caption)
+
+The pop-on, roll-up and paint-on buffers, the positioning and the pop-on
+captions on screen are kept from one call to the next, so the captions are
+the ones SCCReader reads from the same lines. A caption is returned once
+its times can no longer change, which for a caption still on screen may
+only be when the next one starts. To bound that delay, a caption that has
+been on screen for ``latency`` microseconds is returned in pieces: the
+part shown so far, then the next parts as time goes by.
+
+The decoder only keeps the captions it did not return yet, so its memory
+use does not grow with the length of the stream. Timecodes going back to
+00:00:00 at midnight are taken to be on the next day.
+"""
+
+from pycaption.exceptions import CaptionReadTimingError
+
+from .constants import HEADER, MICROSECONDS_PER_CODEWORD
+from .reader import _LINE_RE, _TIMECODE_RE, SCCReader, fix_last_captions_without_ending
+from .specialized_collections import CaptionCreator
+
+# The end of the last captions stored moves to the start of the next one if
+# it starts before this long after it (see TimingCorrectingCaptionList)
+_END_CORRECTION = 5 * MICROSECONDS_PER_CODEWORD + 1
+
+
+class LiveSCCDecoder:
+    """Decodes CEA-608 code words into captions, incrementally.
+
+    :param lang: The language of the captions.
+    :param simulate_roll_up: See SCCReader.read.
+    :param offset: Seconds subtracted from the caption times, see
+        SCCReader.read.
+    :param latency: Microseconds after which a caption still on screen is
+        returned, in pieces. None to only return complete captions. Below
+        five frames, a caption followed closely by the next one may end up
+        to five frames earlier than SCCReader would end it.
+    """
+
+    #: default latency, in microseconds
+    LATENCY = 4 * 1000 * 1000
+
+    def __init__(self, lang="en-US", simulate_roll_up=False, offset=0, latency=LATENCY):
+        self.lang = lang
+        self.latency = latency
+        self._reader = _LiveSCCReader()
+        self._reader.simulate_roll_up = simulate_roll_up
+        self._reader.time_translator.offset = offset * 1000000
+        self._reader.time_translator.wraps_at_midnight = True
+
+    def feed(self, timecode, words=""):
+        """Decode the code words starting at a timecode, one a frame.
+
+        Feeding a timecode without words lets the decoder know that time
+        has passed, so that it can return the captions whose latency ran
+        out.
+
+        :param timecode: ``HH:MM:SS;FF`` (drop frame) or ``HH:MM:SS:FF``
+        :param words: The code words, such as ``"9420 9420 94ae"``, or a
+            list of them.
+        :returns: The captions completed by these words, in the order
+            SCCReader would return them, then the pieces of the captions
+            on screen for longer than the latency.
+        :rtype: list[Caption]
+        :raises CaptionReadTimingError: if the timecode is invalid, in which
+            case the words are ignored.
+        """
+        if not _TIMECODE_RE.fullmatch(timecode):
+            raise CaptionReadTimingError(
+                "Timestamps should follow the hour:minute:seconds"
+                ";frames or hour:minute:seconds:frames format. Please correct "
+                f"the following time: {timecode}."
+            )
+        if not isinstance(words, str):
+            words = " ".join(words)
+        self._reader._translate_line(f"{timecode}\t{words}")
+        return self._release(self._reader.time_translator.get_time())
+
+    def feed_line(self, line):
+        """Decode a line of an SCC file, e.g. to follow a file being
+        written. The header and blank lines are skipped.
+
+        :type line: str
+        :rtype: list[Caption]
+        """
+        line = line.strip()
+        if not line or line == HEADER:
+            return []
+        timecode, words = _LINE_RE.match(line).groups()
+        return self.feed(timecode, words)
+
+    def close(self):
+        """Return the captions not returned yet, at the end of the stream.
+
+        The captions still on screen end 4 seconds after they started, as
+        the last captions of an SCC file do.
+
+        :rtype: list[Caption]
+        """
+        reader = self._reader
+        reader._flush_implicit_buffers(reader.buffer_dict.active_key)
+        collection = reader.caption_stash._collection
+        captions = [precaption.to_real_caption() for precaption in collection]
+        fix_last_captions_without_ending(captions)
+        captions = self._remaining_parts(collection, captions)
+        del collection[:]
+        return captions
+
+    def _release(self, now):
+        """Return the captions whose times are final, and pieces of those
+        on screen for longer than the latency.
+
+        :param now: the current time, in microseconds
+        :rtype: list[Caption]
+        """
+        reader = self._reader
+        collection = reader.caption_stash._collection
+        queue = reader.pop_ons_queue
+        # The captions stored from now on start at the earliest at: the
+        # pop-on captions when they were displayed, and the roll-up and
+        # paint-on ones at the time of the command before them
+        pending_starts = [cue.start for cue in queue]
+        if reader.buffer_dict.active_key in ("roll", "paint"):
+            pending_starts.append(reader.time)
+        earliest_start = min(pending_starts + [now])
+
+        # Only the last captions stored can still have their end changed
+        last_batch = {id(caption) for caption in collection._last_batch}
+        count = len(collection)
+        while count and id(collection[count - 1]) in last_batch:
+            count -= 1
+        if count < len(collection):
+            end = collection[-1].end
+            if end and earliest_start - end >= _END_CORRECTION:
+                count = len(collection)
+            elif end and self.latency is not None and now - end >= self.latency:
+                # The end is moved to the start of the next caption if it is
+                # already known, as it would be when that caption is stored.
+                # Otherwise it is kept: a caption starting after now would
+                # have moved it, by less than _END_CORRECTION.
+                if pending_starts and end < earliest_start:
+                    for precaption in collection[count:]:
+                        precaption.end = earliest_start
+                count = len(collection)
+        captions = self._remaining_parts(
+            collection[:count],
+            [precaption.to_real_caption() for precaption in collection[:count]],
+        )
+        del collection[:count]
+
+        if self.latency is None:
+            return captions
+
+        # The captions on screen, whose end is not known yet, are returned
+        # up to the time they are sure to be shown until
+        shown_until = reader.shown_until
+        for precaption in collection:
+            if not precaption.end:
+                start = shown_until.get(id(precaption), precaption.start)
+                if earliest_start - start >= self.latency:
+                    caption = precaption.to_real_caption()
+                    caption.start, caption.end = start, earliest_start
+                    caption.nodes = list(caption.nodes)
+                    captions.append(caption)
+                    shown_until[id(precaption)] = earliest_start
+        # The pop-on captions on screen end with the next command
+        for cue in queue:
+            start = shown_until.get(id(cue.buffer), cue.start)
+            if now - start >= self.latency:
+                creator = CaptionCreator()
+                creator.create_and_store(cue.buffer, start, now, caption_mode="pop_on")
+                captions.extend(creator.get_all())
+                shown_until[id(cue.buffer)] = now
+
+        return captions
+
+    def _remaining_parts(self, precaptions, captions):
+        """Return the parts of captions not returned yet.
+
+        :param precaptions: the PreCaptions the captions were made from,
+            which are forgotten
+        :type captions: list[Caption]
+        :rtype: list[Caption]
+        """
+        shown_until = self._reader.shown_until
+        remaining = []
+        for precaption, caption in zip(precaptions, captions):
+            start = shown_until.pop(id(precaption), None)
+            if start is not None:
+                if caption.end <= start:
+                    continue
+                caption.start = start
+            remaining.append(caption)
+        return remaining
+
+
+class _LiveSCCReader(SCCReader):
+    """SCCReader keeping track of the parts of captions returned early."""
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        # Time until which a caption was returned, by id of its PreCaption,
+        # or of the buffer of its PopOnCue
+        self.shown_until = {}
+
+    def _pop_on(self, end=0):
+        """Store the oldest pop-on cue, remembering what was returned of it."""
+        cue = self.pop_ons_queue[-1]
+        shown_until = self.shown_until.pop(id(cue.buffer), None)
+        super()._pop_on(end=end)
+        if shown_until is not None:
+            for precaption in self.caption_stash._still_editing:
+                self.shown_until[id(precaption)] = shown_until
@@ -80,6 +80,7 @@ http://www.theneitherworld.com/mcpoodle/SCC_TOOLS/DOCS/SCC_FORMAT.HTML
 import re
 from collections import deque
 from copy import deepcopy
+from functools import lru_cache, partial
 
 from pycaption.base import BaseReader, CaptionSet
 from pycaption.exceptions import (
@@ -88,6 +89,7 @@ from pycaption.exceptions import (
     CaptionReadTimingError,
     InvalidInputError,
 )
+from pycaption.timebase import FPS_29_97, FPS_30
 
 from .constants import (
     CHARACTERS,
@@ -107,6 +109,72 @@ from .specialized_collections import (
 )
 from .state_machines import DefaultProvidingPositionTracker
 
+# An SCC line: the timecode, the whitespace separating it from the code
+# words, then the space separated code words.
+_LINE_RE = re.compile(r"([0-9:;]*)[\s\t]*(.*)")
+
+# hours:minutes:seconds, the frames separator, then the frames
+_TIMECODE_RE = re.compile(r"(\d{2}):(\d{2}):(\d{2})([:;])(\d{1,2})")
+
+# Rate of the timecode frames, by frames separator. Drop-frame (";")
+# timecode runs at the same rate as wall clock. Non-drop-frame (":")
+# timecode runs "slow": 1 second of timecode is longer than an actual
+# second (1.001s).
+_TIMEBASES = {";": FPS_30, ":": FPS_29_97}
+
+# Timecode frames in a day, after which the timecode of a live stream goes
+# back to 00:00:00;00
+_FRAMES_PER_DAY = 24 * 60 * 60 * 30
+
+# Code word classes, combined as bit flags in _WORD_FLAGS
+_COMMAND = 1
+_PAC = 2
+_SPECIAL = 4
+_EXTENDED = 8
+_CUE_START = 16
+_TAB_OFFSET = 32
+# Words ignored when repeated for error correction...
+_DOUBLED = 64
+# ...and those also ignored after a repeated cue starting command.
+_DOUBLED_AFTER_STARTER = 128
+
+
+def _build_word_flags():
+    """Classify every known code word once, so the reader needs one lookup.
+
+    :rtype: dict[str, int]
+    """
+    flags = {"94a1": 0}
+
+    def mark(words, flag):
+        for word in words:
+            flags[word] = flags.get(word, 0) | flag
+
+    mark(COMMANDS, _COMMAND)
+    mark(
+        (
+            byte1 + byte2
+            for byte1, low_bytes in PAC_BYTES_TO_POSITIONING_MAP.items()
+            for byte2 in low_bytes
+        ),
+        _PAC,
+    )
+    mark(SPECIAL_CHARS, _SPECIAL)
+    mark(EXTENDED_CHARS, _EXTENDED)
+    mark(CUE_STARTING_COMMAND, _CUE_START)
+    mark(PAC_TAB_OFFSET_COMMANDS, _TAB_OFFSET)
+
+    for word, value in flags.items():
+        if value & (_PAC | _SPECIAL) or (value & _COMMAND and word != "94a1"):
+            value |= _DOUBLED
+        if value & (_DOUBLED | _EXTENDED) or word == "94a1":
+            value |= _DOUBLED_AFTER_STARTER
+        flags[word] = value
+    return flags
+
+
+_WORD_FLAGS = _build_word_flags()
+
 
 class NodeCreatorFactory:
     """Factory for InstructionNodeCreator instances sharing a position tracker.
@@ -181,6 +249,17 @@ class SCCReader(BaseReader):
         self.buffer_dict.add_change_observer(self._flush_implicit_buffers)
         self.buffer_dict.set_active("pop")
 
+        self._command_handlers = {
+            "9420": self._cmd_pop_on,
+            "9429": self._cmd_paint_on,
+            "94ae": self._cmd_erase_non_displayed,
+            "942f": self._cmd_end_of_caption,
+            "94ad": self._cmd_carriage_return,
+            "942c": self._cmd_erase_displayed,
+        }
+        for word in self._ROLL_UP_DEPTH:
+            self._command_handlers[word] = partial(self._cmd_roll_up, word)
+
         self.pop_ons_queue = deque()
 
         self.roll_rows = []
@@ -312,40 +391,27 @@ class SCCReader(BaseReader):
         if line.strip() == "":
             return
 
-        # split line in timestamp and words
-        r = re.compile(r"([0-9:;]*)([\s\t]*)((.)*)")
-        parts = r.findall(line.lower())
-
-        self.time_translator.start_at(parts[0][0])
-        word_list = parts[0][2].split(" ")
-
-        for idx, word in enumerate(word_list):
-            word = word.strip()
-            if len(word) == 4:
-                # Look ahead for the next command, skipping the duplicate
-                # that SCC uses for error-correction (same word repeated).
-                next_idx = idx + 1
-                if next_idx < len(word_list) and word_list[next_idx].strip() == word:
-                    next_idx += 1
-                next_command = (
-                    word_list[next_idx] if next_idx < len(word_list) else None
-                )
-                self._translate_word(word=word, next_command=next_command)
+        timecode, words = _LINE_RE.match(line.lower()).groups()
+        self.time_translator.start_at(timecode)
+
+        for word, next_command in _tokenize_words(words):
+            self._translate_word(word=word, next_command=next_command)
 
     def _translate_word(self, word, next_command=None):
         """Dispatch a single 4-char hex word as command, special char, or text."""
-        if self._handle_double_command(word):
+        flags = _WORD_FLAGS.get(word, 0)
+        if self._handle_double_command(word, flags):
             # count frames for timing
             self.time_translator.increment_frames()
             return
-        if word in COMMANDS or _is_pac_command(word):
+        if flags & (_COMMAND | _PAC):
             self._translate_command(word=word, next_command=next_command)
 
         # second, check if word is a special character
-        elif word in SPECIAL_CHARS:
+        elif flags & _SPECIAL:
             self._translate_special_char(word)
 
-        elif word in EXTENDED_CHARS:
+        elif flags & _EXTENDED:
             self._translate_extended_char(word)
 
         # third, try to convert word into 2 characters
@@ -355,11 +421,13 @@ class SCCReader(BaseReader):
         # count frames for timing only after processing a command
         self.time_translator.increment_frames()
 
-    def _handle_double_command(self, word):
+    def _handle_double_command(self, word, flags):
         """Detect and skip redundant doubled commands used for error correction.
 
         Returns True if this word is the second copy and should be skipped.
 
+        :param flags: the word's classification, from _WORD_FLAGS
+
         :rtype: bool
         """
         # If the caption is to be broadcast, each of the commands are doubled
@@ -370,28 +438,25 @@ class SCCReader(BaseReader):
         # doubled special characters and doubled extended characters
         # with only one member of each pair being displayed.
 
-        doubled_types = (
-            (word != "94a1" and word in COMMANDS)
-            or _is_pac_command(word)
-            or word in SPECIAL_CHARS
-        )
         if self.double_starter:
-            doubled_types = doubled_types or word in EXTENDED_CHARS or word == "94a1"
+            doubled_types = flags & _DOUBLED_AFTER_STARTER
+        else:
+            doubled_types = flags & _DOUBLED
 
-        if word in CUE_STARTING_COMMAND and word != self.last_command:
+        if flags & _CUE_START and word != self.last_command:
             self.double_starter = False
 
         if doubled_types and word == self.last_command:
-            if word in CUE_STARTING_COMMAND:
+            if flags & _CUE_START:
                 self.double_starter = True
             self.last_command = ""
             return True
             # Fix for the <position> <tab offset> <position> <tab offset>
             # repetition
-        elif _is_pac_command(word) and word in self.last_command:
+        elif flags & _PAC and word in self.last_command:
             self.last_command = ""
             return True
-        elif word in PAC_TAB_OFFSET_COMMANDS:
+        elif flags & _TAB_OFFSET:
             if _is_pac_command(self.last_command):
                 self.last_command += f" {word}"
                 return False
@@ -421,22 +486,11 @@ class SCCReader(BaseReader):
 
     def _translate_command(self, word, next_command=None):
         """Route a CEA-608 control command to the appropriate handler."""
-        if word == "9420":
-            self._cmd_pop_on()
-        elif word == "9429":
-            self._cmd_paint_on()
-        elif word in self._ROLL_UP_DEPTH:
-            self._cmd_roll_up(word)
-        elif word == "94ae":
-            self._cmd_erase_non_displayed()
-        elif word == "942f":
-            self._cmd_end_of_caption()
-        elif word == "94ad":
-            self._cmd_carriage_return()
-        elif word == "942c":
-            self._cmd_erase_displayed()
-        else:
+        handler = self._command_handlers.get(word)
+        if handler is None:
             self.buffer.interpret_command(command=word, next_command=next_command)
+        else:
+            handler()
 
     def _cmd_pop_on(self):
         """Handle Resume Caption Loading [RCL] - switch to pop-on mode."""
@@ -585,60 +639,42 @@ class SCCReader(BaseReader):
 
 
 class _SccTimeTranslator:
-    """Converts SCC time to microseconds, keeping track of frames passed"""
+    """Converts SCC time to microseconds, keeping track of frames passed
+
+    Time is kept as a whole number of frames: the timecode of a line is
+    parsed once, then each code word adds one frame.
+    """
 
     def __init__(self):
-        self._time = "00:00:00;00"
+        self._timecode = "00:00:00;00"
+        self._start_frame = 0
+        self._timebase = _TIMEBASES[";"]
 
         # microseconds. The offset from which we begin the time calculation
         self.offset = 0
         self._frames = 0
 
+        # If set, a timecode more than half a day before the previous one
+        # is taken to be on the next day
+        self.wraps_at_midnight = False
+        self.days = 0
+
     def get_time(self):
         """Returns the time, in microseconds. Takes into account the number of
         frames passed, and the offset
 
         :rtype: int
+        :raises CaptionReadTimingError: if the current timecode is invalid
         """
-        return self._translate_time(
-            self._time[:-2] + str(int(self._time[-2:]) + self._frames), self.offset
-        )
-
-    @staticmethod
-    def _translate_time(stamp, offset):
-        """
-        :param stamp:
-        :type offset: int
-        :param offset: Subtract this many microseconds from the calculated time
-            Helpful for when the captions are off by some time interval.
-        :rtype: int
-        """
-        if not re.match(r"\d{2}:\d{2}:\d{2}[:;]\d{1,2}", stamp):
+        if self._start_frame is None:
             raise CaptionReadTimingError(
                 "Timestamps should follow the hour:minute:seconds"
                 ";frames or hour:minute:seconds:frames format. Please correct "
-                f"the following time: {stamp}."
+                f"the following time: {self._timecode}."
             )
 
-        if ";" in stamp:
-            # Drop-frame timebase runs at the same rate as wall clock
-            seconds_per_timestamp_second = 1.0
-        else:
-            # Non-drop-frame timebase runs "slow"
-            # 1 second of timecode is longer than an actual second (1.001s)
-            seconds_per_timestamp_second = 1001.0 / 1000.0
-
-        time_split = stamp.replace(";", ":").split(":")
-
-        timestamp_seconds = (
-            int(time_split[0]) * 3600
-            + int(time_split[1]) * 60
-            + int(time_split[2])
-            + int(time_split[3]) / 30.0
-        )
-
-        seconds = timestamp_seconds * seconds_per_timestamp_second
-        microseconds = seconds * 1000 * 1000 - offset
+        frames = self._start_frame + self._frames
+        microseconds = self._timebase.microseconds_at(frames) - self.offset
 
         if microseconds < 0:
             microseconds = 0
@@ -648,11 +684,31 @@ class _SccTimeTranslator:
     def start_at(self, timespec):
         """Reset the counter to the given time
 
+        An invalid timespec is only reported when a time is requested.
+
         :type timespec: str
         """
-        self._time = timespec
+        self._timecode = timespec
         self._frames = 0
 
+        match = _TIMECODE_RE.fullmatch(timespec)
+        if match is None:
+            self._start_frame = None
+            return
+
+        hours, minutes, seconds, separator, frames = match.groups()
+        seconds = (int(hours) * 60 + int(minutes)) * 60 + int(seconds)
+        start_frame = seconds * 30 + int(frames)
+        if (
+            self.wraps_at_midnight
+            and self._start_frame is not None
+            and start_frame + self.days * _FRAMES_PER_DAY
+            < self._start_frame - _FRAMES_PER_DAY // 2
+        ):
+            self.days += 1
+        self._start_frame = start_frame + self.days * _FRAMES_PER_DAY
+        self._timebase = _TIMEBASES[separator]
+
     def increment_frames(self):
         """After a command was processed, we'd increment the number of frames"""
         self._frames += 1
@@ -666,11 +722,35 @@ def _is_pac_command(word):
 
     :rtype: bool
     """
-    byte1, byte2 = word[:2], word[2:]
+    return bool(_WORD_FLAGS.get(word, 0) & _PAC)
 
-    try:
-        PAC_BYTES_TO_POSITIONING_MAP[byte1][byte2]
-    except KeyError:
-        return False
-    else:
-        return True
+
+@lru_cache(maxsize=4096)
+def _tokenize_words(words):
+    """Split the code words of an SCC line into (word, next_command) pairs.
+
+    Only 4-character words are kept. ``next_command`` is the word that
+    follows, skipping the duplicate SCC uses for error correction (the same
+    word repeated), or None at the end of the line.
+
+    Broadcast files repeat the same word sequences over and over, so the
+    result is cached.
+
+    :type words: str
+    :param words: the lowercased part of the line after the timecode
+    :rtype: tuple[tuple[str, str | None], ...]
+    """
+    raw_words = words.split(" ")
+    stripped = [word.strip() for word in raw_words]
+    count = len(stripped)
+    tokens = []
+
+    for idx, word in enumerate(stripped):
+        if len(word) != 4:
+            continue
+        next_idx = idx + 1
+        if next_idx < count and stripped[next_idx] == word:
+            next_idx += 1
+        tokens.append((word, raw_words[next_idx] if next_idx < count else None))
+
+    return tuple(tokens)
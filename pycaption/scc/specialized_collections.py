@@ -6,6 +6,7 @@ raw CEA-608 commands into CaptionNode trees.
 """
 
 import collections
+from functools import lru_cache
 
 from ..base import Caption, CaptionList, CaptionNode
 from ..geometry import (
@@ -613,9 +614,12 @@ class InstructionNodeCreator:
         return None
 
 
+@lru_cache(maxsize=None)
 def _get_layout_from_tuple(position_tuple):
     """Create a Layout object from the positioning information given
 
+    Layouts are immutable, so the one of every position is created once.
+
     The row can have a value from 1 to 15 inclusive. (vertical positioning)
     The column can have a value from 0 to 31 inclusive. (horizontal)
 
@@ -1,7 +1,42 @@
 """Human-readable translation of raw SCC hex codes for debugging purposes."""
 
+import re
+
 from pycaption.scc.constants import ALL_CHARACTERS, COMMAND_LABELS
 
+_WORD_RE = re.compile(r"\S+")
+
+
+class _TranslationTable(dict):
+    """Maps an SCC word to its translation, computing each one only once.
+
+    Only known words are stored, so the table stays bounded by the size of
+    the CEA-608 code space however long the translated content is.
+    """
+
+    def __init__(self, brackets):
+        super().__init__()
+        self.opening_bracket, self.closing_bracket = brackets if brackets else ("", "")
+
+    def __missing__(self, elem):
+        name = COMMAND_LABELS.get(elem, ALL_CHARACTERS.get(elem))
+        # If a 2 byte command was not found, try retrieving 1 byte characters
+        if not name:
+            char1 = ALL_CHARACTERS.get(elem[:2])
+            char2 = ALL_CHARACTERS.get(elem[2:])
+            if char1 is not None and char2 is not None:
+                name = f"{char1}{char2}"
+        if not name:
+            # Not cached: timecodes alone would grow the table with every line
+            return elem
+        translation = f"{self.opening_bracket}{name}{self.closing_bracket}"
+        self[elem] = translation
+        return translation
+
+    def translate(self, text):
+        """Replace every whitespace separated word of text."""
+        return _WORD_RE.sub(lambda match: self[match.group()], text)
+
 
 def translate_scc(scc_content, brackets="[]"):
     """
@@ -18,18 +53,25 @@ def translate_scc(scc_content, brackets="[]"):
     :return: Translated SCC captions
     :rtype: str
     """
-    opening_bracket, closing_bracket = brackets if brackets else ("", "")
-    scc_elements = set(scc_content.split())
-    for elem in scc_elements:
-        name = COMMAND_LABELS.get(elem, ALL_CHARACTERS.get(elem))
-        # If a 2 byte command was not found, try retrieving 1 byte characters
-        if not name:
-            char1 = ALL_CHARACTERS.get(elem[:2])
-            char2 = ALL_CHARACTERS.get(elem[2:])
-            if char1 is not None and char2 is not None:
-                name = f"{char1}{char2}"
-        if name:
-            scc_content = scc_content.replace(
-                elem, f"{opening_bracket}{name}{closing_bracket}"
-            )
-    return scc_content
+    return _TranslationTable(brackets).translate(scc_content)
+
+
+def iter_translate_scc(lines, brackets="[]"):
+    """
+    Lazily translate SCC content line by line, see translate_scc
+
+    Useful to translate long files without loading them in memory::
+
+        with open("captions.scc") as scc_file:
+            for line in iter_translate_scc(scc_file):
+                print(line, end="")
+
+    :param lines: a text file object or any iterable of lines
+    :param brackets: Brackets to group the translated content of a command
+    :type brackets: str
+    :return: the translated lines, with their line endings kept
+    :rtype: Iterator[str]
+    """
+    table = _TranslationTable(brackets)
+    for line in lines:
+        yield table.translate(line)
@@ -4,12 +4,11 @@ Converts CaptionSet objects to SCC format, supporting pop-on, roll-up,
 and paint-on caption modes with proper timing, positioning, and styling.
 """
 
-import math
 import textwrap
-from copy import deepcopy
 
 from pycaption.base import BaseWriter, CaptionNode
 from pycaption.geometry import HorizontalAlignmentEnum, UnitEnum
+from pycaption.timebase import FPS_29_97
 
 from .constants import (
     CHARACTER_TO_CODE,
@@ -71,6 +70,8 @@ class SCCWriter(BaseWriter):
     non-drop-frame timecode formats.
     """
 
+    CACHE_OPTIONS = BaseWriter.CACHE_OPTIONS + ("drop_frame",)
+
     def __init__(self, *args, drop_frame=False, **kw):
         super().__init__(*args, **kw)
         self.drop_frame = drop_frame
@@ -86,8 +87,6 @@ class SCCWriter(BaseWriter):
         if caption_set.is_empty():
             return output
 
-        caption_set = deepcopy(caption_set)
-
         lang = list(caption_set.get_languages())[0]
         captions = caption_set.get_captions(lang)
         regions = caption_set.get_regions()
@@ -551,47 +550,19 @@ class SCCWriter(BaseWriter):
 
     def _microseconds_to_frame(self, microseconds):
         """Convert microseconds to a frame count for timestamp deduplication.
-        Applies the 1000/1001 NTSC pulldown factor for both modes."""
-        if self.drop_frame:
-            return math.floor(microseconds * 30 / 1_000_000 * 1000 / 1001 + 1e-9)
-        seconds_float = microseconds / 1_000_000.0 * 1000.0 / 1001.0
-        return math.floor(seconds_float * 30)
+        Frames are counted at the NTSC rate of 30000/1001 in both modes."""
+        return FPS_29_97.frame_at(microseconds)
 
     @staticmethod
     def _format_timestamp_ndf(microseconds):
         """Format as non-drop-frame timecode (HH:MM:SS:FF).
-        Applies the 1000/1001 pulldown: 1 second of timecode = 1.001 real
-        seconds. Frames are computed at 30fps within each second."""
-        seconds_float = microseconds / 1_000_000.0
-        seconds_float *= 1000.0 / 1001.0
-        hours = math.floor(seconds_float / 3600)
-        seconds_float -= hours * 3600
-        minutes = math.floor(seconds_float / 60)
-        seconds_float -= minutes * 60
-        seconds = math.floor(seconds_float)
-        seconds_float -= seconds
-        frames = math.floor(seconds_float * 30)
-        return f"{hours:02}:{minutes:02}:{seconds:02}:{frames:02}"
+        Frames are counted at 29.97fps and labelled at 30 per second, so
+        1 second of timecode = 1.001 real seconds."""
+        return FPS_29_97.timecode(FPS_29_97.frame_at(microseconds))
 
     @staticmethod
     def _format_timestamp_df(microseconds):
         """Format as drop-frame timecode (HH:MM:SS;FF).
         Skips frames 0 and 1 at each minute boundary (except every 10th
         minute) to keep timecode in sync with wall-clock time at 29.97fps."""
-        total_frames = math.floor(microseconds * 30 / 1_000_000 * 1000 / 1001 + 1e-9)
-        fps = 30
-        frames_per_10min = 17982  # 10*60*30 - 2*9
-        d = total_frames // frames_per_10min
-        m = total_frames % frames_per_10min
-        if m < 2:
-            tc_frames = total_frames + 18 * d
-        else:
-            tc_frames = total_frames + 18 * d + 2 * ((m - 2) // 1798)
-
-        hours = tc_frames // (fps * 60 * 60)
-        rem = tc_frames % (fps * 60 * 60)
-        minutes = rem // (fps * 60)
-        rem = rem % (fps * 60)
-        seconds = rem // fps
-        frames = rem % fps
-        return f"{hours:02}:{minutes:02}:{seconds:02};{frames:02}"
+        return FPS_29_97.timecode(FPS_29_97.frame_at(microseconds), drop_frame=True)
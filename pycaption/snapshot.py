@@ -0,0 +1,762 @@
+"""Binary snapshots of parsed caption sets.
+
+A snapshot stores a CaptionSet (its captions and their nodes, styles,
+regions and layouts) so that it loads much faster than its source file
+parses, in a fraction of the size of a pickle::
+
+    data = dump_snapshot(caption_set)
+    caption_set = load_snapshot(data)
+
+    # Memory mapped: captions are only decoded when they are requested
+    with open_snapshot("master.snapshot") as snapshot:
+        caption = snapshot.get_caption("en-US", 1200)
+
+A snapshot (version 1) is made of a 16 bytes header: the magic
+``b"PYCSNAP\\x00"``, the format version and the number of sections
+(uint16), 4 reserved bytes, followed by the offset and size of every
+section (uint64), and the sections themselves, aligned on 8 bytes.
+Integers are little-endian.
+
+Every section is a flat column of fixed size items:
+
+- the values: every string, number, style dict, enum member or geometry
+  object, stored once and referred to by its position (0 stands for
+  None). Containers and geometry objects refer to the values in them;
+- the languages, and the styles, regions and layout of the caption set;
+- one column per caption attribute, and one per node attribute.
+
+So a caption can be read straight from the buffer without decoding the
+others. Dicts and lists are stored once per object, not once per equal
+value, so loading never makes two captions share a mutable style.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+from .base import Caption, CaptionList, CaptionNode, CaptionSet
+from .exceptions import CaptionReadError, CaptionReadSyntaxError
+from .geometry import (
+    Alignment,
+    HorizontalAlignmentEnum,
+    Layout,
+    Padding,
+    Point,
+    Size,
+    Stretch,
+    UnitEnum,
+    VerticalAlignmentEnum,
+    WritingDirectionEnum,
+)
+
+MAGIC = b"PYCSNAP\x00"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sHH4x")
+_SECTION = struct.Struct("<QQc7x")
+_FLOAT = struct.Struct("<d")
+_INT64 = struct.Struct("<q")
+_ALIGNMENT = 8
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+# Sections, in the order of the header, and the type of their items
+_SECTIONS = (
+    ("value_offsets", "I"),
+    ("value_data", "B"),
+    # styles, regions and layout_info of the caption set
+    ("caption_set", "I"),
+    # language, first caption, number of captions and layout, per language
+    ("language_table", "I"),
+    ("starts", "q"),
+    ("ends", "q"),
+    # bit 0: the start is a float, bit 1: the end is a float
+    ("float_times", "B"),
+    # the first node of every caption, then the total number of nodes
+    ("first_nodes", "I"),
+    ("styles", "I"),
+    ("layouts", "I"),
+    ("caption_modes", "I"),
+    ("roll_up_rows", "I"),
+    ("node_types", "B"),
+    ("node_contents", "I"),
+    ("node_starts", "I"),
+    ("node_positions", "I"),
+    ("node_layouts", "I"),
+)
+
+# Value tags
+_TRUE = ord("T")
+_FALSE = ord("F")
+_INT = ord("i")
+_FLOAT_TAG = ord("f")
+_STR = ord("s")
+_BYTES = ord("b")
+_LIST = ord("l")
+_TUPLE = ord("t")
+_DICT = ord("d")
+_ENUM = ord("e")
+_GEOMETRY = ord("g")
+
+# Codes of the enum and geometry classes. New classes get new codes, the
+# existing ones never change.
+_ENUMS = (
+    UnitEnum,
+    VerticalAlignmentEnum,
+    HorizontalAlignmentEnum,
+    WritingDirectionEnum,
+)
+_GEOMETRIES = (Layout, Point, Stretch, Size, Padding, Alignment)
+_ENUM_CODES = {cls: code for code, cls in enumerate(_ENUMS)}
+_GEOMETRY_CODES = {cls: code for code, cls in enumerate(_GEOMETRIES)}
+
+# The types a section of each type may be stored as: the unsigned ones
+# are stored with the narrowest type holding their items.
+_TYPECODES = {"B": "B", "I": "BHI", "q": "q"}
+
+_NODE_TYPES = frozenset({CaptionNode.TEXT, CaptionNode.STYLE, CaptionNode.BREAK})
+
+# Errors of decoding damaged data, reported as CaptionReadSyntaxError
+_DECODING_ERRORS = (IndexError, KeyError, TypeError, ValueError, struct.error)
+
+_MISSING = object()
+
+
+class _Container:
+    """A decoded list, tuple or dict: the references of its items.
+
+    A new container is built every time it is requested, so captions never
+    share a mutable style.
+    """
+
+    __slots__ = ("tag", "references")
+
+    def __init__(self, tag, references):
+        self.tag = tag
+        self.references = references
+
+
+def dump_snapshot(caption_set):
+    """Return the snapshot of a CaptionSet.
+
+    :type caption_set: CaptionSet
+    :rtype: bytes
+    :raises TypeError: if a caption time is neither an int nor a float, or
+        a style, region or node holds a value of another type than None,
+        bool, int, float, str, bytes, list, tuple, dict, the geometry
+        objects and their enums
+    """
+    return _SnapshotWriter().write(caption_set)
+
+
+def load_snapshot(data):
+    """Return the CaptionSet of a snapshot.
+
+    :param data: the snapshot, as bytes or any other buffer
+    :rtype: CaptionSet
+    :raises CaptionReadSyntaxError: if data is not a valid snapshot
+    :raises CaptionReadError: if the snapshot format version is not
+        supported
+    """
+    with CaptionSetSnapshot(data) as snapshot:
+        return snapshot.to_caption_set()
+
+
+def open_snapshot(path):
+    """Open a snapshot file, memory mapped.
+
+    Close the returned snapshot, or use it as a context manager, to unmap
+    the file. The captions it returned remain valid.
+
+    :param path: path of the snapshot file
+    :rtype: CaptionSetSnapshot
+    """
+    with open(path, "rb") as snapshot_file:
+        buffer = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+    return CaptionSetSnapshot(buffer, _owned=True)
+
+
+def _write_varint(data, number):
+    """Append a non negative number to data, 7 bits a byte."""
+    while number > 0x7F:
+        data.append(number & 0x7F | 0x80)
+        number >>= 7
+    data.append(number)
+
+
+def _read_varints(data, position, end):
+    """Return the numbers written by _write_varint in data[position:end].
+
+    :raises ValueError: if the last number is truncated
+    """
+    numbers = []
+    number = shift = 0
+    for byte in data[position:end]:
+        number |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            numbers.append(number)
+            number = shift = 0
+    if shift:
+        raise ValueError("Truncated number")
+    return numbers
+
+
+class _SnapshotWriter:
+    """Builds the sections of one snapshot."""
+
+    def __init__(self):
+        # value key -> value reference
+        self._refs = {}
+        self._value_offsets = array("I", [0])
+        self._value_data = bytearray()
+
+    def write(self, caption_set):
+        columns = {name: array(typecode) for name, typecode in _SECTIONS}
+        columns["caption_set"].extend(
+            [
+                self.ref(dict(caption_set.get_styles())),
+                self.ref(caption_set.get_regions()),
+                self.ref(caption_set.layout_info),
+            ]
+        )
+
+        starts, ends = columns["starts"], columns["ends"]
+        float_times, first_nodes = columns["float_times"], columns["first_nodes"]
+        styles, layouts = columns["styles"], columns["layouts"]
+        caption_modes, roll_up_rows = columns["caption_modes"], columns["roll_up_rows"]
+        node_types, node_contents = columns["node_types"], columns["node_contents"]
+        node_starts, node_positions = columns["node_starts"], columns["node_positions"]
+        node_layouts = columns["node_layouts"]
+        ref = self.ref
+
+        for lang in caption_set.get_languages():
+            captions = caption_set.get_captions(lang)
+            columns["language_table"].extend(
+                [
+                    ref(lang),
+                    len(starts),
+                    len(captions),
+                    ref(getattr(captions, "layout_info", None)),
+                ]
+            )
+            for caption in captions:
+                float_time = 0
+                for column, time, flag in (
+                    (starts, caption.start, 1),
+                    (ends, caption.end, 2),
+                ):
+                    if type(time) is int:
+                        column.append(time)
+                    elif type(time) is float:
+                        column.append(_INT64.unpack(_FLOAT.pack(time))[0])
+                        float_time |= flag
+                    else:
+                        raise TypeError(f"Caption times must be numbers: {time!r}")
+                float_times.append(float_time)
+                first_nodes.append(len(node_types))
+                styles.append(ref(caption.style))
+                layouts.append(ref(caption.layout_info))
+                caption_modes.append(ref(caption.caption_mode))
+                roll_up_rows.append(ref(caption.roll_up_rows))
+                for node in caption.nodes:
+                    node_types.append(node.type_)
+                    node_contents.append(ref(node.content))
+                    node_starts.append(ref(node.start))
+                    node_positions.append(ref(node.position))
+                    node_layouts.append(ref(node.layout_info))
+        first_nodes.append(len(node_types))
+
+        columns["value_offsets"] = self._value_offsets
+        columns["value_data"] = self._value_data
+        return self._join(columns)
+
+    @staticmethod
+    def _join(columns):
+        """Return the header followed by the aligned sections."""
+        sections = []
+        for name, typecode in _SECTIONS:
+            column = columns[name]
+            if typecode == "I":
+                # The narrowest type holding every item
+                largest = max(column, default=0)
+                typecode = (
+                    "B" if largest < 1 << 8 else "H" if largest < 1 << 16 else "I"
+                )
+                column = array(typecode, column)
+            if not _LITTLE_ENDIAN and typecode != "B":
+                column = array(typecode, column)
+                column.byteswap()
+            sections.append((typecode, bytes(column)))
+
+        offset = _HEADER.size + _SECTION.size * len(sections)
+        header = [_HEADER.pack(MAGIC, VERSION, len(sections))]
+        body = []
+        for typecode, section in sections:
+            padding = -offset % _ALIGNMENT
+            body.append(b"\x00" * padding)
+            offset += padding
+            header.append(_SECTION.pack(offset, len(section), typecode.encode()))
+            body.append(section)
+            offset += len(section)
+        return b"".join(header + body)
+
+    def ref(self, value):
+        """Return the reference of value, storing it on first use."""
+        if value is None:
+            return 0
+        kind = type(value)
+        # Containers are keyed on the references of their items, so equal
+        # containers are stored once.
+        if kind is list or kind is tuple:
+            key = (kind, *[self.ref(item) for item in value])
+        elif kind is dict:
+            key = (kind, *[self.ref(item) for pair in value.items() for item in pair])
+        elif kind is float:
+            # -0.0 == 0.0, but they are different values
+            key = (kind, value.hex())
+        else:
+            key = (kind, value)
+        reference = self._refs.get(key)
+        if reference is None:
+            self._value_data += self._encode(value, kind, key)
+            self._value_offsets.append(len(self._value_data))
+            reference = self._refs[key] = len(self._value_offsets) - 1
+        return reference
+
+    def _encode(self, value, kind, key):
+        """Return the tag and the data of a value."""
+        data = bytearray()
+        if kind is str:
+            data.append(_STR)
+            data += value.encode("utf-8", "surrogatepass")
+        elif kind is bool:
+            data.append(_TRUE if value else _FALSE)
+        elif kind is int:
+            data.append(_INT)
+            # zigzag: small negative numbers stay short
+            _write_varint(data, value * 2 if value >= 0 else -value * 2 - 1)
+        elif kind is float:
+            data.append(_FLOAT_TAG)
+            data += _FLOAT.pack(value)
+        elif kind is bytes:
+            data.append(_BYTES)
+            data += value
+        elif kind is list or kind is tuple or kind is dict:
+            data.append(_LIST if kind is list else _TUPLE if kind is tuple else _DICT)
+            for item in key[1:]:
+                _write_varint(data, item)
+        elif kind in _ENUM_CODES:
+            data += bytes([_ENUM, _ENUM_CODES[kind]])
+            data += value.name.encode("ascii")
+        elif kind in _GEOMETRY_CODES:
+            fields = [self.ref(getattr(value, name)) for name in kind._fields]
+            data += bytes([_GEOMETRY, _GEOMETRY_CODES[kind]])
+            for item in fields:
+                _write_varint(data, item)
+        else:
+            raise TypeError(f"Values of type {kind.__name__} cannot be stored")
+        return data
+
+
+class CaptionSetSnapshot:
+    """A snapshot, read on demand.
+
+    Opening a snapshot only checks its header and the sizes of its
+    sections: values, captions and nodes are decoded, and checked, when
+    they are requested, so a few captions can be read from a large
+    snapshot without building all of them. Use ``open_snapshot`` to open a
+    file memory mapped.
+
+    Damaged data raises CaptionReadSyntaxError, when it is opened or when
+    the damaged part is decoded.
+    """
+
+    def __init__(self, data, _owned=False):
+        """
+        :param data: the snapshot, as bytes or any other buffer
+        :raises CaptionReadSyntaxError: if data is not a valid snapshot
+        :raises CaptionReadError: if the snapshot format version is not
+            supported
+        """
+        self._buffer = data
+        self._owned = _owned
+        self._views = []
+        try:
+            self._open(memoryview(data))
+        except BaseException:
+            self.close()
+            raise
+
+    def _open(self, view):
+        if len(view) < _HEADER.size or bytes(view[: len(MAGIC)]) != MAGIC:
+            raise CaptionReadSyntaxError("Not a caption snapshot")
+        _, version, count = _HEADER.unpack_from(view)
+        if version != VERSION:
+            raise CaptionReadError(f"Unsupported caption snapshot version: {version}")
+        if count < len(_SECTIONS) or len(view) < _HEADER.size + count * _SECTION.size:
+            raise CaptionReadSyntaxError("Truncated caption snapshot")
+
+        self._views.append(view)
+        sections_start = _HEADER.size + count * _SECTION.size
+        for index, (name, expected) in enumerate(_SECTIONS):
+            offset, size, typecode = _SECTION.unpack_from(
+                view, _HEADER.size + index * _SECTION.size
+            )
+            typecode = typecode.decode("latin-1")
+            if (
+                typecode not in _TYPECODES[expected]
+                or offset < sections_start
+                or offset % _ALIGNMENT
+            ):
+                raise CaptionReadSyntaxError(
+                    f"Invalid caption snapshot section: {name}"
+                )
+            if offset + size > len(view) or size % array(typecode).itemsize:
+                raise CaptionReadSyntaxError("Truncated caption snapshot")
+            setattr(self, f"_{name}", self._column(view, offset, size, typecode))
+        self._check_sections()
+
+        self._values = [_MISSING] * len(self._value_offsets)
+        self._values[0] = None
+        self._languages = {}
+        table = self._language_table
+        for index in range(0, len(table), 4):
+            lang = self._value(table[index])
+            first, count, layout = table[index + 1 : index + 4]
+            if type(lang) is not str or first + count > len(self._starts):
+                raise CaptionReadSyntaxError("Invalid caption snapshot language")
+            self._languages[lang] = (first, count, layout)
+
+    def _check_sections(self):
+        """Check that the sizes of the sections agree with each other."""
+        captions = len(self._starts)
+        nodes = len(self._node_types)
+        value_offsets = self._value_offsets
+        if (
+            len(self._caption_set) != 3
+            or len(self._language_table) % 4
+            or len(self._first_nodes) != captions + 1
+            or any(
+                len(getattr(self, f"_{name}")) != captions
+                for name in (
+                    "ends",
+                    "float_times",
+                    "styles",
+                    "layouts",
+                    "caption_modes",
+                    "roll_up_rows",
+                )
+            )
+            or any(
+                len(getattr(self, f"_{name}")) != nodes
+                for name in (
+                    "node_contents",
+                    "node_starts",
+                    "node_positions",
+                    "node_layouts",
+                )
+            )
+            or not value_offsets
+            or value_offsets[0] != 0
+            or value_offsets[-1] > len(self._value_data)
+        ):
+            raise CaptionReadSyntaxError("Inconsistent caption snapshot sections")
+
+    def _column(self, view, offset, size, typecode):
+        """Return a section as a sequence of its items."""
+        if typecode == "B":
+            column = view[offset : offset + size]
+        elif _LITTLE_ENDIAN:
+            column = view[offset : offset + size].cast(typecode)
+        else:
+            column = array(typecode, view[offset : offset + size])
+            column.byteswap()
+            return column
+        self._views.append(column)
+        return column
+
+    def close(self):
+        """Release the buffer, and unmap the file opened by
+        ``open_snapshot``."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if self._owned:
+            self._buffer.close()
+        self._buffer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def layout_info(self):
+        """The layout of the caption set."""
+        return self._layout(self._caption_set[2])
+
+    def get_styles(self):
+        """Return the styles of the caption set, as sorted (selector, rules)
+        pairs like ``CaptionSet.get_styles``.
+
+        :rtype: list[tuple[str, dict]]
+        """
+        try:
+            return sorted(self._dict(self._caption_set[0]).items())
+        except TypeError as error:
+            raise CaptionReadSyntaxError("Invalid caption snapshot styles") from error
+
+    def get_regions(self):
+        """Return the regions of the caption set.
+
+        :rtype: dict
+        """
+        return self._dict(self._caption_set[1])
+
+    def get_languages(self):
+        """Return the languages of the caption set, in their order.
+
+        :rtype: list
+        """
+        return list(self._languages)
+
+    def caption_count(self, lang):
+        """Return the number of captions in a language.
+
+        :rtype: int
+        """
+        return self._languages[lang][1]
+
+    def get_caption(self, lang, index):
+        """Return one caption of a language, only decoding this caption.
+
+        :param index: the position of the caption in its list
+        :rtype: Caption
+        :raises IndexError: if there is no such caption
+        """
+        first, count, _ = self._languages[lang]
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("caption index out of range")
+        return self._caption(first + index)
+
+    def get_captions(self, lang):
+        """Return the captions of a language.
+
+        :rtype: CaptionList
+        """
+        first, count, layout = self._languages[lang]
+        return CaptionList(
+            self._captions(first, first + count), layout_info=self._layout(layout)
+        )
+
+    def to_caption_set(self):
+        """Return the whole caption set.
+
+        :rtype: CaptionSet
+        """
+        # Decoding every value in order never recurses: values only refer
+        # to the ones before them.
+        for reference in range(1, len(self._values)):
+            if self._values[reference] is _MISSING:
+                self._values[reference] = self._decode(reference)
+        return CaptionSet(
+            {lang: self.get_captions(lang) for lang in self._languages},
+            styles=self._dict(self._caption_set[0]),
+            layout_info=self.layout_info,
+            regions=self.get_regions(),
+        )
+
+    def _value(self, reference):
+        """Return a value, decoding it on first use."""
+        try:
+            value = self._values[reference]
+        except IndexError:
+            raise CaptionReadSyntaxError(
+                f"Invalid caption snapshot value: {reference}"
+            ) from None
+        if value is _MISSING:
+            value = self._values[reference] = self._decode(reference)
+        if type(value) is _Container:
+            items = [self._value(item) for item in value.references]
+            if value.tag == _DICT:
+                try:
+                    return dict(zip(items[::2], items[1::2]))
+                except TypeError as error:
+                    raise CaptionReadSyntaxError(
+                        f"Invalid caption snapshot value: {reference}"
+                    ) from error
+            return items if value.tag == _LIST else tuple(items)
+        return value
+
+    def _dict(self, reference):
+        """Return a value that must be a dict."""
+        value = self._value(reference)
+        if type(value) is not dict:
+            raise CaptionReadSyntaxError(f"Invalid caption snapshot value: {reference}")
+        return value
+
+    def _layout(self, reference):
+        """Return a value that must be a Layout or None."""
+        value = self._value(reference)
+        if value is not None and type(value) is not Layout:
+            raise CaptionReadSyntaxError(f"Invalid caption snapshot value: {reference}")
+        return value
+
+    def _decode(self, reference):
+        """Decode a value.
+
+        :raises CaptionReadSyntaxError: if the value is damaged, including
+            when it refers to itself or to a value after it
+        """
+        try:
+            return self._decode_value(reference)
+        except _DECODING_ERRORS as error:
+            raise CaptionReadSyntaxError(
+                f"Invalid caption snapshot value: {reference}"
+            ) from error
+
+    def _decode_value(self, reference):
+        start = self._value_offsets[reference - 1]
+        end = self._value_offsets[reference]
+        data = self._value_data
+        if not start < end <= len(data):
+            raise ValueError("Invalid value offsets")
+        tag = data[start]
+        if tag == _STR:
+            return str(data[start + 1 : end], "utf-8", "surrogatepass")
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _INT:
+            (number,) = _read_varints(data, start + 1, end)
+            return number >> 1 if not number & 1 else -((number + 1) >> 1)
+        if tag == _FLOAT_TAG:
+            return _FLOAT.unpack(data[start + 1 : end])[0]
+        if tag == _BYTES:
+            return bytes(data[start + 1 : end])
+        if tag == _ENUM:
+            return _ENUMS[data[start + 1]][str(data[start + 2 : end], "ascii")]
+
+        if tag == _GEOMETRY:
+            cls = _GEOMETRIES[data[start + 1]]
+            fields = _read_varints(data, start + 2, end)
+            if len(fields) != len(cls._fields):
+                raise ValueError(f"Invalid number of {cls.__name__} fields")
+            return cls(*map(self._value, self._earlier(fields, reference)))
+        if tag in (_LIST, _TUPLE, _DICT):
+            items = _read_varints(data, start + 1, end)
+            if tag == _DICT and len(items) % 2:
+                raise ValueError("Dict without a value for its last key")
+            return _Container(tag, self._earlier(items, reference))
+        raise ValueError(f"Unknown value tag: {tag}")
+
+    @staticmethod
+    def _earlier(references, reference):
+        """Check that values only refer to the ones before them, which
+        bounds the decoding recursion.
+
+        :raises ValueError: if a reference is not before reference
+        """
+        if references and max(references) >= reference:
+            raise ValueError("Reference to a value that is not before")
+        return references
+
+    def _time(self, column, index, float_time):
+        time = column[index]
+        if float_time:
+            return _FLOAT.unpack(_INT64.pack(time))[0]
+        return time
+
+    def _caption(self, index):
+        float_time = self._float_times[index]
+        caption = object.__new__(Caption)
+        caption.start = self._time(self._starts, index, float_time & 1)
+        caption.end = self._time(self._ends, index, float_time & 2)
+        caption.nodes = self._nodes(
+            *self._check_bounds(self._first_nodes[index : index + 2])
+        )
+        caption.style = self._dict(self._styles[index])
+        caption.layout_info = self._layout(self._layouts[index])
+        caption.caption_mode = self._value(self._caption_modes[index])
+        caption.roll_up_rows = self._value(self._roll_up_rows[index])
+        return caption
+
+    def _check_bounds(self, bounds):
+        """Check that the first nodes of captions are in order, and within
+        the nodes.
+
+        :rtype: list[int]
+        """
+        bounds = bounds.tolist()
+        if any(map(int.__gt__, bounds, bounds[1:])) or bounds[-1] > len(
+            self._node_types
+        ):
+            raise CaptionReadSyntaxError("Invalid caption snapshot nodes")
+        return bounds
+
+    def _nodes(self, first, last):
+        """Return the nodes from first to last (excluded)."""
+        value, layout = self._value, self._layout
+        nodes = []
+        for type_, content, start, position, layout_reference in zip(
+            self._node_types[first:last].tolist(),
+            self._node_contents[first:last].tolist(),
+            self._node_starts[first:last].tolist(),
+            self._node_positions[first:last].tolist(),
+            self._node_layouts[first:last].tolist(),
+        ):
+            node = object.__new__(CaptionNode)
+            node.type_ = type_
+            node.content = value(content)
+            if type_ not in _NODE_TYPES or (
+                type_ == CaptionNode.TEXT and type(node.content) is not str
+            ):
+                raise CaptionReadSyntaxError("Invalid caption snapshot node")
+            node.start = value(start)
+            node.position = value(position)
+            node.layout_info = layout(layout_reference)
+            nodes.append(node)
+        return nodes
+
+    def _captions(self, first, last):
+        """Return the captions from first to last (excluded)."""
+        if last - first < 2:
+            return [self._caption(index) for index in range(first, last)]
+
+        value, dict_value, layout_value = self._value, self._dict, self._layout
+        bounds = self._check_bounds(self._first_nodes[first : last + 1])
+        nodes = self._nodes(bounds[0], bounds[-1])
+        offset = bounds[0]
+        captions = []
+        for index, start, end, float_time, style, layout, mode, rows in zip(
+            range(first, last),
+            self._starts[first:last].tolist(),
+            self._ends[first:last].tolist(),
+            self._float_times[first:last].tolist(),
+            self._styles[first:last].tolist(),
+            self._layouts[first:last].tolist(),
+            self._caption_modes[first:last].tolist(),
+            self._roll_up_rows[first:last].tolist(),
+        ):
+            caption = object.__new__(Caption)
+            if float_time:
+                start = self._time(self._starts, index, float_time & 1)
+                end = self._time(self._ends, index, float_time & 2)
+            caption.start = start
+            caption.end = end
+            position = index - first
+            caption.nodes = nodes[
+                bounds[position] - offset : bounds[position + 1] - offset
+            ]
+            caption.style = dict_value(style)
+            caption.layout_info = layout_value(layout)
+            caption.caption_mode = value(mode)
+            caption.roll_up_rows = value(rows)
+            captions.append(caption)
+        return captions
@@ -1,7 +1,5 @@
 """SRT (SubRip) caption format reader and writer."""
 
-from copy import deepcopy
-
 from .base import BaseReader, BaseWriter, Caption, CaptionList, CaptionNode, CaptionSet
 from .exceptions import CaptionReadNoCaptions, InvalidInputError
 
@@ -33,23 +31,58 @@ class SRTReader(BaseReader):
         if not isinstance(content, str):
             raise InvalidInputError("The content is not a unicode string.")
 
-        lines = content.splitlines()
-        start_line = 0
-        captions = CaptionList()
+        captions = CaptionList(self.iter_captions(content.splitlines()))
+        caption_set = CaptionSet({lang: captions})
 
-        while start_line < len(lines):
-            if not lines[start_line].isdigit():
-                break
+        if caption_set.is_empty():
+            raise CaptionReadNoCaptions("empty caption file")
+
+        return caption_set
+
+    def iter_captions(self, stream):
+        """Parse SRT cues one at a time.
+
+        Only the cue being parsed is held in memory, so arbitrarily long
+        files can be processed from an open file object::
 
-            end_line = self._find_text_line(start_line, lines)
+            with open("event.srt", encoding="utf-8") as srt_file:
+                for caption in SRTReader().iter_captions(srt_file):
+                    ...
 
-            timing = lines[start_line + 1].split("-->")
+        :param stream: a text file object or any iterable of text lines
+        :rtype: Iterator[Caption]
+        :raises InvalidInputError: if the stream does not yield strings.
+        """
+        lines = self._iter_lines(stream)
+        number_line = next(lines, None)
+
+        while number_line is not None and number_line.isdigit():
+            timing = next(lines, "").split("-->")
             start = self._srttomicro(timing[0].strip(" \r\n"))
             end = self._srttomicro(timing[1].strip(" \r\n"))
 
-            nodes = []
+            # The cue ends at its first blank line. All the blank lines
+            # that follow, except the one right before the next cue
+            # number, belong to its text.
+            text_lines = []
+            number_line = None
+            for line in lines:
+                if line.strip() != "":
+                    text_lines.append(line)
+                    continue
+                blank_lines = [line]
+                for line in lines:
+                    if line.strip() == "":
+                        blank_lines.append(line)
+                    else:
+                        number_line = line
+                        blank_lines.pop()
+                        break
+                text_lines.extend(blank_lines)
+                break
 
-            for line in lines[start_line + 2 : end_line - 1]:
+            nodes = []
+            for line in text_lines:
                 # skip extra blank lines
                 if not nodes or line != "":
                     nodes.append(CaptionNode.create_text(line))
@@ -58,17 +91,17 @@ class SRTReader(BaseReader):
             if len(nodes):
                 # remove last line break from end of caption list
                 nodes.pop()
-                caption = Caption(start, end, nodes)
-                captions.append(caption)
-
-            start_line = end_line
-
-        caption_set = CaptionSet({lang: captions})
-
-        if caption_set.is_empty():
-            raise CaptionReadNoCaptions("empty caption file")
-
-        return caption_set
+                yield Caption(start, end, nodes)
+
+    @staticmethod
+    def _iter_lines(stream):
+        """Yield the lines of stream without their line terminators."""
+        for chunk in stream:
+            if not isinstance(chunk, str):
+                raise InvalidInputError("The content is not a unicode string.")
+            # file objects yield "line\n"; splitlines() also honours the
+            # other terminators str.splitlines() knows about.
+            yield from chunk.splitlines() or ("",)
 
     def _srttomicro(self, stamp):
         """Convert an SRT timestamp (HH:MM:SS,mmm) to microseconds."""
@@ -85,21 +118,6 @@ class SRTReader(BaseReader):
 
         return microseconds
 
-    def _find_text_line(self, start_line, lines):
-        """Find the line index where the next cue block ends (first blank)."""
-        end_line = start_line
-
-        found = False
-        while end_line < len(lines):
-            if lines[end_line].strip() == "":
-                found = True
-            elif found is True:
-                end_line -= 1
-                break
-            end_line += 1
-
-        return end_line + 1
-
 
 class SRTWriter(BaseWriter):
     """Serializes a CaptionSet to SRT format."""
@@ -110,8 +128,6 @@ class SRTWriter(BaseWriter):
         :type caption_set: CaptionSet
         :rtype: str
         """
-        caption_set = deepcopy(caption_set)
-
         srt_captions = []
 
         for lang in caption_set.get_languages():
@@ -120,57 +136,71 @@ class SRTWriter(BaseWriter):
         caption_content = "MULTI-LANGUAGE SRT\n".join(srt_captions)
         return caption_content
 
-    def _recreate_lang(self, captions):
-        """Serialize one language's captions to SRT text.
+    def write_stream(self, captions, stream):
+        """Write captions to stream as SRT, one cue at a time.
+
+        Produces the same text as ``write`` does for a single language, but
+        accepts any iterable of captions (e.g. ``SRTReader.iter_captions``)
+        and never holds more than one cue in memory.
 
-        Merges consecutive captions with identical timestamps (libass and
-        similar players render duplicates in reverse order otherwise).
+        :param captions: an iterable of Caption objects, in display order
+        :param stream: a writable text file object
+        :returns: the number of cues written
+        :rtype: int
         """
+        count = 0
+        for count, caption in enumerate(self._merge_same_timing(captions), 1):
+            if count > 1:
+                stream.write("\n")
+            stream.write(self._recreate_cue(count, caption))
+        return count
 
-        merged_captions = [captions[0]] if captions else []
+    def _recreate_lang(self, captions):
+        """Serialize one language's captions to SRT text."""
+        return "\n".join(
+            self._recreate_cue(count, caption)
+            for count, caption in enumerate(self._merge_same_timing(captions), 1)
+        )
+
+    @staticmethod
+    def _merge_same_timing(captions):
+        """Merge consecutive captions with identical timestamps.
+
+        libass and similar players render duplicates in reverse order
+        otherwise.
+        """
+        pending = None
 
-        for caption in captions[1:]:
-            # Merge if the timestamp is the same as last caption
-            if (caption.start, caption.end) == (
-                merged_captions[-1].start,
-                merged_captions[-1].end,
-            ):
-                merged_captions[-1] = Caption(
+        for caption in captions:
+            if pending is None:
+                pending = caption
+            elif (caption.start, caption.end) == (pending.start, pending.end):
+                pending = Caption(
                     start=caption.start,
                     end=caption.end,
-                    nodes=(
-                        merged_captions[-1].nodes
-                        + [CaptionNode.create_break()]
-                        + caption.nodes
-                    ),
+                    nodes=pending.nodes + [CaptionNode.create_break()] + caption.nodes,
                 )
             else:
-                # Different timestamp, end of merging, append new caption
-                merged_captions.append(caption)
-        captions = merged_captions
-
-        srt = ""
-        count = 1
-
-        for caption in captions:
-            srt += f"{count}\n"
-
-            start = caption.format_start(msec_separator=",")
-            end = caption.format_end(msec_separator=",")
+                # Different timestamp, end of merging
+                yield pending
+                pending = caption
 
-            srt += f"{start[:12]} --> {end[:12]}\n"
+        if pending is not None:
+            yield pending
 
-            new_content = ""
-            for node in caption.nodes:
-                new_content = self._recreate_line(new_content, node)
+    def _recreate_cue(self, count, caption):
+        """Serialize a single numbered cue, ending with its text's newline."""
+        start = caption.format_start(msec_separator=",")
+        end = caption.format_end(msec_separator=",")
 
-            # Eliminate excessive line breaks
-            new_content = new_content.strip()
+        new_content = ""
+        for node in caption.nodes:
+            new_content = self._recreate_line(new_content, node)
 
-            srt += f"{new_content}\n\n"
-            count += 1
+        # Eliminate excessive line breaks
+        new_content = new_content.strip()
 
-        return srt[:-1]  # remove unwanted newline at end of file
+        return f"{count}\n{start[:12]} --> {end[:12]}\n{new_content}\n"
 
     def _recreate_line(self, srt, line):
         """Append a single CaptionNode's content to the SRT output string."""
@@ -0,0 +1,160 @@
+"""Frame rates, and conversions between frames, microseconds and timecodes.
+
+A Timebase keeps its frame rate as an exact fraction, so NTSC rates such
+as 30000/1001 do not drift, and converts times with integer arithmetic.
+The readers and writers of frame based formats share it: a frame read by
+one of them is written back to the same frame by any other.
+
+The conversions only use ``+``, ``*`` and ``//``, so they work on NumPy
+integer arrays as well as on numbers.
+"""
+
+from fractions import Fraction
+
+MICROSECONDS_PER_SECOND = 1_000_000
+
+# Frame rates usually written as decimals, for the NTSC rates they stand for
+_NTSC_DECIMALS = {
+    "23.976": Fraction(24000, 1001),
+    "23.98": Fraction(24000, 1001),
+    "29.97": Fraction(30000, 1001),
+    "59.94": Fraction(60000, 1001),
+}
+
+
+class Timebase:
+    """A frame rate, in frames per second.
+
+    ::
+
+        timebase = Timebase(Fraction(30000, 1001))
+        timebase.frame_at(1_000_000)  # 29
+        timebase.microseconds_at(30)  # 1001000
+        timebase.timecode(17982, drop_frame=True)  # "00:10:00;00"
+
+    Frames are numbered from 0, the first one starting at 0 microseconds.
+    """
+
+    def __init__(self, fps):
+        """
+        :param fps: frames per second: a number, a string such as
+            ``"30000/1001"`` or ``"25"``, or a Timebase. The decimals
+            23.976 (or 23.98), 29.97 and 59.94 stand for the NTSC rates
+            24000/1001, 30000/1001 and 60000/1001.
+        :raises ValueError: if fps is not a positive frame rate
+        """
+        if isinstance(fps, Timebase):
+            fps = fps.fps
+        elif isinstance(fps, (float, str)):
+            text = str(fps).strip()
+            try:
+                fps = _NTSC_DECIMALS.get(text) or Fraction(text)
+            except (ValueError, ZeroDivisionError):
+                raise ValueError(f"Invalid frame rate: {text}")
+        else:
+            fps = Fraction(fps)
+        if fps <= 0:
+            raise ValueError(f"Invalid frame rate: {fps}")
+
+        self.fps = fps
+        # A frame lasts _scale / _rate microseconds
+        self._scale = MICROSECONDS_PER_SECOND * fps.denominator
+        self._rate = fps.numerator
+
+    def __eq__(self, other):
+        return isinstance(other, Timebase) and self.fps == other.fps
+
+    def __hash__(self):
+        return hash(self.fps)
+
+    def __repr__(self):
+        return f"<Timebase {self.fps} fps>"
+
+    def microseconds_at(self, frame):
+        """Return the start of a frame, rounded to the nearest microsecond
+        (halves up).
+
+        :param frame: a frame number
+        :rtype: int
+        """
+        return (2 * frame * self._scale + self._rate) // (2 * self._rate)
+
+    def frame_at(self, microseconds):
+        """Return the frame shown at a time.
+
+        The start of the frame is rounded like ``microseconds_at`` does, so
+        ``frame_at(microseconds_at(frame)) == frame`` for every frame.
+
+        :param microseconds: a time, which may be a float
+        :rtype: int
+        """
+        if isinstance(microseconds, float):
+            microseconds = Fraction(microseconds)
+        # The last frame whose rounded start is not after the time, that is
+        # the last frame starting before microseconds + 1/2.
+        return -((-(2 * microseconds + 1) * self._rate) // (2 * self._scale)) - 1
+
+    def nearest_frame(self, microseconds):
+        """Return the frame starting closest to a time (halves up).
+
+        :param microseconds: a time, which may be a float
+        :rtype: int
+        """
+        if isinstance(microseconds, float):
+            microseconds = Fraction(microseconds)
+        return (2 * microseconds * self._rate + self._scale) // (2 * self._scale)
+
+    def snap(self, microseconds):
+        """Return the start of the frame closest to a time.
+
+        :param microseconds: a time, which may be a float
+        :rtype: int
+        """
+        if isinstance(microseconds, float):
+            microseconds = Fraction(microseconds)
+        # nearest_frame then microseconds_at, inlined as times are snapped in
+        # bulk
+        scale, rate = self._scale, self._rate
+        frame = (2 * microseconds * rate + scale) // (2 * scale)
+        return (2 * frame * scale + rate) // (2 * rate)
+
+    def timecode(self, frame, drop_frame=False):
+        """Return the SMPTE timecode of a frame.
+
+        Timecodes count frames at the nominal rate, e.g. 30 a second at
+        29.97 fps. Drop-frame timecodes (``HH:MM:SS;FF``) skip the first
+        frame numbers of every minute but each tenth, so they keep up with
+        the clock at NTSC rates.
+
+        :param frame: a frame number, not negative
+        :param drop_frame: whether to write a drop-frame timecode
+        :rtype: str
+        :raises ValueError: if drop_frame is set and the rate is not
+            30000/1001 or 60000/1001
+        """
+        nominal = -(-self._rate // self.fps.denominator)
+        separator = ":"
+        if drop_frame:
+            if self.fps.denominator != 1001 or nominal % 30:
+                raise ValueError(f"No drop-frame timecode at {self.fps} fps")
+            dropped = nominal // 15
+            per_minute = nominal * 60 - dropped
+            per_ten_minutes = nominal * 600 - 9 * dropped
+            tens, remainder = divmod(frame, per_ten_minutes)
+            frame += 9 * dropped * tens
+            if remainder >= dropped:
+                frame += dropped * ((remainder - dropped) // per_minute)
+            separator = ";"
+
+        seconds, frames = divmod(frame, nominal)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02}:{minutes:02}:{seconds:02}{separator}{frames:02}"
+
+
+FPS_23_976 = Timebase(Fraction(24000, 1001))
+FPS_24 = Timebase(24)
+FPS_25 = Timebase(25)
+FPS_29_97 = Timebase(Fraction(30000, 1001))
+FPS_30 = Timebase(30)
+FPS_59_94 = Timebase(Fraction(60000, 1001))
@@ -0,0 +1,252 @@
+"""Bulk changes to the times of a caption list.
+
+CaptionTimings copies the start and end times of a caption list into two
+columns of integer microseconds: NumPy arrays when NumPy is installed,
+``array('q')`` otherwise. Every operation then changes all the times at
+once, and ``apply`` writes them back to the captions in a single pass.
+"""
+
+from array import array
+from bisect import bisect_right
+
+from .timebase import Timebase
+
+try:
+    import numpy
+except ModuleNotFoundError:  # NumPy is optional
+    numpy = None
+
+
+class CaptionTimings:
+    """The times of a caption list, changed in bulk.
+
+    ::
+
+        timings = CaptionTimings(caption_set.get_captions("en-US"))
+        timings.skew(Fraction(24000, 25025)).shift(-2_000_000).clip(start=0)
+        timings.clamp_overlaps().snap_to_frames(25).apply()
+
+    The operations return the CaptionTimings, so they can be chained. The
+    list is only changed by ``apply``.
+    """
+
+    def __init__(self, captions, use_numpy=None):
+        """
+        :param captions: the CaptionList of captions to change
+        :param use_numpy: whether to work on NumPy arrays, by default when
+            NumPy is installed
+        :raises ModuleNotFoundError: if use_numpy is set and NumPy is not
+            installed
+        """
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise ModuleNotFoundError("Missing Dependency: You must install numpy")
+        self.captions = captions
+        self._numpy = use_numpy
+
+        starts = [caption.start for caption in captions]
+        ends = [caption.end for caption in captions]
+        column = self._numpy_column if use_numpy else self._array_column
+        self.starts = column(starts)
+        self.ends = column(ends)
+        if use_numpy:
+            self._kept = numpy.ones(len(starts), dtype=bool)
+        else:
+            self._kept = bytearray(b"\x01") * len(starts)
+
+    @staticmethod
+    def _numpy_column(times):
+        """Return times rounded to the microsecond, as a NumPy array."""
+        column = numpy.array(times)
+        if column.dtype == numpy.int64:
+            return column
+        return numpy.rint(column.astype(numpy.float64)).astype(numpy.int64)
+
+    @staticmethod
+    def _array_column(times):
+        """Return times rounded to the microsecond, as an array('q')."""
+        try:
+            return array("q", times)
+        except TypeError:  # Not only integers
+            return array("q", [round(time) for time in times])
+
+    def shift(self, offset):
+        """Add offset to every time.
+
+        :param offset: microseconds, rounded to the nearest integer
+        :rtype: CaptionTimings
+        """
+        offset = round(offset)
+        if self._numpy:
+            self.starts += offset
+            self.ends += offset
+        else:
+            self.starts = array("q", [time + offset for time in self.starts])
+            self.ends = array("q", [time + offset for time in self.ends])
+        return self
+
+    def skew(self, rate):
+        """Multiply every time by rate, e.g. ``Fraction(25000, 23976)`` to
+        convert captions timed for 23.976 fps to 25 fps.
+
+        The times are rounded to the nearest microsecond.
+
+        :param rate: a positive number
+        :rtype: CaptionTimings
+        """
+        # Both columns round the same float products
+        rate = float(rate)
+        if self._numpy:
+            self.starts = numpy.rint(self.starts * rate).astype(numpy.int64)
+            self.ends = numpy.rint(self.ends * rate).astype(numpy.int64)
+        else:
+            self.starts = array("q", [round(time * rate) for time in self.starts])
+            self.ends = array("q", [round(time * rate) for time in self.ends])
+        return self
+
+    def clip(self, start=None, end=None):
+        """Keep the captions shown in [start, end), cut to fit in it.
+
+        :param start: microseconds, or None for no lower limit
+        :param end: microseconds, or None for no upper limit
+        :rtype: CaptionTimings
+        """
+        if self._numpy:
+            if start is not None:
+                self._kept &= self.ends > start
+                self.starts = numpy.maximum(self.starts, start)
+            if end is not None:
+                self._kept &= self.starts < end
+                self.ends = numpy.minimum(self.ends, end)
+            return self
+
+        starts, ends, kept = self.starts, self.ends, self._kept
+        for index in range(len(starts)):
+            if start is not None:
+                if ends[index] <= start:
+                    kept[index] = 0
+                if starts[index] < start:
+                    starts[index] = start
+            if end is not None:
+                if starts[index] >= end:
+                    kept[index] = 0
+                if ends[index] > end:
+                    ends[index] = end
+        return self
+
+    def remove_before(self, time):
+        """Remove the captions starting before time.
+
+        :param time: microseconds
+        :rtype: CaptionTimings
+        """
+        if self._numpy:
+            self._kept &= self.starts >= time
+        else:
+            kept = bytearray(map(time.__le__, self.starts))
+            if 0 in self._kept:
+                kept = bytearray(map(min, kept, self._kept))
+            self._kept = kept
+        return self
+
+    def clamp_overlaps(self):
+        """End every caption no later than the start of the next one.
+
+        The next caption is the first to start after it: captions starting
+        at the same time, like the lines of a multi-line caption, are left
+        overlapping. Removed captions are ignored.
+
+        :rtype: CaptionTimings
+        """
+        if self._numpy:
+            starts = numpy.sort(self.starts[self._kept])
+            if not len(starts):
+                return self
+            following = numpy.searchsorted(starts, self.starts, side="right")
+            limits = numpy.where(
+                following < len(starts),
+                starts[numpy.minimum(following, len(starts) - 1)],
+                numpy.iinfo(numpy.int64).max,
+            )
+            self.ends = numpy.minimum(self.ends, limits)
+            return self
+
+        starts = sorted(start for start, kept in zip(self.starts, self._kept) if kept)
+        ends = self.ends
+        for index, start in enumerate(self.starts):
+            following = bisect_right(starts, start)
+            if following < len(starts) and ends[index] > starts[following]:
+                ends[index] = starts[following]
+        return self
+
+    def snap_to_frames(self, fps):
+        """Round every time to the nearest frame boundary (halves up).
+
+        A caption shorter than a frame may end when it starts.
+
+        :param fps: frames per second, e.g. 25, ``Fraction(30000, 1001)`` or
+            a Timebase
+        :rtype: CaptionTimings
+        """
+        timebase = Timebase(fps)
+        if self._numpy:
+            # The Timebase arithmetic is exact on integer arrays
+            self.starts = timebase.snap(self.starts)
+            self.ends = timebase.snap(self.ends)
+        else:
+            self.starts = array("q", map(timebase.snap, self.starts))
+            self.ends = array("q", map(timebase.snap, self.ends))
+        return self
+
+    def apply(self):
+        """Write the times back to the list, and take the removed captions
+        out of it.
+
+        A caption whose times changed is replaced by a copy with the new
+        times, as the Caption objects may be shared with copies of their
+        CaptionSet. The list is assigned as a whole, so that a CaptionList
+        drops its time index.
+
+        :returns: the caption list
+        """
+        captions = self.captions
+        kept = self._kept.tolist() if self._numpy else self._kept
+        result = []
+        for caption, start, end, keep in zip(
+            captions, self.starts.tolist(), self.ends.tolist(), kept
+        ):
+            if not keep:
+                continue
+            if start != caption.start or end != caption.end:
+                caption = caption._retimed(start, end)
+            result.append(caption)
+        captions[:] = result
+        return captions
+
+
+def snap_caption_set(caption_set, fps, use_numpy=None):
+    """Snap the times of every caption of a CaptionSet to a frame grid.
+
+    The captions of all the languages are snapped together, in a single
+    CaptionTimings.
+
+    :param caption_set: the CaptionSet to change
+    :param fps: frames per second, e.g. ``Fraction(24000, 1001)`` or a
+        Timebase
+    :param use_numpy: whether to work on NumPy arrays, by default when
+        NumPy is installed
+    :returns: the caption set
+    """
+    caption_lists = [
+        caption_set.get_captions(lang) for lang in caption_set.get_languages()
+    ]
+    captions = [caption for caption_list in caption_lists for caption in caption_list]
+    CaptionTimings(captions, use_numpy).snap_to_frames(fps).apply()
+    # Snapping removes no caption: the lists get back as many as they had
+    position = 0
+    for caption_list in caption_lists:
+        count = len(caption_list)
+        caption_list[:] = captions[position : position + count]
+        position += count
+    return caption_set
@@ -1,12 +1,20 @@
 """WebVTT (Web Video Text Tracks) reader and writer package.
 
 Provides :class:`WebVTTReader` for parsing WebVTT files into a
-:class:`~pycaption.base.CaptionSet`, and :class:`WebVTTWriter` for
-serializing a CaptionSet back to WebVTT format.
+:class:`~pycaption.base.CaptionSet`, :class:`WebVTTWriter` for
+serializing a CaptionSet back to WebVTT format, and
+:class:`SegmentedWebVTTWriter` for splitting it into HLS segments.
 """
 
 from .constants import microseconds
 from .reader import WebVTTReader
+from .segmented import SegmentedWebVTTWriter, WebVTTSegment
 from .writer import WebVTTWriter
 
-__all__ = ["WebVTTReader", "WebVTTWriter", "microseconds"]
+__all__ = [
+    "WebVTTReader",
+    "WebVTTWriter",
+    "SegmentedWebVTTWriter",
+    "WebVTTSegment",
+    "microseconds",
+]
@@ -103,6 +103,8 @@ class WebVTTReader(BaseReader):
     STYLE block declarations.
     """
 
+    CACHE_OPTIONS = ("ignore_timing_errors", "time_shift_microseconds")
+
     _CUE_SELECTOR = "::cue"
 
     def __init__(
@@ -181,6 +183,9 @@ class WebVTTReader(BaseReader):
     def _validate_header(lines):
         """Enforce WebVTT header requirements.
 
+        The ``X-TIMESTAMP-MAP`` header of HLS segments may follow the
+        WEBVTT line.
+
         :raises CaptionReadSyntaxError: If file is empty, doesn't start
             with WEBVTT, or is missing the blank line after the header.
         """
@@ -197,7 +202,10 @@ class WebVTTReader(BaseReader):
                 "WebVTT file must start with 'WEBVTT' on the first line."
             )
 
-        if len(lines) > 1 and lines[1] != "":
+        index = 1
+        while index < len(lines) and lines[index].startswith("X-TIMESTAMP-MAP="):
+            index += 1
+        if index < len(lines) and lines[index] != "":
             raise CaptionReadSyntaxError("Missing blank line after WebVTT header.")
 
     def _parse(self, lines):
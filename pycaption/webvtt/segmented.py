@@ -0,0 +1,151 @@
+"""Segmented WebVTT output, for HLS packaging.
+
+HLS serves the subtitles of a stream as a playlist of short WebVTT files,
+each starting with an ``X-TIMESTAMP-MAP`` header that maps the caption
+times to the MPEG-2 timestamps of the video::
+
+    writer = SegmentedWebVTTWriter(segment_duration=6, mpegts=900000)
+    for segment in writer.write_segments(caption_set):
+        upload(f"captions{segment.index}.vtt", segment.content)
+
+    # Or as files, with their media playlist
+    writer.save_segments(caption_set, "/srv/hls/captions")
+
+The captions are converted once each, in a single pass over the caption
+list. A caption shown across a segment boundary is repeated in every
+segment it overlaps, with its full times, as the HLS specification asks.
+"""
+
+import math
+import os
+from collections import namedtuple
+
+from .writer import WebVTTWriter
+
+DEFAULT_SEGMENT_DURATION = 6
+
+#: One WebVTT file of a segmented output. start and end are in
+#: microseconds, content is the complete WebVTT file.
+WebVTTSegment = namedtuple("WebVTTSegment", ["index", "start", "end", "content"])
+
+
+class SegmentedWebVTTWriter(WebVTTWriter):
+    """Writer splitting a CaptionSet into WebVTT segments of a fixed
+    duration, for HLS.
+
+    ``write()`` still returns a single WebVTT file; ``write_segments()``
+    and ``save_segments()`` return the segments.
+
+    :param segment_duration: Seconds per segment, 6 by default.
+    :param mpegts: The MPEG-2 timestamp (in 90 kHz ticks) of the time 0 of
+        the captions, written to the ``X-TIMESTAMP-MAP`` header of every
+        segment. Transport streams usually start at 900000 (10 seconds).
+    """
+
+    def __init__(
+        self, *args, segment_duration=DEFAULT_SEGMENT_DURATION, mpegts=0, **kw
+    ):
+        super().__init__(*args, **kw)
+        if segment_duration <= 0:
+            raise ValueError("segment_duration must be positive.")
+        self.segment_duration = segment_duration
+        self.mpegts = mpegts
+
+    def write_segments(self, caption_set, lang=None, duration=None):
+        """Yield the WebVTT segments of a CaptionSet, in order.
+
+        Segments are generated one at a time, so that they can be stored
+        while the next ones are written.
+
+        :param caption_set: The CaptionSet to serialize.
+        :param lang: BCP-47 language code. If None, uses the first
+            language in the set.
+        :param duration: Microseconds covered by the segments, e.g. the
+            duration of the video. By default, the end of the last caption.
+        :rtype: Iterator[WebVTTSegment]
+        """
+        header = (
+            self.HEADER[:-1]
+            + f"X-TIMESTAMP-MAP=MPEGTS:{self.mpegts},LOCAL:00:00:00.000\n\n"
+        )
+        if caption_set.is_empty():
+            captions = []
+        else:
+            caption_set, captions, blocks = self._prepare(caption_set, lang)
+            header += blocks
+        # Already sorted in general, which sorted() checks in linear time
+        captions = sorted(captions, key=lambda caption: caption.start)
+
+        if duration is None:
+            duration = max(map(_cue_end, captions), default=0)
+        segment_duration = round(self.segment_duration * 1000000)
+        count = max(1, math.ceil(duration / segment_duration))
+
+        # (end, cue) of the captions shown up to the current segment
+        shown = []
+        position = 0
+        for index in range(count):
+            start = index * segment_duration
+            end = start + segment_duration
+            if index == count - 1 and duration > start:
+                end = duration
+            shown = [cue for cue in shown if cue[0] > start]
+            while position < len(captions) and captions[position].start < end:
+                caption = captions[position]
+                position += 1
+                cue_end = _cue_end(caption)
+                if cue_end > start:
+                    shown.append((cue_end, self._convert_caption(caption_set, caption)))
+            content = header + "\n".join(cue for _, cue in shown)
+            yield WebVTTSegment(index, start, end, content)
+
+    def save_segments(
+        self,
+        caption_set,
+        directory,
+        lang=None,
+        duration=None,
+        filename="segment{index}.vtt",
+        playlist="playlist.m3u8",
+    ):
+        """Write the WebVTT segments of a CaptionSet to files, and the HLS
+        media playlist listing them.
+
+        :param directory: The directory of the files, created if missing.
+        :param filename: The name of the segment files, formatted with
+            their ``index``.
+        :param playlist: The name of the playlist file, None to not write
+            it.
+        :returns: The paths of the segment files.
+        :rtype: list[str]
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            f"#EXT-X-TARGETDURATION:{math.ceil(self.segment_duration)}",
+            "#EXT-X-MEDIA-SEQUENCE:0",
+            "#EXT-X-PLAYLIST-TYPE:VOD",
+        ]
+        for segment in self.write_segments(caption_set, lang, duration):
+            name = filename.format(index=segment.index)
+            path = os.path.join(directory, name)
+            with open(path, "w", encoding="utf-8") as segment_file:
+                segment_file.write(segment.content)
+            paths.append(path)
+            lines.append(f"#EXTINF:{(segment.end - segment.start) / 1000000:.3f},")
+            lines.append(name)
+        lines.append("#EXT-X-ENDLIST")
+
+        if playlist is not None:
+            path = os.path.join(directory, playlist)
+            with open(path, "w", encoding="utf-8") as playlist_file:
+                playlist_file.write("\n".join(lines) + "\n")
+        return paths
+
+
+def _cue_end(caption):
+    """Return the end of a caption, after its start even if it has no
+    duration, so that it is kept in the segment it starts in."""
+    return max(caption.end, caption.start + 1)
@@ -6,7 +6,6 @@ Supports lossless VTT-to-VTT round-trip via preserved positioning strings.
 """
 
 import datetime
-from copy import deepcopy
 
 from ..base import BaseWriter, CaptionNode
 from ..geometry import WritingDirectionEnum
@@ -59,7 +58,7 @@ class WebVTTWriter(BaseWriter):
         """Serialize a CaptionSet into a WebVTT string.
 
         Pipeline: header → STYLE block → REGION blocks → cues.
-        Deep-copies the caption_set to avoid mutating the caller's data.
+        Works on a copy of the caption_set to avoid mutating the caller's data.
 
         :param caption_set: The CaptionSet to serialize.
         :param lang: BCP-47 language code. If None, uses the first
@@ -71,27 +70,37 @@ class WebVTTWriter(BaseWriter):
         if caption_set.is_empty():
             return output
 
-        caption_set = deepcopy(caption_set)
+        caption_set, captions, blocks = self._prepare(caption_set, lang)
+
+        return (
+            output
+            + blocks
+            + "\n".join(
+                [self._convert_caption(caption_set, caption) for caption in captions]
+            )
+        )
+
+    def _prepare(self, caption_set, lang):
+        """Copy a non-empty CaptionSet and set the writer up to convert its
+        captions with _convert_caption.
+
+        :param lang: BCP-47 language code, or None for the first language.
+        :returns: The copy, its captions in lang, and the STYLE and REGION
+            blocks.
+        :rtype: tuple[CaptionSet, CaptionList, str]
+        """
+        caption_set = caption_set.copy()
 
         if lang is None:
             lang = caption_set.get_languages()[0]
 
         captions = caption_set.get_captions(lang)
         self._roll_up_region_map = self._inject_scroll_regions(captions, caption_set)
-
-        style_block = self._build_style_block(caption_set)
-        if style_block:
-            output += style_block
-
-        region_blocks = self._build_region_blocks(caption_set)
-        if region_blocks:
-            output += region_blocks
-
         self.global_layout = caption_set.get_layout_info(lang)
 
-        return output + "\n".join(
-            [self._convert_caption(caption_set, caption) for caption in captions]
-        )
+        blocks = self._build_style_block(caption_set)
+        blocks += self._build_region_blocks(caption_set)
+        return caption_set, captions, blocks
 
     def _timestamp(self, ts):
         """Format microseconds as a WebVTT timestamp string (HH:MM:SS.mmm).
@@ -352,7 +361,7 @@ class WebVTTWriter(BaseWriter):
         if layout.webvtt_positioning:
             return f" {layout.webvtt_positioning}"
 
-        resolved = self._resolve_layout(layout)
+        resolved = self._cached_layout("resolved", layout, self._resolve_layout)
         if resolved is None:
             return ""
 
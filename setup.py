@@ -18,6 +18,8 @@ dev_dependencies = ["pytest", "pytest-lazy-fixture"]
 
 transcript_dependencies = ["nltk==3.10.0"]
 
+timing_dependencies = ["numpy>=1.22"]
+
 setup(
     name="pycaption",
     version="2.3.0.dev1",
@@ -32,7 +34,11 @@ setup(
     },
     python_requires=">=3.10,<4.0",
     install_requires=dependencies,
-    extras_require={"dev": dev_dependencies, "transcript": transcript_dependencies},
+    extras_require={
+        "dev": dev_dependencies,
+        "transcript": transcript_dependencies,
+        "timing": timing_dependencies,
+    },
     packages=find_packages(),
     include_package_data=True,
     classifiers=[
@@ -32,6 +32,7 @@ from tests.fixtures.dfxp import (  # noqa: F401
     sample_dfxp_style_tag_with_no_xml_id_input,
     sample_dfxp_style_tag_with_no_xml_id_output,
     sample_dfxp_syntax_error,
+    sample_dfxp_to_dfxp_output,
     sample_dfxp_to_render_with_only_default_positioning_input,
     sample_dfxp_with_alternative_timing_formats,
     sample_dfxp_with_ampersand_character,
@@ -1,8 +1,20 @@
 import pytest
 
-from pycaption import CaptionReadError
-from pycaption.base import Caption, CaptionList
+from pycaption import (
+    CaptionConverter,
+    CaptionReadError,
+    DFXPReader,
+    DFXPWriter,
+    MicroDVDWriter,
+    SAMIWriter,
+    SCCWriter,
+    SRTWriter,
+    WebVTTWriter,
+)
+from pycaption.base import BaseWriter, Caption, CaptionList, CaptionNode, CaptionSet
+from pycaption.dfxp.extras import SinglePositioningDFXPWriter
 from pycaption.exceptions import CaptionReadSyntaxError
+from pycaption.geometry import Layout
 from pycaption.scc.state_machines import _PositioningTracker
 
 
@@ -29,6 +41,214 @@ class TestCaption:
     def test_format_end(self):
         assert self.caption.format_end() == "13:46:39.999"
 
+    def test_is_slotted(self):
+        assert not hasattr(self.caption, "__dict__")
+
+        with pytest.raises(AttributeError):
+            self.caption.unknown_attribute = 1
+
+    def test_caption_mode_defaults_to_none(self):
+        assert self.caption.caption_mode is None
+        assert self.caption.roll_up_rows is None
+
+    def test_copy_shares_nodes_and_keeps_caption_mode(self):
+        self.caption.caption_mode = "roll_up"
+        self.caption.roll_up_rows = 2
+
+        copy = self.caption.copy(end=5)
+
+        assert copy is not self.caption
+        assert copy.nodes is self.caption.nodes
+        assert (copy.start, copy.end) == (0, 5)
+        assert self.caption.end == 999999999999
+        assert (copy.caption_mode, copy.roll_up_rows) == ("roll_up", 2)
+
+    def test_copy_rejects_unknown_attributes(self):
+        with pytest.raises(TypeError):
+            self.caption.copy(unknown_attribute=1)
+
+
+class TestCaptionNode:
+    def test_is_slotted(self):
+        node = CaptionNode.create_text("text")
+
+        assert not hasattr(node, "__dict__")
+        assert node.content == "text"
+        assert node.position is None
+
+    def test_copy(self):
+        node = CaptionNode.create_style(True, {"italics": True})
+
+        copy = node.copy(layout_info="My Layout")
+
+        assert copy.type_ == CaptionNode.STYLE
+        assert copy.content is node.content
+        assert copy.start is True
+        assert copy.layout_info == "My Layout"
+        assert node.layout_info is None
+
+
+class TestCaptionSet:
+    def test_copy_is_copy_on_write(self):
+        caption = Caption(0, 1, [CaptionNode.create_text("text")])
+        captions = CaptionList([caption], layout_info="My Layout")
+        caption_set = CaptionSet(
+            {"en": captions},
+            styles={"p": {"color": "red"}},
+            regions={"r1": {"lines": "3"}},
+        )
+
+        copy = caption_set.copy()
+        copy.set_captions("fr", CaptionList())
+        copy.add_style("span", {})
+        copy.get_regions()["r1"]["scroll"] = "up"
+        copy.get_captions("en").append(caption)
+
+        assert caption_set.get_languages() == ["en"]
+        assert caption_set.get_captions("en") == [caption]
+        assert copy.get_captions("en")[0] is caption
+        assert copy.get_layout_info("en") == "My Layout"
+        assert caption_set.get_styles() == [("p", {"color": "red"})]
+        assert caption_set.get_regions() == {"r1": {"lines": "3"}}
+
+
+@pytest.mark.parametrize(
+    "writer",
+    [
+        DFXPWriter(video_width=640, video_height=360),
+        SinglePositioningDFXPWriter(),
+        MicroDVDWriter(),
+        SAMIWriter(video_width=640, video_height=360),
+        SCCWriter(),
+        SRTWriter(),
+        WebVTTWriter(video_width=640, video_height=360),
+    ],
+)
+def test_writers_do_not_modify_the_caption_set(writer, sample_dfxp_with_positioning):
+    caption_set = DFXPReader().read(sample_dfxp_with_positioning)
+    captions = caption_set.get_captions("en-US")
+    before = [
+        (caption, caption.layout_info, [node.layout_info for node in caption.nodes])
+        for caption in captions
+    ]
+    styles = caption_set.get_styles()
+
+    writer.write(caption_set)
+
+    after = [
+        (caption, caption.layout_info, [node.layout_info for node in caption.nodes])
+        for caption in caption_set.get_captions("en-US")
+    ]
+    assert len(after) == len(before)
+    for (caption, layout, node_layouts), (new_caption, new_layout, new_nodes) in zip(
+        before, after
+    ):
+        assert new_caption is caption
+        assert new_layout is layout
+        assert all(a is b for a, b in zip(node_layouts, new_nodes))
+    assert caption_set.get_styles() == styles
+
+
+class TestCaptionConverter:
+    @staticmethod
+    def _writers():
+        return [
+            DFXPWriter(video_width=640, video_height=360),
+            SAMIWriter(video_width=640, video_height=360),
+            DFXPWriter(video_width=640, video_height=360, serializer="text"),
+            SinglePositioningDFXPWriter(video_width=640, video_height=360),
+            SAMIWriter(video_width=1280, video_height=720),
+            WebVTTWriter(video_width=640, video_height=360),
+            SRTWriter(),
+        ]
+
+    @pytest.mark.parametrize("threads", [False, True])
+    def test_write_all(self, sample_dfxp_with_positioning, threads):
+        caption_set = DFXPReader().read(sample_dfxp_with_positioning)
+        converter = CaptionConverter(caption_set)
+        expected = [converter.write(writer) for writer in self._writers()]
+
+        assert converter.write_all(self._writers(), threads=threads) == expected
+
+        named = dict(zip("abcdefg", self._writers()))
+        assert converter.write_all(named, threads=threads) == dict(
+            zip("abcdefg", expected)
+        )
+
+    def test_write_all_relativizes_once_per_settings(
+        self, sample_dfxp_with_positioning, monkeypatch
+    ):
+        calls = []
+        relativize = BaseWriter._relativize_caption_list
+
+        def counting_relativize(writer, captions):
+            calls.append((writer.video_width, writer.video_height))
+            return relativize(writer, captions)
+
+        monkeypatch.setattr(BaseWriter, "_relativize_caption_list", counting_relativize)
+        caption_set = DFXPReader().read(sample_dfxp_with_positioning)
+        writers = [
+            DFXPWriter(video_width=640, video_height=360),
+            SAMIWriter(video_width=640, video_height=360),
+            SAMIWriter(video_width=1280, video_height=720),
+        ]
+
+        CaptionConverter(caption_set).write_all(writers)
+
+        assert calls == [(640, 360), (1280, 720)]
+        assert all(writer._shared_results is None for writer in writers)
+
+    def test_threads_need_distinct_writers(self, sample_dfxp_with_positioning):
+        converter = CaptionConverter(DFXPReader().read(sample_dfxp_with_positioning))
+        writer = SRTWriter()
+
+        with pytest.raises(ValueError):
+            converter.write_all([writer, writer], threads=True)
+
+        assert converter.write_all([writer, writer]) == [converter.write(writer)] * 2
+
+
+class TestBaseWriter:
+    def _count_relativizations(self, monkeypatch):
+        calls = []
+        as_percentage_of = Layout.as_percentage_of
+
+        def counting_as_percentage_of(layout, video_width, video_height):
+            calls.append(layout)
+            return as_percentage_of(layout, video_width, video_height)
+
+        monkeypatch.setattr(Layout, "as_percentage_of", counting_as_percentage_of)
+        return calls
+
+    @pytest.mark.parametrize("writer_class", [DFXPWriter, SAMIWriter, WebVTTWriter])
+    def test_layouts_are_relativized_once(
+        self, sample_dfxp_with_positioning, monkeypatch, writer_class
+    ):
+        caption_set = DFXPReader().read(sample_dfxp_with_positioning)
+        expected = writer_class(video_width=640, video_height=360).write(caption_set)
+        calls = self._count_relativizations(monkeypatch)
+        writer = writer_class(video_width=640, video_height=360)
+
+        assert writer.write(caption_set) == expected
+        assert len(calls) == len(set(calls))
+
+        calls.clear()
+        writer.write(caption_set)
+        assert not calls
+
+        writer.video_width = 1280
+        writer.write(caption_set)
+        assert calls
+
+    def test_layout_cache_is_bounded(self, sample_dfxp_with_positioning):
+        caption_set = DFXPReader().read(sample_dfxp_with_positioning)
+        expected = DFXPWriter(video_width=640, video_height=360).write(caption_set)
+        writer = DFXPWriter(video_width=640, video_height=360)
+        writer.LAYOUT_CACHE_SIZE = 2
+
+        assert writer.write(caption_set) == expected
+        assert len(writer._layout_cache) == 2
+
 
 class TestCaptionList:
     def setup_method(self):
@@ -74,6 +294,56 @@ class TestCaptionList:
             newcaps = self.caps + CaptionList([4], layout_info="Other Layout")
 
 
+class TestCaptionListIndex:
+    def setup_method(self):
+        self.captions = [
+            Caption(start, end, [CaptionNode.create_text(f"{start}-{end}")])
+            for start, end in [(0, 10), (5, 100), (10, 20), (30, 30), (40, 50)]
+        ]
+        self.caps = CaptionList(self.captions, layout_info="My Layout")
+
+    def _times(self, captions):
+        assert isinstance(captions, CaptionList)
+        assert captions.layout_info == "My Layout"
+        return [(caption.start, caption.end) for caption in captions]
+
+    def test_at(self):
+        assert self._times(self.caps.at(10)) == [(5, 100), (10, 20)]
+        assert self._times(self.caps.at(30)) == [(5, 100)]
+        assert self._times(self.caps.at(100)) == []
+        assert self._times(self.caps.at(-1)) == []
+
+    def test_between(self):
+        assert self._times(self.caps.between(20, 40)) == [(5, 100), (30, 30)]
+        assert self._times(self.caps.between(50, 200)) == [(5, 100)]
+        assert self._times(self.caps.between(20, 20)) == []
+
+    def test_overlapping(self):
+        assert self._times(self.caps.overlapping(self.captions[2])) == [(5, 100)]
+        assert self._times(self.caps.overlapping(self.captions[1])) == [
+            (0, 10),
+            (10, 20),
+            (30, 30),
+            (40, 50),
+        ]
+
+    def test_index_follows_changes(self):
+        assert self._times(self.caps.at(45)) == [(5, 100), (40, 50)]
+
+        self.caps.append(Caption(45, 60, [CaptionNode.create_text("new")]))
+        assert self._times(self.caps.at(45)) == [(5, 100), (40, 50), (45, 60)]
+
+        del self.caps[1]
+        assert self._times(self.caps.at(45)) == [(40, 50), (45, 60)]
+
+        self.caps.sort(key=lambda caption: -caption.start)
+        assert self._times(self.caps.at(45)) == [(45, 60), (40, 50)]
+
+        self.caps[0].end = 46
+        self.caps[0] = self.caps[0]
+        assert self._times(self.caps.at(46)) == [(40, 50)]
+
+
 class TestPositioningTracker:
     def test_single_row_jump_creates_one_break(self):
         tracker = _PositioningTracker((1, 0))
@@ -0,0 +1,192 @@
+import json
+import time
+
+import pytest
+
+from pycaption import SRTReader, SRTWriter, WebVTTReader, WebVTTWriter
+from pycaption.__main__ import main
+from pycaption.batch import (
+    BatchConverter,
+    ConversionJob,
+    _time_limit,
+    convert_files,
+    load_manifest,
+)
+from pycaption.cache import ConversionCache, DirectoryCache
+from pycaption.exceptions import ConversionTimeoutError
+
+
+@pytest.fixture
+def input_files(tmp_path, sample_srt, sample_webvtt):
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    paths = []
+    for name, content in (
+        ("first.srt", sample_srt),
+        ("second.vtt", sample_webvtt),
+        ("unknown.txt", "Not a caption file"),
+        ("third.srt", sample_srt),
+    ):
+        path = input_dir / name
+        path.write_text(content, encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+class TestBatchConverter:
+    def test_convert_files(self, tmp_path, input_files, sample_srt, sample_webvtt):
+        output_dir = tmp_path / "out"
+        jobs = [
+            ConversionJob(path, ["srt", "vtt"], str(output_dir)) for path in input_files
+        ]
+
+        results = convert_files(jobs, workers=1)
+
+        assert [result.index for result in results] == [0, 1, 2, 3]
+        assert [result.ok for result in results] == [True, True, False, True]
+        assert [result.reader for result in results] == [
+            "SRTReader",
+            "WebVTTReader",
+            None,
+            "SRTReader",
+        ]
+        assert results[0].outputs == {
+            "srt": str(output_dir / "first.srt"),
+            "vtt": str(output_dir / "first.vtt"),
+        }
+        assert (output_dir / "first.vtt").read_text() == WebVTTWriter().write(
+            SRTReader().read(sample_srt)
+        )
+        assert (output_dir / "second.srt").read_text() == SRTWriter().write(
+            WebVTTReader().read(sample_webvtt)
+        )
+        assert results[2].error_type == "ValueError"
+        assert results[2].error == "Unknown caption format"
+        assert results[2].outputs == {}
+        assert not (output_dir / "unknown.srt").exists()
+
+    def test_process_pool_gives_the_same_results(self, tmp_path, input_files):
+        def run(output_dir, **options):
+            jobs = [
+                ConversionJob(path, ["vtt", "dfxp"], output_dir) for path in input_files
+            ]
+            results = BatchConverter(**options).run(jobs)
+            return (
+                [(r.index, r.reader, r.error_type) for r in results],
+                sorted(
+                    (path.name, path.read_text())
+                    for path in (tmp_path / output_dir).iterdir()
+                ),
+            )
+
+        serial = run(str(tmp_path / "serial"), workers=1)
+        pooled = run(str(tmp_path / "pooled"), workers=2, chunk_size=3)
+
+        assert serial == pooled
+
+    def test_cache(self, tmp_path, input_files):
+        cache = ConversionCache(DirectoryCache(tmp_path / "cache"))
+        jobs = [
+            ConversionJob(path, ["srt", "vtt"], str(tmp_path)) for path in input_files
+        ]
+
+        BatchConverter(workers=2, cache=cache).run(jobs)
+        outputs = sorted((path.name, path.read_text()) for path in tmp_path.glob("*.*"))
+        results = BatchConverter(workers=1, cache=cache).run(jobs)
+
+        assert [result.ok for result in results] == [True, True, False, True]
+        assert (cache.hits, cache.misses) == (6, 0)
+        assert outputs == sorted(
+            (path.name, path.read_text()) for path in tmp_path.glob("*.*")
+        )
+
+    def test_output_collisions_are_rejected(self, tmp_path, input_files):
+        jobs = [
+            ConversionJob(input_files[0], ["vtt"], str(tmp_path)),
+            ConversionJob(input_files[0], ["dfxp", "vtt"], str(tmp_path)),
+        ]
+        with pytest.raises(ValueError, match="would both be written"):
+            BatchConverter(workers=1).run(jobs)
+
+        with pytest.raises(ValueError, match="would overwrite"):
+            BatchConverter(workers=1).run([ConversionJob(input_files[0], ["srt"])])
+
+    def test_unknown_format(self, input_files):
+        with pytest.raises(ValueError, match="Unknown output format"):
+            ConversionJob(input_files[0], ["srt", "ass"])
+
+    def test_time_limit(self):
+        with pytest.raises(ConversionTimeoutError):
+            with _time_limit(0.05):
+                time.sleep(1)
+
+    def test_load_manifest(self, tmp_path, input_files):
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(
+            json.dumps(
+                [
+                    {"input": "in/first.srt", "formats": ["vtt"]},
+                    {"input": "in/second.vtt", "formats": "srt", "output_dir": "out"},
+                ]
+            )
+        )
+
+        jobs = load_manifest(str(manifest))
+
+        assert [job.input_path for job in jobs] == input_files[:2]
+        assert [job.formats for job in jobs] == [("vtt",), ("srt",)]
+        assert jobs[1].output_paths() == {"srt": str(tmp_path / "out" / "second.srt")}
+
+    def test_malformed_manifest(self, tmp_path):
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps([{"formats": ["vtt"]}]))
+
+        with pytest.raises(ValueError, match="need an 'input'"):
+            load_manifest(str(manifest))
+
+
+class TestCommandLine:
+    def test_main(self, tmp_path, input_files, capsys):
+        output_dir = tmp_path / "out"
+
+        status = main(["-f", "vtt", "-o", str(output_dir), "-j", "1", *input_files])
+
+        lines = capsys.readouterr().out.splitlines()
+        assert status == 1
+        assert lines[0] == f"ok     {input_files[0]} -> {output_dir / 'first.vtt'}"
+        assert lines[2] == (
+            f"error  {input_files[2]}: ValueError: Unknown caption format"
+        )
+        assert len(lines) == 4
+
+    def test_json_report(self, tmp_path, input_files, capsys):
+        status = main(["-f", "srt", "-o", str(tmp_path), "--json", input_files[1]])
+
+        report = json.loads(capsys.readouterr().out)
+        assert status == 0
+        assert report == [
+            {
+                "index": 0,
+                "input_path": input_files[1],
+                "reader": "WebVTTReader",
+                "outputs": {"srt": str(tmp_path / "second.srt")},
+                "error_type": None,
+                "error": None,
+            }
+        ]
+
+    def test_cache_dir(self, tmp_path, input_files, capsys):
+        cache_dir = tmp_path / "cache"
+        argv = ["-f", "vtt", "-o", str(tmp_path), "--cache-dir", str(cache_dir)]
+
+        main([*argv, *input_files[:2]])
+        first = capsys.readouterr().out
+        main([*argv, *input_files[:2]])
+
+        assert capsys.readouterr().out == first
+        # The caption set and the output of both files
+        assert len(list(cache_dir.glob("*/*"))) == 4
+
+    def test_formats_are_required(self, input_files):
+        with pytest.raises(SystemExit):
+            main(input_files)
@@ -0,0 +1,213 @@
+import os
+import pickle
+
+import pytest
+
+from pycaption import (
+    CaptionConverter,
+    ConversionCache,
+    DFXPWriter,
+    DirectoryCache,
+    MemoryCache,
+    SCCReader,
+    SCCWriter,
+    SRTReader,
+    SRTWriter,
+    WebVTTReader,
+    WebVTTWriter,
+)
+from pycaption.exceptions import CaptionReadNoCaptions
+
+
+class CountingSRTReader(SRTReader):
+    reads = 0
+
+    def read(self, content, lang="en-US"):
+        CountingSRTReader.reads += 1
+        return super().read(content, lang=lang)
+
+
+@pytest.fixture
+def counting_reader():
+    CountingSRTReader.reads = 0
+    return CountingSRTReader()
+
+
+class TestConversionCache:
+    def test_convert(self, counting_reader, sample_srt):
+        cache = ConversionCache()
+
+        first = cache.convert(sample_srt, counting_reader, WebVTTWriter())
+        second = cache.convert(sample_srt, counting_reader, WebVTTWriter())
+
+        assert first == second == WebVTTWriter().write(SRTReader().read(sample_srt))
+        assert CountingSRTReader.reads == 1
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_caption_set_is_parsed_once_for_every_format(
+        self, counting_reader, sample_srt
+    ):
+        cache = ConversionCache()
+
+        cache.convert(sample_srt, counting_reader, WebVTTWriter())
+        srt = cache.convert(sample_srt, counting_reader, SRTWriter())
+
+        assert srt == SRTWriter().write(SRTReader().read(sample_srt))
+        assert CountingSRTReader.reads == 1
+
+    def test_without_snapshots(self, counting_reader, sample_srt):
+        cache = ConversionCache(snapshots=False)
+
+        cache.convert(sample_srt, counting_reader, WebVTTWriter())
+        cache.convert(sample_srt, counting_reader, SRTWriter())
+
+        assert CountingSRTReader.reads == 2
+        assert len(cache.backend) == 2
+
+    def test_options_are_part_of_the_key(self, sample_scc_pop_on):
+        cache = ConversionCache()
+        caption_set = SCCReader().read(sample_scc_pop_on)
+
+        non_drop_frame = cache.convert(sample_scc_pop_on, SCCReader(), SCCWriter())
+        drop_frame = cache.convert(
+            sample_scc_pop_on, SCCReader(), SCCWriter(drop_frame=True)
+        )
+        offset = cache.convert(
+            sample_scc_pop_on, SCCReader(), SCCWriter(), offset=10_000_000
+        )
+
+        assert non_drop_frame == SCCWriter().write(caption_set)
+        assert drop_frame == SCCWriter(drop_frame=True).write(caption_set)
+        assert offset == SCCWriter().write(
+            SCCReader().read(sample_scc_pop_on, offset=10_000_000)
+        )
+        assert len({non_drop_frame, drop_frame, offset}) == 3
+        assert cache.hits == 1
+
+    def test_webvtt_reader_options_are_part_of_the_key(self, sample_webvtt):
+        cache = ConversionCache()
+
+        cache.convert(sample_webvtt, WebVTTReader(), SRTWriter())
+        shifted = cache.convert(
+            sample_webvtt, WebVTTReader(time_shift_milliseconds=5000), SRTWriter()
+        )
+
+        assert shifted == SRTWriter().write(
+            WebVTTReader(time_shift_milliseconds=5000).read(sample_webvtt)
+        )
+        assert cache.hits == 0
+
+    def test_read_returns_a_new_caption_set(self, sample_srt):
+        cache = ConversionCache()
+
+        cache.read(sample_srt, SRTReader()).get_captions("en-US").pop()
+        captions = cache.read(sample_srt, SRTReader()).get_captions("en-US")
+
+        assert len(captions) == len(SRTReader().read(sample_srt).get_captions("en-US"))
+        assert cache.hits == 1
+
+    def test_errors_are_not_cached(self):
+        cache = ConversionCache()
+
+        for _ in range(2):
+            with pytest.raises(CaptionReadNoCaptions):
+                cache.convert("", SRTReader(), SRTWriter())
+        assert len(cache.backend) == 0
+
+    def test_caption_converter(self, counting_reader, sample_srt):
+        cache = ConversionCache()
+        expected = CaptionConverter().read(sample_srt, SRTReader())
+        expected = expected.write_all([WebVTTWriter(), SRTWriter()])
+
+        for _ in range(2):
+            converter = CaptionConverter(cache=cache).read(sample_srt, counting_reader)
+            outputs = converter.write_all([WebVTTWriter(), SRTWriter()], threads=True)
+            assert outputs == expected
+
+        assert CountingSRTReader.reads == 1
+        assert cache.hits == 2
+        assert converter.captions.get_languages() == ["en-US"]
+        assert CountingSRTReader.reads == 1
+
+    def test_caption_converter_with_other_captions(self, sample_srt):
+        converter = CaptionConverter(cache=ConversionCache())
+        converter.read(sample_srt, SRTReader())
+        converter.captions = SRTReader().read(sample_srt, lang="fr")
+
+        assert converter.captions.get_languages() == ["fr"]
+        assert 'xml:lang="fr"' in converter.write(DFXPWriter())
+
+
+class TestMemoryCache:
+    def test_least_recently_used_values_are_dropped(self):
+        cache = MemoryCache(max_size=10)
+        cache.set("a", b"1234")
+        cache.set("b", b"1234")
+        cache.get("a")
+        cache.set("c", b"1234")
+
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == (
+            b"1234",
+            None,
+            b"1234",
+        )
+        assert cache.size == 8
+
+    def test_values_larger_than_the_cache(self):
+        cache = MemoryCache(max_size=2)
+        cache.set("a", b"123")
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_a_copy_starts_empty(self):
+        cache = MemoryCache(max_size=10)
+        cache.set("a", b"1")
+
+        copy = pickle.loads(pickle.dumps(cache))
+
+        assert (len(copy), copy.max_size) == (0, 10)
+
+
+class TestDirectoryCache:
+    def test_values_are_shared_by_the_instances(self, tmp_path):
+        DirectoryCache(tmp_path).set("abcdef", b"value")
+
+        assert DirectoryCache(tmp_path).get("abcdef") == b"value"
+        assert DirectoryCache(tmp_path).get("abcdeg") is None
+
+    def test_values_are_read_when_they_cannot_be_touched(self, tmp_path, monkeypatch):
+        cache = DirectoryCache(tmp_path)
+        cache.set("abcdef", b"value")
+
+        def utime(path):
+            raise PermissionError(path)
+
+        monkeypatch.setattr(os, "utime", utime)
+
+        assert cache.get("abcdef") == b"value"
+
+    def test_least_recently_used_values_are_dropped(self, tmp_path):
+        cache = DirectoryCache(tmp_path, max_size=100)
+        for index, key in enumerate(("aa1", "bb2", "cc3")):
+            cache.set(key, b"x" * 30)
+            # Files written in a row may get the same time
+            os.utime(tmp_path / key[:2] / key, (index, index))
+
+        cache.get("aa1")
+        cache.set("dd4", b"x" * 30)
+
+        assert [cache.get(key) for key in ("aa1", "bb2", "cc3", "dd4")] == [
+            b"x" * 30,
+            None,
+            b"x" * 30,
+            b"x" * 30,
+        ]
+
+    def test_clear(self, tmp_path):
+        cache = DirectoryCache(tmp_path)
+        cache.set("abcdef", b"value")
+
+        cache.clear()
+
+        assert cache.get("abcdef") is None
@@ -1,11 +1,15 @@
+from io import StringIO
+
 import pytest
 
 from pycaption import CaptionReadNoCaptions, DFXPReader, SRTWriter
-from pycaption.base import merge_concurrent_captions
+from pycaption.base import CaptionNode, merge_concurrent_captions
+from pycaption.dfxp import StreamingDFXPReader
 from pycaption.exceptions import (
     CaptionReadError,
     CaptionReadSyntaxError,
     CaptionReadTimingError,
+    InvalidInputError,
 )
 from pycaption.geometry import (
     HorizontalAlignmentEnum,
@@ -13,8 +17,13 @@ from pycaption.geometry import (
     VerticalAlignmentEnum,
     WritingDirectionEnum,
 )
+from tests.fixtures import dfxp as dfxp_fixtures
 from tests.mixins import ReaderTestingMixIn
 
+DFXP_SAMPLES = sorted(
+    name for name in vars(dfxp_fixtures) if name.startswith("sample_dfxp")
+)
+
 
 class TestDFXPReader(ReaderTestingMixIn):
     def setup_class(self):
@@ -433,3 +442,115 @@ class TestDFXPReader(ReaderTestingMixIn):
         assert caption.layout_info.writing_direction == (
             WritingDirectionEnum.VERTICAL_RL
         )
+
+
+def _snapshot(caption_set):
+    """Everything a reader sets on a CaptionSet, in comparable form."""
+    snapshot = {"styles": sorted(caption_set.get_styles())}
+    for lang in caption_set.get_languages():
+        captions = caption_set.get_captions(lang)
+        snapshot[lang] = captions.layout_info, [
+            (
+                caption.start,
+                caption.end,
+                caption.style,
+                caption.layout_info,
+                [
+                    tuple(getattr(node, name) for name in CaptionNode.__slots__)
+                    for node in caption.nodes
+                ],
+            )
+            for caption in captions
+        ]
+    return snapshot
+
+
+class TestStreamingDFXPReader:
+    @pytest.mark.parametrize("read_invalid_positioning", [False, True])
+    @pytest.mark.parametrize("sample_name", DFXP_SAMPLES)
+    def test_same_caption_set_as_dfxp_reader(
+        self, request, sample_name, read_invalid_positioning
+    ):
+        content = request.getfixturevalue(sample_name)
+        reader = StreamingDFXPReader(
+            recover=True, read_invalid_positioning=read_invalid_positioning
+        )
+        try:
+            expected = DFXPReader(
+                read_invalid_positioning=read_invalid_positioning
+            ).read(content)
+        except CaptionReadError as err:
+            with pytest.raises(type(err)):
+                reader.read(content)
+        else:
+            assert _snapshot(reader.read(content)) == _snapshot(expected)
+
+    def test_strict_mode_reads_well_formed_xml(self, sample_dfxp_with_positioning):
+        expected = DFXPReader().read(sample_dfxp_with_positioning)
+        caption_set = StreamingDFXPReader().read(sample_dfxp_with_positioning)
+
+        assert _snapshot(caption_set) == _snapshot(expected)
+
+    def test_strict_mode_rejects_malformed_xml(
+        self, sample_dfxp_with_escaped_apostrophe
+    ):
+        with pytest.raises(CaptionReadSyntaxError):
+            StreamingDFXPReader().read(sample_dfxp_with_escaped_apostrophe)
+
+    def test_recover_mode_keeps_stray_markup_characters(self):
+        caption_set = StreamingDFXPReader(recover=True).read(
+            """\
+<tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml"><body><div>
+<p begin=00:00:01.000 end="00:00:02.000" end="00:00:03.000">
+a < b & c&eacute; &unknown;</p>
+</div></body></tt>"""
+        )
+        caption = caption_set.get_captions("en")[0]
+
+        assert caption.end == 3000000
+        assert caption.get_text() == "a < b & c\xe9 &unknown;"
+
+    @pytest.mark.parametrize("recover", [False, True])
+    def test_read_stream_in_small_chunks(self, sample_dfxp_output, recover):
+        reader = StreamingDFXPReader(recover=recover)
+        reader.CHUNK_SIZE = 7
+        expected = DFXPReader().read(sample_dfxp_output)
+
+        caption_set = reader.read_stream(StringIO(sample_dfxp_output))
+
+        assert _snapshot(caption_set) == _snapshot(expected)
+
+    def test_iter_captions(self, sample_dfxp):
+        expected = DFXPReader().read(sample_dfxp).get_captions("en-US")
+
+        captions = list(StreamingDFXPReader().iter_captions(StringIO(sample_dfxp)))
+
+        assert [lang for lang, _ in captions] == ["en-US"] * len(expected)
+        assert [caption.get_text() for _, caption in captions] == [
+            caption.get_text() for caption in expected
+        ]
+
+    def test_later_div_replaces_earlier_div_with_same_language(self):
+        content = """\
+<tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml"><body>
+<div><p begin="1s" end="2s">outer<br/></p>
+ <div><p begin="3s" end="4s">inner</p></div>
+</div>
+<div xml:lang="fr"><p begin="5s" end="6s">french</p></div>
+</body></tt>"""
+        expected = DFXPReader().read(content)
+
+        caption_set = StreamingDFXPReader().read(content)
+
+        assert _snapshot(caption_set) == _snapshot(expected)
+        assert len(caption_set.get_captions("en")) == 1
+
+    def test_invalid_input(self):
+        with pytest.raises(InvalidInputError):
+            StreamingDFXPReader().read(b"<tt/>")
+        with pytest.raises(InvalidInputError):
+            StreamingDFXPReader().read_stream([b"<tt/>"])
+
+    def test_empty_file(self, sample_dfxp_empty):
+        with pytest.raises(CaptionReadNoCaptions):
+            StreamingDFXPReader().read(sample_dfxp_empty)
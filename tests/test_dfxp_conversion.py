@@ -1,4 +1,6 @@
+import pytest
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from pycaption import (
     DFXPReader,
@@ -14,7 +16,7 @@ from pycaption.dfxp.constants import (
     DFXP_DEFAULT_STYLE,
     DFXP_DEFAULT_STYLE_ID,
 )
-from pycaption.dfxp.extras import LegacyDFXPWriter
+from pycaption.dfxp.extras import LegacyDFXPWriter, SinglePositioningDFXPWriter
 from pycaption.dfxp.writer import _convert_layout_to_attributes, _recreate_style
 
 from .mixins import DFXPTestingMixIn, MicroDVDTestingMixIn, WebVTTTestingMixIn
@@ -158,6 +160,85 @@ class TestDFXPtoDFXP(DFXPTestingMixIn):
         assert '&lt;&lt; "Andy\'s Café &amp; Restaurant" this way' in result
 
 
+def _parse_without_whitespace(xml):
+    root = etree.fromstring(xml.encode("utf-8"))
+    for element in root.iter():
+        element.text = (element.text or "").strip() or None
+        element.tail = (element.tail or "").strip() or None
+    return etree.tostring(root, method="c14n")
+
+
+class TestDFXPTextSerializer:
+    @pytest.mark.parametrize("writer_class", [DFXPWriter, SinglePositioningDFXPWriter])
+    @pytest.mark.parametrize("write_inline_positioning", [False, True])
+    @pytest.mark.parametrize(
+        "sample_name",
+        [
+            "sample_dfxp",
+            "sample_dfxp_empty_cue",
+            "sample_dfxp_multiple_regions_input",
+            "sample_dfxp_with_nested_spans",
+            "sample_dfxp_with_positioning",
+            "sample_dfxp_invalid_but_supported_positioning_input",
+        ],
+    )
+    def test_same_output_as_tree_serializer(
+        self, request, sample_name, write_inline_positioning, writer_class
+    ):
+        caption_set = DFXPReader(read_invalid_positioning=True).read(
+            request.getfixturevalue(sample_name)
+        )
+        options = {
+            "write_inline_positioning": write_inline_positioning,
+            "video_width": VIDEO_WIDTH,
+            "video_height": VIDEO_HEIGHT,
+        }
+        expected = writer_class(**options).write(caption_set)
+
+        result = writer_class(serializer="text", **options).write(caption_set)
+
+        assert result == expected
+
+    def test_same_output_for_a_forced_language(self, sample_dfxp):
+        caption_set = DFXPReader().read(sample_dfxp)
+        expected = DFXPWriter().write(caption_set, force="en-US")
+
+        result = DFXPWriter(serializer="text").write(caption_set, force="en-US")
+
+        assert result == expected
+
+    def test_compact_output_is_equivalent(self, sample_dfxp_with_positioning):
+        caption_set = DFXPReader().read(sample_dfxp_with_positioning)
+        expected = DFXPWriter(video_width=VIDEO_WIDTH, video_height=VIDEO_HEIGHT)
+
+        result = DFXPWriter(
+            serializer="text",
+            pretty_print=False,
+            video_width=VIDEO_WIDTH,
+            video_height=VIDEO_HEIGHT,
+        ).write(caption_set)
+
+        assert "\n <" not in result
+        assert _parse_without_whitespace(result) == _parse_without_whitespace(
+            expected.write(caption_set)
+        )
+
+    def test_attribute_values_are_escaped(self, sample_dfxp):
+        caption_set = DFXPReader().read(sample_dfxp)
+        caption_set.set_styles({"p": {"font-family": 'Say "Cheese" & Co'}})
+
+        result = DFXPWriter(serializer="text").write(caption_set)
+
+        style = etree.fromstring(result.encode("utf-8")).find(".//{*}style")
+        assert style.get("{http://www.w3.org/ns/ttml#styling}fontFamily") == (
+            'Say "Cheese" & Co'
+        )
+
+    def test_unknown_serializer(self):
+        with pytest.raises(ValueError):
+            DFXPWriter(serializer="dom")
+
+
 class TestDFXPtoWebVTT(WebVTTTestingMixIn):
     def test_conversion(self, sample_webvtt_from_dfxp, sample_dfxp):
         caption_set = DFXPReader().read(sample_dfxp)
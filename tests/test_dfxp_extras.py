@@ -1,5 +1,3 @@
-from copy import deepcopy
-
 from bs4 import BeautifulSoup
 
 from pycaption.dfxp import (
@@ -99,10 +97,12 @@ class TestSinglePositioningDFXPWRiter:
             sample_dfxp_to_render_with_only_default_positioning_input
         )
 
-        # it's easier to copy this than create a new one
-        new_region = deepcopy(DFXP_DEFAULT_REGION)
-        new_region.alignment.horizontal = HorizontalAlignmentEnum.LEFT
-        new_region.alignment.vertical = VerticalAlignmentEnum.TOP
+        new_region = Layout(
+            alignment=Alignment(
+                HorizontalAlignmentEnum.LEFT, VerticalAlignmentEnum.TOP
+            ),
+            inherit_from=DFXP_DEFAULT_REGION,
+        )
 
         dfxp = SinglePositioningDFXPWriter(new_region).write(caption_set)
 
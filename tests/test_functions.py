@@ -1,7 +1,23 @@
+import subprocess
+import sys
+
+import pytest
 from bs4 import BeautifulSoup
 
-from pycaption import DFXPReader
+import pycaption
+from pycaption import (
+    DFXPReader,
+    MicroDVDReader,
+    SAMIReader,
+    SCCReader,
+    SRTReader,
+    WebVTTReader,
+    detect_format,
+    sniff_format,
+)
 from pycaption.base import merge_concurrent_captions
+from pycaption.detection import CERTAIN, LIKELY, POSSIBLE, SNIFF_SIZE
+from pycaption.exceptions import CaptionReadNoCaptions, InvalidInputError
 from pycaption.utils import is_leaf
 
 
@@ -31,3 +47,87 @@ class TestIsLeaf:
         soup = BeautifulSoup("<p>x</p>", "html.parser")
 
         assert not is_leaf(soup.p)
+
+
+class TestSniffFormat:
+    @pytest.mark.parametrize(
+        "sample, reader, confidence",
+        [
+            (pytest.lazy_fixture("sample_dfxp"), DFXPReader, CERTAIN),
+            (pytest.lazy_fixture("sample_microdvd"), MicroDVDReader, LIKELY),
+            (pytest.lazy_fixture("sample_webvtt"), WebVTTReader, CERTAIN),
+            (pytest.lazy_fixture("sample_sami"), SAMIReader, LIKELY),
+            (pytest.lazy_fixture("sample_srt"), SRTReader, LIKELY),
+            (pytest.lazy_fixture("sample_scc_pop_on"), SCCReader, CERTAIN),
+        ],
+    )
+    def test_sniff_format(self, sample, reader, confidence):
+        assert sniff_format(sample) == (reader, confidence)
+        assert reader().detect(sample) is True
+        assert detect_format(sample) is reader
+
+    def test_only_the_beginning_is_inspected(self, sample_srt):
+        content = "x" * SNIFF_SIZE + "\n<SAMI>"
+
+        assert SAMIReader().detect(content) is True
+        assert sniff_format(content) == (None, 0.0)
+        assert sniff_format(content, size=len(content)) == (SAMIReader, LIKELY)
+        assert detect_format(sample_srt + content) is SRTReader
+
+    def test_closing_tt_is_found_at_the_end(self, sample_dfxp):
+        body_start = sample_dfxp.index("<body")
+        padding = "<!-- padding -->" * SNIFF_SIZE
+        content = sample_dfxp[:body_start] + padding + sample_dfxp[body_start:]
+
+        assert sniff_format(content) == (DFXPReader, CERTAIN)
+
+    def test_truncated_dfxp_is_only_possible(self, sample_dfxp):
+        content = sample_dfxp[: sample_dfxp.index("</tt>")]
+
+        assert sniff_format(content) == (DFXPReader, POSSIBLE)
+        assert detect_format(content) is None
+
+    def test_signature_wins_over_structure(self, sample_scc_pop_on):
+        content = sample_scc_pop_on + "\n<sami>\n"
+
+        assert SAMIReader().detect(content) is True
+        assert detect_format(content) is SCCReader
+
+    def test_single_line_content(self):
+        assert sniff_format("1") == (None, 0.0)
+        assert detect_format("1") is None
+
+    def test_empty_content(self):
+        assert sniff_format("") == (None, 0.0)
+        with pytest.raises(CaptionReadNoCaptions):
+            detect_format("")
+
+    def test_only_supports_unicode_input(self):
+        with pytest.raises(InvalidInputError):
+            sniff_format(b"WEBVTT")
+
+
+class TestLazyImports:
+    def test_heavy_backends_are_not_imported(self):
+        script = (
+            "import sys; from pycaption import SRTReader, WebVTTWriter, detect_format; "
+            "detect_format('WEBVTT\\n'); "
+            "print(sorted({'bs4', 'lxml', 'cssutils', 'numpy'} & set(sys.modules)))"
+        )
+
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, check=True, text=True
+        ).stdout
+
+        assert output.strip() == "[]"
+
+    def test_public_names_are_importable(self):
+        for name in pycaption.__all__:
+            assert name in dir(pycaption)
+            assert getattr(pycaption, name) is not None
+        assert pycaption.SUPPORTED_READERS[0] is DFXPReader
+        assert pycaption.CaptionTimings is pycaption.timing.CaptionTimings
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError):
+            pycaption.NoSuchReader
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 from pycaption import CaptionReadSyntaxError
@@ -147,6 +150,49 @@ class TestSize:
         assert exc_info.value.args[0].startswith(f"Invalid size: {string}.")
 
 
+class TestInterning:
+    def _layout(self, x=10):
+        return Layout(
+            origin=Point(Size(x, UnitEnum.PERCENT), Size(80, UnitEnum.PERCENT)),
+            padding=Padding(),
+            alignment=Alignment(
+                HorizontalAlignmentEnum.LEFT, VerticalAlignmentEnum.TOP
+            ),
+        )
+
+    def test_equal_objects_are_shared(self):
+        layout = self._layout()
+
+        assert self._layout() is layout
+        assert self._layout(x=20) is not layout
+        assert Size(10, UnitEnum.PERCENT) is layout.origin.x
+        assert Padding(before=Size(0, UnitEnum.PERCENT)) is layout.padding
+
+    def test_inherited_layout_is_shared(self):
+        layout = self._layout()
+
+        assert Layout(inherit_from=layout) is layout
+        assert Layout(webvtt_positioning="line:0", inherit_from=layout) == layout
+        assert Layout(webvtt_positioning="line:0", inherit_from=layout) is not layout
+
+    def test_objects_are_immutable(self):
+        size = Size(10, UnitEnum.PERCENT)
+
+        with pytest.raises(AttributeError):
+            size.value = 20
+        with pytest.raises(AttributeError):
+            del self._layout().origin
+
+        assert size.value == 10
+
+    def test_copies_are_the_same_object(self):
+        layout = self._layout()
+
+        assert copy.copy(layout) is layout
+        assert copy.deepcopy(layout) is layout
+        assert pickle.loads(pickle.dumps(layout)) is layout
+
+
 class TestAlignmentFromHorizontalAndVertical:
     @pytest.mark.parametrize(
         "text_align, expected",
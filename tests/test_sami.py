@@ -1,12 +1,29 @@
 from copy import deepcopy
+from io import StringIO
 
 import pytest
 
-from pycaption import CaptionReadNoCaptions, CaptionReadSyntaxError, SAMIReader
-from pycaption.exceptions import CaptionReadTimingError
+from pycaption import (
+    CaptionReadNoCaptions,
+    CaptionReadSyntaxError,
+    SAMIReader,
+    StreamingSAMIReader,
+)
+from pycaption.base import CaptionNode
+from pycaption.exceptions import (
+    CaptionReadError,
+    CaptionReadTimingError,
+    InvalidInputError,
+)
 from pycaption.geometry import HorizontalAlignmentEnum, Size, UnitEnum  # noqa
+from pycaption.sami.parser import SAMIParser
+from tests.fixtures import sami as sami_fixtures
 from tests.mixins import ReaderTestingMixIn
 
+SAMI_SAMPLES = sorted(
+    name for name in vars(sami_fixtures) if name.startswith("sample_sami")
+)
+
 
 class TestSAMIReader(ReaderTestingMixIn):
     def setup_method(self):
@@ -177,3 +194,93 @@ class TestSAMIReader(ReaderTestingMixIn):
 
         assert paragraph_1.start == paragraph_2.start
         assert paragraph_1.end == paragraph_2.end
+
+
+class TestSAMIParser:
+    @pytest.mark.parametrize("chunk_size", [1, 5, 64])
+    def test_chunks_give_the_same_result(self, sample_sami_with_multi_lang, chunk_size):
+        # Markup fixed by the parser is split across chunks too
+        sami = sample_sami_with_multi_lang.replace("Butterfly.", "<i/>Butter;>fly.</i>")
+        parser = SAMIParser()
+        for index in range(0, len(sami), chunk_size):
+            parser.feed_chunk(sami[index : index + chunk_size])
+
+        assert parser.finish() == SAMIParser().feed(sami)
+
+    def test_rejected_markers_across_chunks(self):
+        parser = SAMIParser()
+        parser.feed_chunk("<SAMI>no closed capt")
+        with pytest.raises(CaptionReadSyntaxError):
+            parser.feed_chunk("ioning available</SAMI>")
+
+
+def _snapshot(caption_set):
+    """Everything a reader sets on a CaptionSet, in comparable form."""
+    snapshot = {
+        "styles": sorted(caption_set.get_styles()),
+        "layout": caption_set.layout_info,
+    }
+    for lang in caption_set.get_languages():
+        captions = caption_set.get_captions(lang)
+        snapshot[lang] = captions.layout_info, [
+            (
+                caption.start,
+                caption.end,
+                caption.style,
+                caption.layout_info,
+                [
+                    tuple(getattr(node, name) for name in CaptionNode.__slots__)
+                    for node in caption.nodes
+                ],
+            )
+            for caption in captions
+        ]
+    return snapshot
+
+
+class TestStreamingSAMIReader:
+    @pytest.mark.parametrize("sample_name", SAMI_SAMPLES)
+    def test_same_caption_set_as_sami_reader(self, request, sample_name):
+        content = request.getfixturevalue(sample_name)
+        try:
+            expected = SAMIReader().read(content)
+        except CaptionReadError as err:
+            with pytest.raises(type(err)):
+                StreamingSAMIReader().read(content)
+        else:
+            caption_set = StreamingSAMIReader().read(content)
+            assert _snapshot(caption_set) == _snapshot(expected)
+
+    def test_languages_match_like_lang_selectors(self):
+        # "en" also holds the en-US captions, "english" matches no language
+        content = """<SAMI><HEAD><STYLE TYPE="text/css"><!--
+.ENUSCC {lang: en-US;}
+.ENCC {lang: en; margin-top: 5%;}
+--></STYLE></HEAD><BODY>
+<SYNC Start=100><P Class=ENUSCC>Hello <i>there</i> &amp;amp; you</P>
+<SYNC Start=200><P Class=ENCC>Short</P><P lang="fr-FR">Bonjour</P>
+<SYNC Start=300><P lang="english">Unread</P>
+</BODY></SAMI>"""
+        expected = SAMIReader().read(content)
+
+        caption_set = StreamingSAMIReader().read(content)
+
+        assert _snapshot(caption_set) == _snapshot(expected)
+        assert caption_set.get_languages() == ["en", "en-US", "fr"]
+        assert len(caption_set.get_captions("en")) == 2
+        assert caption_set.get_captions("en-US")[0].get_text() == "Hello there & you"
+
+    def test_read_stream_in_small_chunks(self, sample_sami_with_multi_lang):
+        reader = StreamingSAMIReader()
+        reader.CHUNK_SIZE = 7
+        expected = SAMIReader().read(sample_sami_with_multi_lang)
+
+        caption_set = reader.read_stream(StringIO(sample_sami_with_multi_lang))
+
+        assert _snapshot(caption_set) == _snapshot(expected)
+
+    def test_invalid_input(self):
+        with pytest.raises(InvalidInputError):
+            StreamingSAMIReader().read(b"<SAMI></SAMI>")
+        with pytest.raises(InvalidInputError):
+            StreamingSAMIReader().read_stream([b"<SAMI></SAMI>"])
@@ -1,4 +1,7 @@
+from bs4 import BeautifulSoup
+
 from pycaption import DFXPReader, SAMIReader, SAMIWriter, SRTReader, WebVTTReader
+from pycaption.base import Caption, CaptionNode, CaptionSet
 
 from .mixins import SAMITestingMixIn
 
@@ -199,3 +202,53 @@ class TestWebVTTtoSAMIStyles(SAMITestingMixIn):
         assert ".blue" in result
         assert 'class="red"' in result
         assert 'class="blue"' in result
+
+
+class TestSAMIWriterSyncs:
+    @staticmethod
+    def _captions(times_and_texts):
+        return [
+            Caption(start * 1000, (start + 500) * 1000, [CaptionNode.create_text(text)])
+            for start, text in times_and_texts
+        ]
+
+    @staticmethod
+    def _syncs(result):
+        return [
+            (sync["start"], [p.get_text(strip=True) for p in sync.find_all("p")])
+            for sync in BeautifulSoup(result, "html.parser").find_all("sync")
+        ]
+
+    def test_other_languages_share_or_insert_syncs(self):
+        caption_set = CaptionSet(
+            {
+                "en": self._captions([(1000, "one"), (3000, "three")]),
+                "fr": self._captions(
+                    [(0, "zero"), (1000, "un"), (2000, "deux"), (4000, "quatre")]
+                ),
+            }
+        )
+
+        assert self._syncs(SAMIWriter().write(caption_set)) == [
+            ("0", ["zero"]),
+            ("500", [""]),
+            ("1000", ["one", "un"]),
+            ("1500", ["", ""]),
+            ("2000", ["deux"]),
+            ("2500", [""]),
+            ("3000", ["three"]),
+            ("4000", ["quatre"]),
+        ]
+
+    def test_primary_language_out_of_order(self):
+        caption_set = CaptionSet(
+            {
+                "en": self._captions([(3000, "three"), (1000, "one")]),
+                "fr": self._captions([(1000, "un"), (3000, "trois")]),
+            }
+        )
+
+        syncs = dict(self._syncs(SAMIWriter().write(caption_set)))
+
+        assert syncs["1000"] == ["one", "un"]
+        assert syncs["3000"] == ["three", "trois"]
@@ -4,6 +4,16 @@ from pycaption import CaptionNode, CaptionReadNoCaptions, SCCReader
 from pycaption.exceptions import CaptionLineLengthError, CaptionReadTimingError
 from pycaption.geometry import HorizontalAlignmentEnum, UnitEnum, VerticalAlignmentEnum
 from pycaption.scc.constants import MICROSECONDS_PER_CODEWORD
+from pycaption.scc.reader import (
+    _COMMAND,
+    _DOUBLED,
+    _DOUBLED_AFTER_STARTER,
+    _EXTENDED,
+    _PAC,
+    _WORD_FLAGS,
+    _SccTimeTranslator,
+    _tokenize_words,
+)
 from pycaption.scc.specialized_collections import (
     InstructionNodeCreator,
     TimingCorrectingCaptionList,
@@ -514,22 +524,22 @@ class TestCoverageOnly:
         scc1 = SCCReader().read(sample_scc_roll_up_ru3)
         captions = scc1.get_captions("en-US")
         expected_timings = [
-            (733333.3333333333, 2766666.6666666665),
-            (2766666.6666666665, 4566666.666666666),
-            (4566666.666666666, 6133333.333333334),
-            (6133333.333333334, 9700000.0),
-            (9700000.0, 11233333.333333332),
-            (11233333.333333332, 12233333.333333332),
-            (12233333.333333332, 13233333.333333332),
-            (13233333.333333332, 14233333.333333332),
-            (14233333.333333332, 17033333.333333336),
-            (17033333.333333336, 18633333.333333332),
-            (18633333.333333332, 20200000.0),
-            (20200000.0, 21800000.0),
-            (21800000.0, 34900000.0),
-            (34900000.0, 36400000.0),
-            (36400000.0, 44266666.666666664),
-            (44266666.666666664, 44866666.666666664),
+            (733333, 2766667),
+            (2766667, 4566667),
+            (4566667, 6133333),
+            (6133333, 9700000),
+            (9700000, 11233333),
+            (11233333, 12233333),
+            (12233333, 13233333),
+            (13233333, 14233333),
+            (14233333, 17033333),
+            (17033333, 18633333),
+            (18633333, 20200000),
+            (20200000, 21800000),
+            (21800000, 34900000),
+            (34900000, 36400000),
+            (36400000, 44266667),
+            (44266667, 44866667),
         ]
 
         actual_timings = [(c_.start, c_.end) for c_ in captions]
@@ -541,13 +551,13 @@ class TestCoverageOnly:
         # remain unchanged.
         scc1 = SCCReader().read(sample_scc_pop_on)
         expected_timings = [
-            (9743066.666666664, 12278933.333333332),
-            (14748066.666666666, 16916899.999999996),
-            (16916899.999999996, 18651966.666666664),
-            (18651966.666666664, 20787433.333333332),
-            (20787433.333333332, 26659966.666666664),
-            (26659966.666666664, 32132100.000000004),
-            (32132100.000000004, 36169466.666666664),
+            (9743067, 12278933),
+            (14748067, 16916900),
+            (16916900, 18651967),
+            (18651967, 20787433),
+            (20787433, 26659967),
+            (26659967, 32132100),
+            (32132100, 36169467),
         ]
 
         actual_timings = [(c_.start, c_.end) for c_ in scc1.get_captions("en-US")]
@@ -1040,3 +1050,85 @@ class TestTimingCorrectingCaptionList:
         assert captions[0].end > captions[0].start
         assert captions[1].end > captions[1].start
         assert captions[0].end <= captions[1].start
+
+
+class TestTokenizeWords:
+    def test_pairs_each_word_with_the_next_one(self):
+        assert _tokenize_words("9420 94d0 c1c2") == (
+            ("9420", "94d0"),
+            ("94d0", "c1c2"),
+            ("c1c2", None),
+        )
+
+    def test_next_command_skips_the_error_correction_duplicate(self):
+        assert _tokenize_words("9420 9420 942f") == (
+            ("9420", "942f"),
+            ("9420", "942f"),
+            ("942f", None),
+        )
+
+    def test_ignores_words_that_are_not_four_characters(self):
+        assert _tokenize_words("9420  80 \t942f") == (
+            ("9420", ""),
+            ("942f", None),
+        )
+
+
+class TestWordFlags:
+    def test_classifies_commands_and_pacs(self):
+        assert _WORD_FLAGS["942f"] & _COMMAND
+        assert _WORD_FLAGS["9140"] & _PAC
+        assert _WORD_FLAGS["917c"] & _PAC
+        assert not _WORD_FLAGS["917c"] & _COMMAND
+        assert "c1c2" not in _WORD_FLAGS
+
+    def test_extended_chars_are_only_doubled_after_a_cue_starter(self):
+        flags = _WORD_FLAGS["92a8"]
+
+        assert flags & _EXTENDED
+        assert not flags & _DOUBLED
+        assert flags & _DOUBLED_AFTER_STARTER
+
+    def test_94a1_is_only_doubled_after_a_cue_starter(self):
+        assert not _WORD_FLAGS["94a1"] & _DOUBLED
+        assert _WORD_FLAGS["94a1"] & _DOUBLED_AFTER_STARTER
+
+
+class TestSccTimeTranslator:
+    def test_drop_frame_runs_at_wall_clock_rate(self):
+        translator = _SccTimeTranslator()
+        translator.start_at("01:00:00;15")
+
+        assert translator.get_time() == 3600500000
+
+    def test_non_drop_frame_runs_slow(self):
+        translator = _SccTimeTranslator()
+        translator.start_at("00:00:01:00")
+
+        assert translator.get_time() == 1001000
+
+    def test_frames_are_added_as_integers(self):
+        translator = _SccTimeTranslator()
+        translator.start_at("00:00:00:29")
+        for _ in range(31):
+            translator.increment_frames()
+
+        time = translator.get_time()
+
+        assert isinstance(time, int)
+        # 60 frames of non-drop-frame timecode
+        assert time == 2002000
+
+    def test_offset_is_subtracted_and_clamped(self):
+        translator = _SccTimeTranslator()
+        translator.offset = 2000000
+        translator.start_at("00:00:01;00")
+
+        assert translator.get_time() == 0
+
+    def test_invalid_timecode_is_reported_when_used(self):
+        translator = _SccTimeTranslator()
+        translator.start_at("00:00:1:00")
+
+        with pytest.raises(CaptionReadTimingError):
+            translator.get_time()
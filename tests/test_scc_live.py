@@ -0,0 +1,124 @@
+import pytest
+from pytest_lazyfixture import lazy_fixture
+
+from pycaption import LiveSCCDecoder, SCCReader
+from pycaption.exceptions import CaptionReadTimingError
+
+HELLO = "9420 9420 9470 9470 c845 4c4c 4f80 942f 942f"
+CLEAR = "942c 942c"
+
+
+def _times(captions):
+    return [(caption.start, caption.end, caption.get_text()) for caption in captions]
+
+
+def _decode(content, **kwargs):
+    decoder = LiveSCCDecoder(**kwargs)
+    captions = []
+    for line in content.splitlines():
+        captions.extend(decoder.feed_line(line))
+    return captions + decoder.close()
+
+
+class TestLiveSCCDecoder:
+    @pytest.mark.parametrize(
+        "content",
+        [
+            lazy_fixture("sample_scc_pop_on"),
+            lazy_fixture("sample_scc_multiple_positioning"),
+            lazy_fixture("sample_scc_roll_up_ru2"),
+            lazy_fixture("sample_scc_paint_on_edm"),
+            lazy_fixture("sample_scc_tab_offset"),
+        ],
+    )
+    @pytest.mark.parametrize("simulate_roll_up", [False, True])
+    def test_same_captions_as_the_reader(self, content, simulate_roll_up):
+        expected = SCCReader().read(content, simulate_roll_up=simulate_roll_up)
+        expected = expected.get_captions("en-US")
+
+        captions = _decode(content, simulate_roll_up=simulate_roll_up, latency=None)
+
+        assert _times(captions) == _times(expected)
+        assert [caption.layout_info for caption in captions] == [
+            caption.layout_info for caption in expected
+        ]
+
+    def test_captions_are_returned_once_complete(self):
+        decoder = LiveSCCDecoder()
+
+        assert decoder.feed("00:00:01;00", HELLO) == []
+        assert decoder.feed("00:00:02;00", CLEAR.split()) == []
+        captions = decoder.feed("00:00:03;00")
+
+        assert _times(captions) == [(1233333, 2000000, "HELLO")]
+        assert decoder.close() == []
+
+    @pytest.mark.parametrize(
+        "content, latency",
+        [
+            (lazy_fixture("sample_scc_tab_offset"), 1000000),
+            (lazy_fixture("sample_scc_tab_offset"), 33000),
+            (lazy_fixture("sample_scc_pop_on"), 33000),
+            (lazy_fixture("sample_scc_pop_on"), 1),
+        ],
+    )
+    def test_latency(self, content, latency):
+        expected = SCCReader().read(content).get_captions("en-US")
+
+        captions = _decode(content, latency=latency)
+
+        assert len(captions) > len(expected)
+        assert all(caption.end > caption.start for caption in captions)
+        assert sum(caption.end - caption.start for caption in captions) == sum(
+            caption.end - caption.start for caption in expected
+        )
+
+    def test_caption_on_screen_is_returned_in_pieces(self):
+        decoder = LiveSCCDecoder(latency=2000000)
+        decoder.feed("00:00:01;00", HELLO)
+
+        assert decoder.feed("00:00:02;00") == []
+        first = decoder.feed("00:00:04;00")
+        decoder.feed("00:00:07;00", CLEAR)
+        second = decoder.feed("00:00:08;00")
+
+        assert _times(first) == [(1233333, 4000000, "HELLO")]
+        assert _times(second) == [(4000000, 7000000, "HELLO")]
+
+    @pytest.mark.parametrize("latency", [1, 33000])
+    def test_cleared_caption_ends_with_the_clear(self, latency):
+        decoder = LiveSCCDecoder(latency=latency)
+        captions = decoder.feed("00:00:01;00", HELLO)
+        captions += decoder.feed("00:00:07;00", CLEAR)
+        captions += decoder.close()
+
+        assert _times(captions) == [
+            (1233333, 1300000, "HELLO"),
+            (1300000, 7000000, "HELLO"),
+        ]
+
+    def test_midnight(self):
+        decoder = LiveSCCDecoder()
+        decoder.feed("23:59:59;00", HELLO)
+        decoder.feed("00:00:01;00", CLEAR)
+
+        captions = decoder.feed("00:00:02;00")
+
+        day = 24 * 60 * 60 * 1000000
+        assert _times(captions) == [(day - 766667, day + 1000000, "HELLO")]
+
+    def test_memory_does_not_grow(self):
+        decoder = LiveSCCDecoder()
+
+        for second in range(0, 2000, 2):
+            decoder.feed(f"00:{second // 60:02}:{second % 60:02};00", HELLO)
+            decoder.feed(f"00:{second // 60:02}:{second % 60:02};15", CLEAR)
+
+        assert len(decoder._reader.caption_stash._collection) <= 1
+        assert decoder._reader.shown_until == {}
+
+    def test_invalid_timecode(self):
+        decoder = LiveSCCDecoder()
+
+        with pytest.raises(CaptionReadTimingError):
+            decoder.feed("00:00:01", HELLO)
@@ -1,4 +1,4 @@
-from pycaption.scc.translator import translate_scc
+from pycaption.scc.translator import iter_translate_scc, translate_scc
 
 
 class TestSCCTranslator:
@@ -38,3 +38,13 @@ class TestSCCTranslator:
         result = translate_scc(sample_scc_special_and_extended_characters)
 
         assert sample_translated_scc_special_and_extended_characters == result
+
+    def test_only_whole_words_are_translated(self):
+        result = translate_scc("00:00:00;00\t9420 94209420")
+
+        assert result == "00:00:00;00\t[Resume Caption Loading] 94209420"
+
+    def test_iter_translate_scc(self, sample_scc_pop_on, sample_translated_scc_success):
+        lines = iter_translate_scc(sample_scc_pop_on.splitlines(keepends=True))
+
+        assert "".join(lines) == sample_translated_scc_success
@@ -0,0 +1,208 @@
+import pytest
+
+from pycaption import (
+    DFXPReader,
+    SAMIReader,
+    SCCReader,
+    WebVTTReader,
+    dump_snapshot,
+    load_snapshot,
+    open_snapshot,
+)
+from pycaption.base import Caption, CaptionList, CaptionNode, CaptionSet
+from pycaption.exceptions import CaptionReadError, CaptionReadSyntaxError
+from pycaption.geometry import HorizontalAlignmentEnum, UnitEnum
+from pycaption.snapshot import CaptionSetSnapshot
+
+
+def _contents(caption_set):
+    """Everything a snapshot stores, as comparable values."""
+    languages = []
+    for lang in caption_set.get_languages():
+        captions = caption_set.get_captions(lang)
+        languages.append(
+            (
+                lang,
+                captions.layout_info,
+                [
+                    (
+                        (caption.start, type(caption.start)),
+                        (caption.end, type(caption.end)),
+                        caption.style,
+                        caption.layout_info,
+                        caption.caption_mode,
+                        caption.roll_up_rows,
+                        [
+                            (
+                                node.type_,
+                                node.content,
+                                node.start,
+                                node.position,
+                                node.layout_info,
+                            )
+                            for node in caption.nodes
+                        ],
+                    )
+                    for caption in captions
+                ],
+            )
+        )
+    return (
+        languages,
+        caption_set.get_styles(),
+        caption_set.get_regions(),
+        caption_set.layout_info,
+    )
+
+
+class TestSnapshot:
+    @pytest.mark.parametrize(
+        "reader, sample",
+        [
+            (DFXPReader, pytest.lazy_fixture("sample_dfxp_with_positioning")),
+            (SAMIReader, pytest.lazy_fixture("sample_sami_with_multi_lang")),
+            (SCCReader, pytest.lazy_fixture("sample_scc_multiple_positioning")),
+            (WebVTTReader, pytest.lazy_fixture("sample_webvtt_with_style_block_class")),
+        ],
+    )
+    def test_round_trip(self, reader, sample):
+        caption_set = reader().read(sample)
+
+        assert _contents(load_snapshot(dump_snapshot(caption_set))) == _contents(
+            caption_set
+        )
+
+    def test_values(self):
+        style = {
+            "classes": ["a", "b"],
+            "align": HorizontalAlignmentEnum.LEFT,
+            "size": (1.5, -0.0, -(2**70)),
+            "raw": b"\x00\xff",
+            "flag": False,
+        }
+        caption = Caption(0.5, 2**40, [CaptionNode.create_text("♪")], style=style)
+        caption.caption_mode, caption.roll_up_rows = "roll_up", 3
+        caption_set = CaptionSet({"en": CaptionList([caption])})
+
+        loaded = load_snapshot(dump_snapshot(caption_set)).get_captions("en")[0]
+
+        assert loaded.style == style
+        assert str(loaded.style["size"][1]) == "-0.0"
+        assert (loaded.start, loaded.end) == (0.5, 2**40)
+        assert (loaded.caption_mode, loaded.roll_up_rows) == ("roll_up", 3)
+
+    def test_equal_styles_are_not_shared(self):
+        captions = CaptionList(
+            [
+                Caption(start, start + 1, [CaptionNode.create_break()], style={})
+                for start in range(3)
+            ]
+        )
+
+        loaded = load_snapshot(dump_snapshot(CaptionSet({"en": captions})))
+
+        styles = [caption.style for caption in loaded.get_captions("en")]
+        styles[0]["italics"] = True
+        assert styles[1:] == [{}, {}]
+
+    def test_unsupported_value(self):
+        captions = CaptionList([Caption(0, 1, [CaptionNode.create_text({1, 2})])])
+
+        with pytest.raises(TypeError):
+            dump_snapshot(CaptionSet({"en": captions}))
+
+    def test_open_file(self, tmp_path, sample_scc_multiple_positioning):
+        caption_set = SCCReader().read(sample_scc_multiple_positioning)
+        path = tmp_path / "captions.snapshot"
+        path.write_bytes(dump_snapshot(caption_set))
+
+        with open_snapshot(path) as snapshot:
+            assert snapshot.get_languages() == ["en-US"]
+            count = snapshot.caption_count("en-US")
+            last = snapshot.get_caption("en-US", -1)
+            captions = snapshot.get_captions("en-US")
+
+        expected = caption_set.get_captions("en-US")
+        assert count == len(expected)
+        assert (last.start, last.get_text()) == (
+            expected[-1].start,
+            expected[-1].get_text(),
+        )
+        assert [caption.get_text() for caption in captions] == [
+            caption.get_text() for caption in expected
+        ]
+        assert captions[0].nodes[0].layout_info == expected[0].nodes[0].layout_info
+
+    def test_caption_index_out_of_range(self, sample_scc_multiple_positioning):
+        caption_set = SCCReader().read(sample_scc_multiple_positioning)
+
+        with CaptionSetSnapshot(dump_snapshot(caption_set)) as snapshot:
+            with pytest.raises(IndexError):
+                snapshot.get_caption("en-US", snapshot.caption_count("en-US"))
+
+    def test_layout_of_the_caption_set(self):
+        caption_set = CaptionSet(
+            {"en": CaptionList()},
+            styles={"p": {"font-size": "12px"}},
+            regions={"r1": {"width": "40%"}},
+        )
+
+        snapshot = CaptionSetSnapshot(dump_snapshot(caption_set))
+
+        assert snapshot.get_styles() == [("p", {"font-size": "12px"})]
+        assert snapshot.get_regions() == {"r1": {"width": "40%"}}
+        assert snapshot.get_captions("en") == []
+
+    @pytest.mark.parametrize(
+        "data", [b"", b"not a snapshot", b"PYCSNAP\x00\x01\x00\x11\x00\x00\x00\x00\x00"]
+    )
+    def test_invalid_snapshot(self, data):
+        with pytest.raises(CaptionReadSyntaxError):
+            load_snapshot(data)
+
+    def test_damaged_snapshot(self, sample_dfxp_with_positioning):
+        data = dump_snapshot(DFXPReader().read(sample_dfxp_with_positioning))
+
+        for position in range(len(data)):
+            for mask in (0x01, 0x80, 0xFF):
+                damaged = bytearray(data)
+                damaged[position] ^= mask
+                try:
+                    load_snapshot(damaged)
+                except CaptionReadError:
+                    pass
+            with pytest.raises(CaptionReadError):
+                load_snapshot(data[:position])
+
+    def test_value_referring_to_itself(self):
+        caption = Caption(0, 1, [CaptionNode.create_text("A")], style={"k": ["v"]})
+        data = bytearray(dump_snapshot(CaptionSet({"en": CaptionList([caption])})))
+        with CaptionSetSnapshot(bytes(data)) as snapshot:
+            offsets = snapshot._value_offsets.tolist()
+            values = bytes(snapshot._value_data)
+        reference = next(
+            reference
+            for reference in range(1, len(offsets))
+            if values[offsets[reference - 1]] == ord("l")
+        )
+        # The item of the list becomes the list itself
+        data[data.index(values) + offsets[reference - 1] + 1] = reference
+
+        with pytest.raises(CaptionReadSyntaxError):
+            load_snapshot(data)
+
+    def test_unsupported_version(self):
+        data = bytearray(dump_snapshot(CaptionSet({"en": CaptionList()})))
+        data[8] = 99
+
+        with pytest.raises(CaptionReadError, match="version"):
+            load_snapshot(data)
+
+    def test_geometry_units(self, sample_dfxp_with_positioning):
+        caption_set = DFXPReader().read(sample_dfxp_with_positioning)
+
+        loaded = load_snapshot(dump_snapshot(caption_set))
+
+        layout = loaded.get_captions("en-US")[0].layout_info
+        assert layout.origin.x.unit in UnitEnum
+        assert layout is caption_set.get_captions("en-US")[0].layout_info
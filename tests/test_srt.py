@@ -1,6 +1,9 @@
+from io import StringIO
+
 import pytest
 
 from pycaption import CaptionReadNoCaptions, SRTReader
+from pycaption.exceptions import InvalidInputError
 from tests.mixins import ReaderTestingMixIn
 
 
@@ -73,3 +76,25 @@ class TestSRTReader(ReaderTestingMixIn):
 
         assert 13000000 == first_paragraph.start
         assert 16000000 == first_paragraph.end
+
+    def test_iter_captions_matches_read(self, sample_srt_blank_lines):
+        expected = self.reader.read(sample_srt_blank_lines).get_captions("en-US")
+
+        captions = list(self.reader.iter_captions(StringIO(sample_srt_blank_lines)))
+
+        assert [(c.start, c.end, c.get_text()) for c in captions] == [
+            (c.start, c.end, c.get_text()) for c in expected
+        ]
+
+    def test_iter_captions_is_lazy(self, sample_srt):
+        lines = iter(sample_srt.splitlines(keepends=True))
+
+        first = next(self.reader.iter_captions(lines))
+
+        assert first.start == 9209000
+        # the first cue only reads up to the number line of the second one
+        assert next(lines).strip() != "2"
+
+    def test_iter_captions_rejects_bytes(self, sample_srt):
+        with pytest.raises(InvalidInputError):
+            next(self.reader.iter_captions([sample_srt.encode()]))
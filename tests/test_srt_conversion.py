@@ -1,4 +1,5 @@
 import re
+from io import StringIO
 
 from pycaption import DFXPReader, SAMIReader, SRTReader, SRTWriter, WebVTTReader
 from tests.mixins import SRTTestingMixIn
@@ -54,6 +55,17 @@ class TestSRTtoSRT(SRTTestingMixIn):
         assert 3 == len(sentences)
         assert 4 == len(sentences[0].splitlines())
 
+    def test_write_stream_matches_write(self, samples_srt_same_time):
+        caption_set = self.reader.read(samples_srt_same_time)
+        stream = StringIO()
+
+        count = self.writer.write_stream(
+            self.reader.iter_captions(StringIO(samples_srt_same_time)), stream
+        )
+
+        assert count == 3
+        assert stream.getvalue() == self.writer.write(caption_set)
+
 
 class TestWebVTTtoSRT(SRTTestingMixIn):
     def test_webvtt_to_srt_conversion(self, sample_srt, sample_webvtt):
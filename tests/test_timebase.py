@@ -0,0 +1,106 @@
+from fractions import Fraction
+
+import pytest
+
+from pycaption import MicroDVDReader, MicroDVDWriter, SCCWriter, timing
+from pycaption.timebase import FPS_23_976, FPS_25, FPS_29_97, FPS_59_94, Timebase
+
+
+class TestTimebase:
+    @pytest.mark.parametrize(
+        "fps, expected",
+        [
+            (25, Fraction(25)),
+            ("30000/1001", Fraction(30000, 1001)),
+            ("29.97", Fraction(30000, 1001)),
+            (23.976, Fraction(24000, 1001)),
+            (29.5, Fraction(59, 2)),
+            (FPS_59_94, Fraction(60000, 1001)),
+        ],
+    )
+    def test_frame_rate(self, fps, expected):
+        assert Timebase(fps).fps == expected
+
+    @pytest.mark.parametrize("fps", [0, -25, "fast", "1/0"])
+    def test_invalid_frame_rate(self, fps):
+        with pytest.raises(ValueError):
+            Timebase(fps)
+
+    def test_equality(self):
+        assert Timebase("23.976") == FPS_23_976
+        assert Timebase(25) != FPS_23_976
+        assert len({Timebase(25), FPS_25}) == 1
+
+    def test_conversions(self):
+        assert FPS_29_97.microseconds_at(1) == 33_367
+        assert FPS_29_97.microseconds_at(2) == 66_733
+        assert FPS_29_97.frame_at(33_366) == 0
+        assert FPS_29_97.frame_at(66_733) == 2
+        assert FPS_29_97.frame_at(66_732.5) == 1
+        assert FPS_29_97.nearest_frame(50_050) == 2
+        assert FPS_29_97.snap(50_049) == 33_367
+
+    @pytest.mark.parametrize("timebase", [FPS_23_976, FPS_25, FPS_29_97, FPS_59_94])
+    def test_frames_survive_conversion(self, timebase):
+        frames = range(0, 10_000_000, 997)
+
+        assert [timebase.frame_at(timebase.microseconds_at(f)) for f in frames] == list(
+            frames
+        )
+
+    @pytest.mark.skipif(timing.numpy is None, reason="needs numpy")
+    def test_numpy_arrays(self):
+        times = timing.numpy.arange(0, 5_000_000, 1234)
+
+        assert FPS_29_97.snap(times).tolist() == [
+            FPS_29_97.snap(t) for t in times.tolist()
+        ]
+
+    @pytest.mark.parametrize(
+        "frame, expected",
+        [
+            (0, "00:00:00;00"),
+            (1799, "00:00:59;29"),
+            (1800, "00:01:00;02"),
+            (17981, "00:09:59;29"),
+            (17982, "00:10:00;00"),
+            (107892, "01:00:00;00"),
+        ],
+    )
+    def test_drop_frame_timecode(self, frame, expected):
+        assert FPS_29_97.timecode(frame, drop_frame=True) == expected
+
+    def test_timecode(self):
+        assert FPS_29_97.timecode(1800) == "00:01:00:00"
+        assert FPS_25.timecode(90_061) == "01:00:02:11"
+        assert FPS_59_94.timecode(3600, drop_frame=True) == "00:01:00;04"
+
+    def test_no_drop_frame_timecode(self):
+        with pytest.raises(ValueError):
+            FPS_25.timecode(1800, drop_frame=True)
+
+
+class TestFrameBasedFormats:
+    def test_scc_writer_keeps_frames(self):
+        # Frame 2 starts at 66733.3 microseconds, read as 66733
+        times = [FPS_29_97.microseconds_at(frame) for frame in range(0, 3000, 7)]
+
+        assert [SCCWriter._format_timestamp_ndf(time) for time in times] == [
+            FPS_29_97.timecode(frame) for frame in range(0, 3000, 7)
+        ]
+        assert SCCWriter._format_timestamp_df(66_733) == "00:00:00;02"
+
+    def test_microdvd_ntsc_round_trip(self):
+        content = "{0}{0}23.976\n{1}{25}one\n{1001}{1438}two\n"
+
+        captions = MicroDVDReader().read(content, lang="en").get_captions("en")
+        times = [time for caption in captions for time in (caption.start, caption.end)]
+
+        assert times == [41_708, 1_042_708, 41_750_042, 59_976_583]
+        writer = MicroDVDWriter()
+        assert [writer._microtoframes(time, FPS_23_976) for time in times] == [
+            1,
+            25,
+            1001,
+            1438,
+        ]
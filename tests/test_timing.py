@@ -0,0 +1,159 @@
+from fractions import Fraction
+
+import pytest
+
+from pycaption import timing
+from pycaption.base import Caption, CaptionList, CaptionNode, CaptionSet
+from pycaption.timing import CaptionTimings, snap_caption_set
+
+BACKENDS = [
+    pytest.param(False, id="array"),
+    pytest.param(
+        True,
+        id="numpy",
+        marks=pytest.mark.skipif(timing.numpy is None, reason="needs numpy"),
+    ),
+]
+
+
+def _captions(*times):
+    return CaptionList(
+        [Caption(start, end, [CaptionNode.create_text("x")]) for start, end in times],
+        layout_info="My Layout",
+    )
+
+
+def _times(captions):
+    return [(caption.start, caption.end) for caption in captions]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+class TestCaptionTimings:
+    def test_shift_and_skew(self, use_numpy):
+        captions = _captions((1_000_000, 2_000_000), (2_500_000.4, 3_000_000))
+
+        CaptionTimings(captions, use_numpy).skew(1.5).shift(-250_000).apply()
+
+        assert _times(captions) == [(1_250_000, 2_750_000), (3_500_000, 4_250_000)]
+        assert all(type(caption.start) is int for caption in captions)
+
+    def test_captions_change_on_apply(self, use_numpy):
+        captions = _captions((1_000_000, 2_000_000))
+
+        timings = CaptionTimings(captions, use_numpy).shift(1_000_000)
+        assert _times(captions) == [(1_000_000, 2_000_000)]
+
+        assert timings.apply() is captions
+        assert _times(captions) == [(2_000_000, 3_000_000)]
+
+    def test_clip(self, use_numpy):
+        captions = _captions((0, 10), (5, 20), (20, 30), (25, 40), (40, 50))
+
+        CaptionTimings(captions, use_numpy).clip(start=10, end=40).apply()
+
+        assert _times(captions) == [(10, 20), (20, 30), (25, 40)]
+        assert captions.layout_info == "My Layout"
+
+    def test_remove_before(self, use_numpy):
+        captions = _captions((0, 10), (5, 20), (20, 30))
+
+        CaptionTimings(captions, use_numpy).remove_before(5).apply()
+
+        assert _times(captions) == [(5, 20), (20, 30)]
+
+    def test_clamp_overlaps(self, use_numpy):
+        captions = _captions((0, 15), (0, 12), (10, 30), (20, 25), (40, 50))
+
+        CaptionTimings(captions, use_numpy).remove_before(5).clamp_overlaps().apply()
+
+        assert _times(captions) == [(10, 20), (20, 25), (40, 50)]
+
+    @pytest.mark.parametrize(
+        "fps, expected",
+        [
+            (25, [(0, 40_000), (1_000_000, 1_040_000)]),
+            (Fraction(30000, 1001), [(0, 33_367), (1_001_000, 1_034_367)]),
+        ],
+    )
+    def test_snap_to_frames(self, use_numpy, fps, expected):
+        captions = _captions((10_000, 45_000), (1_005_000, 1_050_000))
+
+        CaptionTimings(captions, use_numpy).snap_to_frames(fps).apply()
+
+        assert _times(captions) == expected
+
+    def test_time_index_is_rebuilt(self, use_numpy):
+        captions = _captions((0, 1_000_000), (2_000_000, 3_000_000))
+        assert _times(captions.at(0)) == [(0, 1_000_000)]
+        assert _times(captions.between(0, 3_000_000)) == _times(captions)
+
+        CaptionTimings(captions, use_numpy).shift(10_000_000).apply()
+
+        assert captions.at(500_000) == []
+        assert _times(captions.at(10_500_000)) == [(10_000_000, 11_000_000)]
+        assert _times(captions.between(10_000_000, 12_500_000)) == _times(captions)
+
+    def test_captions_are_replaced_not_modified(self, use_numpy):
+        captions = _captions((0, 10), (20, 30))
+        first, second = captions
+
+        CaptionTimings(captions, use_numpy).clip(start=5).apply()
+
+        assert _times([first, second]) == [(0, 10), (20, 30)]
+        assert captions[0] is not first and captions[1] is second
+        assert captions[0].nodes is first.nodes
+
+    def test_invalid_frame_rate(self, use_numpy):
+        with pytest.raises(ValueError):
+            CaptionTimings(_captions((0, 10)), use_numpy).snap_to_frames(0)
+
+
+def test_numpy_is_optional(monkeypatch):
+    monkeypatch.setattr(timing, "numpy", None)
+
+    with pytest.raises(ModuleNotFoundError):
+        CaptionTimings(_captions((0, 10)), use_numpy=True)
+
+    captions = _captions((0, 10))
+    CaptionTimings(captions).shift(5).apply()
+    assert _times(captions) == [(5, 15)]
+
+
+def test_adjust_caption_timing():
+    caption_set = CaptionSet({"en": _captions((0, 1_000_000), (2_000_000, 3_000_000))})
+
+    caption_set.adjust_caption_timing(offset=-500_000, rate_skew=1.1)
+
+    assert _times(caption_set.get_captions("en")) == [(1_700_000, 2_800_000)]
+    assert caption_set.get_captions("en").layout_info == "My Layout"
+
+
+def test_adjust_caption_timing_of_a_copy():
+    caption_set = CaptionSet({"en": _captions((0, 1_000_000))})
+    copy = caption_set.copy()
+    assert len(caption_set.get_captions("en").at(0)) == 1
+
+    caption_set.adjust_caption_timing(offset=5_000_000)
+
+    captions = caption_set.get_captions("en")
+    assert captions.at(500_000) == []
+    assert _times(captions.at(5_500_000)) == [(5_000_000, 6_000_000)]
+    assert _times(copy.get_captions("en")) == [(0, 1_000_000)]
+    assert _times(copy.get_captions("en").at(500_000)) == [(0, 1_000_000)]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_snap_caption_set(use_numpy):
+    caption_set = CaptionSet(
+        {"en": _captions((10_000, 45_000)), "fr": _captions((1_005_000, 1_050_000))}
+    )
+
+    fr_captions = caption_set.get_captions("fr")
+    assert fr_captions.at(1_045_000)
+
+    assert snap_caption_set(caption_set, "23.976", use_numpy) is caption_set
+
+    assert caption_set.get_captions("fr") is fr_captions
+    assert fr_captions.at(1_045_000) == []
+    assert _times(caption_set.get_captions("en")) == [(0, 41_708)]
+    assert _times(caption_set.get_captions("fr")) == [(1_001_000, 1_042_708)]
@@ -895,6 +895,14 @@ class TestWebVTTInputValidation:
         captions = self.reader.read(vtt)
         assert len(captions.get_captions("en-US")) == 1
 
+    def test_header_with_timestamp_map_accepted(self):
+        vtt = (
+            "WEBVTT\nX-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000\n\n"
+            "00:00:01.000 --> 00:00:03.000\nHello\n"
+        )
+        captions = self.reader.read(vtt)
+        assert len(captions.get_captions("en-US")) == 1
+
     def test_missing_header_raises(self, sample_webvtt_no_header):
         with pytest.raises(CaptionReadSyntaxError):
             self.reader.read(sample_webvtt_no_header)
@@ -11,6 +11,7 @@ from pycaption import (
     WebVTTReader,
     WebVTTWriter,
 )
+from pycaption.geometry import Layout
 from tests.mixins import DFXPTestingMixIn, MicroDVDTestingMixIn, WebVTTTestingMixIn
 
 
@@ -381,7 +382,8 @@ class TestWebVTTWriterStyleBlocks:
         caption_set = WebVTTReader().read(vtt)
         lang = caption_set.get_languages()[0]
         captions = caption_set.get_captions(lang)
-        captions[0].layout_info.webvtt_positioning = None
+        # A Layout inherits everything but the WebVTT positioning
+        captions[0].layout_info = Layout(inherit_from=captions[0].layout_info)
 
         result = WebVTTWriter().write(caption_set)
 
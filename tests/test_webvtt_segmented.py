@@ -0,0 +1,119 @@
+import pytest
+
+from pycaption import SegmentedWebVTTWriter, SRTReader, WebVTTReader, WebVTTWriter
+from pycaption.base import Caption, CaptionList, CaptionNode, CaptionSet
+
+HEADER = "WEBVTT\nX-TIMESTAMP-MAP=MPEGTS:0,LOCAL:00:00:00.000\n\n"
+
+
+def _caption_set(*times):
+    captions = CaptionList(
+        Caption(start, end, [CaptionNode.create_text(f"{start}-{end}")])
+        for start, end in times
+    )
+    return CaptionSet({"en-US": captions})
+
+
+def _texts(segment):
+    captions = WebVTTReader().read(segment.content).get_captions("en-US")
+    return [caption.get_text() for caption in captions]
+
+
+class TestSegmentedWebVTTWriter:
+    def test_segments(self):
+        caption_set = _caption_set(
+            (1000000, 4000000), (5000000, 13000000), (14000000, 15000000)
+        )
+
+        segments = list(
+            SegmentedWebVTTWriter(segment_duration=6).write_segments(caption_set)
+        )
+
+        assert [
+            (segment.index, segment.start, segment.end) for segment in segments
+        ] == [
+            (0, 0, 6000000),
+            (1, 6000000, 12000000),
+            (2, 12000000, 15000000),
+        ]
+        assert [_texts(segment) for segment in segments] == [
+            ["1000000-4000000", "5000000-13000000"],
+            ["5000000-13000000"],
+            ["5000000-13000000", "14000000-15000000"],
+        ]
+        assert all(segment.content.startswith(HEADER) for segment in segments)
+
+    def test_spanning_cues_keep_their_times(self):
+        caption_set = _caption_set((5000000, 13000000))
+
+        segments = SegmentedWebVTTWriter(segment_duration=6).write_segments(caption_set)
+
+        cue = WebVTTWriter().write(caption_set)[len(WebVTTWriter.HEADER) :]
+        assert [segment.content for segment in segments] == [HEADER + cue] * 3
+
+    def test_boundaries(self):
+        caption_set = _caption_set((0, 6000000), (6000000, 6000000))
+
+        segments = list(
+            SegmentedWebVTTWriter(segment_duration=6).write_segments(caption_set)
+        )
+
+        assert [_texts(segment) for segment in segments] == [
+            ["0-6000000"],
+            ["6000000-6000000"],
+        ]
+
+    def test_duration_and_timestamp_map(self):
+        writer = SegmentedWebVTTWriter(segment_duration=2.5, mpegts=900000)
+
+        segments = list(
+            writer.write_segments(_caption_set((0, 1000000)), duration=6000000)
+        )
+
+        assert [(segment.start, segment.end) for segment in segments] == [
+            (0, 2500000),
+            (2500000, 5000000),
+            (5000000, 6000000),
+        ]
+        assert segments[-1].content == (
+            "WEBVTT\nX-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000\n\n"
+        )
+
+    def test_same_cues_as_the_writer(self, sample_srt):
+        caption_set = SRTReader().read(sample_srt)
+        cues = WebVTTWriter().write(caption_set)[len(WebVTTWriter.HEADER) :]
+
+        segments = SegmentedWebVTTWriter(segment_duration=1).write_segments(caption_set)
+
+        written = []
+        for segment in segments:
+            for cue in segment.content[len(HEADER) :].strip("\n").split("\n\n"):
+                if cue and cue not in written:
+                    written.append(cue)
+        assert written == cues.strip("\n").split("\n\n")
+
+    def test_save_segments(self, tmp_path):
+        caption_set = _caption_set((1000000, 8000000))
+
+        paths = SegmentedWebVTTWriter().save_segments(caption_set, tmp_path / "hls")
+
+        assert [path.rsplit("/", 1)[1] for path in paths] == [
+            "segment0.vtt",
+            "segment1.vtt",
+        ]
+        assert (tmp_path / "hls" / "playlist.m3u8").read_text() == (
+            "#EXTM3U\n"
+            "#EXT-X-VERSION:3\n"
+            "#EXT-X-TARGETDURATION:6\n"
+            "#EXT-X-MEDIA-SEQUENCE:0\n"
+            "#EXT-X-PLAYLIST-TYPE:VOD\n"
+            "#EXTINF:6.000,\n"
+            "segment0.vtt\n"
+            "#EXTINF:2.000,\n"
+            "segment1.vtt\n"
+            "#EXT-X-ENDLIST\n"
+        )
+
+    def test_invalid_segment_duration(self):
+        with pytest.raises(ValueError):
+            SegmentedWebVTTWriter(segment_duration=0)